@@ -5,20 +5,46 @@ Interactive multi-page dashboard for Job Trends & Skill-Gap Analysis
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
 from pathlib import Path
 import sys
 import os
+import time
+import uuid
+import logging
+import functools
+from contextlib import closing, contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 
-# Configuration paths - hardcoded for cloud deployment
 BASE_DIR = Path(__file__).parent.parent
-PROCESSED_DATA_DIR = BASE_DIR / "data" / "processed"
-ANALYTICS_JSON_FILE = PROCESSED_DATA_DIR / "analytics_summary.json"
-CHARTS_DIR = BASE_DIR / "outputs" / "charts"
+LOGS_DIR = BASE_DIR / "logs"
+DASHBOARD_METRICS_FILE = LOGS_DIR / "dashboard_metrics.jsonl"
+METRICS_MAX_BYTES = 5 * 1024 * 1024  # Rotate render metrics at 5 MB
+METRICS_BACKUP_COUNT = 3
+AUTO_REFRESH_SECONDS = 30  # How often Market Intelligence checks for new data
+RECOMMENDATION_CACHE_SIZE = 256  # Career recommendation results shared by all sessions
+RECOMMENDATION_CACHE_TTL = 3600
+RECOMMENDATION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SIMILAR_JOBS = 10  # Postings listed in the Data Explorer's similar jobs panel
+SIMILARITY_LSH_CANDIDATES = 1000  # Jobs from the LSH buckets rescored when the index has LSH
+SEARCH_RESULT_LIMIT = 1000  # Best keyword matches loaded into the Data Explorer
 COLOR_PALETTE = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
 
+# Shared pipeline config and helpers (data paths, snapshot history queries, career recommender,
+# similarity and keyword search); JOB_ANALYZER_DATA_DIR points the dashboard at another data directory
+sys.path.append(str(BASE_DIR / "src"))
+from config import (
+    PROCESSED_DATA_DIR, ANALYTICS_JSON_FILE, SKILL_TRENDS_JSON_FILE, SKILL_BITSETS_FILE,
+    SIMILARITY_INDEX_FILE, SEARCH_INDEX_FILE, SNAPSHOT_DB_FILE
+)
+import snapshot_store
+import search_index
+from recommender import RecommendationCache, cached_recommendations
+from skill_bitset import SkillBitsets
+from similarity_index import SimilarityIndex
+from utils import ensure_company_size_bucket, company_size_order, read_data_manifest
+
 # Page configuration
 st.set_page_config(
     page_title="Job Trends & Skill-Gap Analyzer",
@@ -239,27 +265,276 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_data():
-    """Load all processed data"""
-    # Load jobs data
+@st.cache_resource
+def get_metrics_logger():
+    """Rotating JSONL logger for render timings, shared by all sessions"""
+    LOGS_DIR.mkdir(exist_ok=True)
+    metrics_logger = logging.getLogger('dashboard_metrics')
+    metrics_logger.setLevel(logging.INFO)
+    metrics_logger.propagate = False
+    if not metrics_logger.handlers:
+        handler = RotatingFileHandler(
+            DASHBOARD_METRICS_FILE, maxBytes=METRICS_MAX_BYTES,
+            backupCount=METRICS_BACKUP_COUNT, encoding='utf-8'
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        metrics_logger.addHandler(handler)
+    return metrics_logger
+
+@st.cache_resource
+def get_recommendation_cache():
+    """Career recommendation results keyed on normalized inputs, shared by all sessions"""
+    return RecommendationCache(
+        RECOMMENDATION_CACHE_SIZE, RECOMMENDATION_CACHE_TTL, RECOMMENDATION_CACHE_MAX_BYTES
+    )
+
+@contextmanager
+def timed_block(name):
+    """Time a block of the current rerun and record it in session state"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        st.session_state.setdefault('render_timings', []).append((name, elapsed_ms))
+
+def timed_page(func):
+    """Decorator to time a page function"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed_block(f"page:{func.__name__}"):
+            return func(*args, **kwargs)
+    return wrapper
+
+def plotly_chart(fig, **kwargs):
+    """st.plotly_chart with timing (figure serialization happens here)"""
+    with timed_block("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, **kwargs)
+
+def dataframe(data, **kwargs):
+    """st.dataframe with timing (Arrow serialization happens here)"""
+    with timed_block("dataframe"):
+        st.dataframe(data, use_container_width=True, **kwargs)
+
+def debug_enabled():
+    """Render-time debug panel is on with DASHBOARD_DEBUG=1 or ?debug=1"""
+    if os.environ.get('DASHBOARD_DEBUG') == '1':
+        return True
+    query_params = getattr(st, 'query_params', None)
+    if query_params is not None:
+        return query_params.get('debug') == '1'
+    return st.experimental_get_query_params().get('debug', [''])[0] == '1'
+
+def log_render_metrics(page, rerun_start):
+    """Write this rerun's timings to the metrics file and the debug panel"""
+    total_ms = (time.perf_counter() - rerun_start) * 1000
+    timings = st.session_state.get('render_timings', [])
+    
+    # Repeated blocks (e.g. several charts) are summed per name
+    blocks = {}
+    for name, elapsed_ms in timings:
+        blocks[name] = round(blocks.get(name, 0) + elapsed_ms, 1)
+    
+    get_metrics_logger().info(json.dumps({
+        'ts': datetime.now().isoformat(timespec='milliseconds'),
+        'session': st.session_state.setdefault('metrics_session_id', uuid.uuid4().hex[:8]),
+        'page': page,
+        'total_ms': round(total_ms, 1),
+        'blocks': blocks
+    }, ensure_ascii=False))
+    
+    if debug_enabled():
+        with st.sidebar.expander("🐞 Render Timings", expanded=True):
+            st.markdown(f"**Rerun total:** {total_ms:,.0f} ms")
+            for name, elapsed_ms in sorted(blocks.items(), key=lambda x: x[1], reverse=True):
+                st.markdown(f"- `{name}`: {elapsed_ms:,.1f} ms")
+
+@st.cache_data(max_entries=2)
+def load_analytics(version):
+    """Load the analytics summary JSON (version is the cache key)"""
+    with open(ANALYTICS_JSON_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@st.cache_data(max_entries=2)
+def load_jobs(version):
+    """Load the jobs table with skills and certifications as lists (version is the cache key)"""
     jobs_file = PROCESSED_DATA_DIR / 'jobs_with_skills.csv'
     df = pd.read_csv(jobs_file)
     df['skills'] = df['skills'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
     df['certifications'] = df['certifications'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
-    
-    # Load analytics
-    with open(ANALYTICS_JSON_FILE, 'r', encoding='utf-8') as f:
-        analytics = json.load(f)
-    
-    # Load skill extractions
-    skills_file = PROCESSED_DATA_DIR / 'skills_extracted.csv'
-    skill_df = pd.read_csv(skills_file) if skills_file.exists() else None
-    
-    return df, analytics, skill_df
+    return ensure_company_size_bucket(df)
+
+@st.cache_data(max_entries=2)
+def load_skill_bitsets(version, jobs_version):
+    """Load packed per-job skill sets aligned with load_jobs(jobs_version), or None if unavailable"""
+    if version is None or not SKILL_BITSETS_FILE.exists():
+        return None
+    return SkillBitsets.load(SKILL_BITSETS_FILE).align(load_jobs(jobs_version)['job_ID'])
+
+@st.cache_resource(max_entries=2)
+def load_similarity_index(version):
+    """Load the job similarity index once for all sessions, or None if 05_build_indexes has not run"""
+    if version is None or not SIMILARITY_INDEX_FILE.exists():
+        return None
+    return SimilarityIndex.load(SIMILARITY_INDEX_FILE)
+
+@st.cache_data(max_entries=64)
+def search_jobs(version, text, filters, title_only):
+    """
+    Best keyword matches and the total match count (version is the cache key)
+    
+    Filters an index built by an older version has no column for are left to
+    the caller's pandas filters, and the total is then unknown (None).
+    """
+    with closing(search_index.connect(SEARCH_INDEX_FILE)) as conn:
+        available = search_index.available_filters(conn)
+        index_filters = {name: value for name, value in filters if name in available}
+        hits = search_index.search(conn, text, index_filters, limit=SEARCH_RESULT_LIMIT, title_only=title_only)
+        total = search_index.count(conn, text, index_filters, title_only=title_only)
+    if len(index_filters) < len(filters):
+        total = None
+    return hits, total
+
+@st.cache_data(max_entries=2)
+def load_skill_trends(version):
+    """Load precomputed skill trends, or None if the pipeline has not written them"""
+    if not SKILL_TRENDS_JSON_FILE.exists():
+        return None
+    with open(SKILL_TRENDS_JSON_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def history_version():
+    """Modification time of the snapshot store, used as the history cache key"""
+    return SNAPSHOT_DB_FILE.stat().st_mtime_ns if SNAPSHOT_DB_FILE.exists() else None
+
+@st.cache_data(max_entries=4)
+def load_history(version):
+    """Load per-run aggregates from the snapshot store (empty if none yet)"""
+    if version is None:
+        return pd.DataFrame(columns=['snapshot_date'] + snapshot_store.METRIC_COLUMNS)
+    conn = snapshot_store.connect(SNAPSHOT_DB_FILE)
+    try:
+        return snapshot_store.load_snapshots(conn)
+    finally:
+        conn.close()
+
+@st.cache_data(max_entries=16)
+def load_skill_history(version, skills, start, end):
+    """Load per-snapshot counts for the given skills in a date range"""
+    conn = snapshot_store.connect(SNAPSHOT_DB_FILE)
+    try:
+        return snapshot_store.skill_history(conn, skills, start, end)
+    finally:
+        conn.close()
+
+def history_delta(deltas, metric):
+    """Format a metric's change vs history for st.metric, or None without history"""
+    if metric not in deltas.get('deltas', {}):
+        return None
+    return f"{deltas['deltas'][metric]:+.1f}% {deltas['label']}"
+
+def read_data_version():
+    """Return the overall data version from the manifest, or None"""
+    return read_data_manifest().get('version')
+
+def artifact_version(manifest, name):
+    """Content hash of one processed artifact, used as its loader's cache key"""
+    return manifest.get('artifacts', {}).get(name, {}).get('sha256')
+
+def watch_data_version(loaded_version):
+    """Rerun the app once the on-disk data version moves past loaded_version"""
+    if read_data_version() != loaded_version:
+        st.rerun()
+
+def start_auto_refresh(loaded_version):
+    """Poll for new data without blocking the session (a fragment rerun, so the page state is kept)"""
+    st.fragment(run_every=AUTO_REFRESH_SECONDS)(watch_data_version)(loaded_version)
+
+def list_trace_files(max_runs):
+    """Return (path, mtime) pairs for the most recent pipeline run traces"""
+    if not LOGS_DIR.exists():
+        return ()
+    files = sorted(LOGS_DIR.glob('trace_*.jsonl'), key=lambda f: f.stat().st_mtime)
+    return tuple((str(f), f.stat().st_mtime) for f in files[-max_runs:])
+
+@st.cache_data
+def load_run_traces(trace_files):
+    """Load run trace records (the mtimes in trace_files act as the cache key)"""
+    records = []
+    for path, _ in trace_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # Partially written line from a running stage
+    return pd.DataFrame(records)
 
-def show_overview(df, analytics):
+def summarize_stages(traces):
+    """One row per (run, stage) with wall/CPU time, peak memory and rows/sec"""
+    functions = traces[traces['kind'] == 'function'] if 'kind' in traces.columns else traces.iloc[0:0]
+    stages = traces[traces['kind'] == 'stage'] if 'kind' in traces.columns else traces.iloc[0:0]
+    
+    # Rows processed by a stage = largest input any of its functions saw
+    rows = functions.groupby(['run_id', 'stage'])['rows_in'].max() if 'rows_in' in functions.columns else None
+    
+    parts = []
+    if not stages.empty:
+        parts.append(stages.groupby(['run_id', 'stage']).agg(
+            wall_seconds=('wall_seconds', 'sum'),
+            cpu_seconds=('cpu_seconds', 'sum'),
+            peak_rss_mb=('peak_rss_mb', 'max'),
+            ts=('ts', 'min')
+        ))
+    
+    # Older runs without stage records: add up their top-level functions
+    older = functions[~functions['run_id'].isin(stages['run_id'])]
+    if not older.empty or not parts:
+        parts.append(older[older['depth'] == 0].groupby(['run_id', 'stage']).agg(
+            wall_seconds=('wall_seconds', 'sum'),
+            cpu_seconds=('cpu_seconds', 'sum'),
+            peak_rss_mb=('rss_mb', 'max'),
+            ts=('ts', 'min')
+        ))
+    summary = pd.concat(parts) if len(parts) > 1 else parts[0]
+    
+    if rows is not None:
+        summary = summary.join(rows.rename('rows'), how='left')
+        summary['rows_per_sec'] = summary['rows'] / summary['wall_seconds']
+    
+    return summary.reset_index().sort_values(['ts', 'stage'])
+
+def detect_regressions(stage_summary, latest_run, threshold=1.25, min_seconds=0.5):
+    """Compare the latest run's stages with the median of earlier runs"""
+    history = stage_summary[stage_summary['run_id'] != latest_run]
+    latest = stage_summary[stage_summary['run_id'] == latest_run]
+    baseline = history.groupby('stage')['wall_seconds'].median()
+    
+    results = []
+    for _, row in latest.iterrows():
+        base = baseline.get(row['stage'])
+        if base is None or pd.isna(base) or base <= 0:
+            continue
+        ratio = row['wall_seconds'] / base
+        results.append({
+            'stage': row['stage'],
+            'latest': row['wall_seconds'],
+            'baseline': base,
+            'ratio': ratio,
+            'regressed': ratio > threshold and row['wall_seconds'] - base > min_seconds
+        })
+    return results
+
+@timed_page
+def show_overview(analytics):
     """Display overview/home page"""
+    import plotly.express as px
+    
+    with timed_block("load_history"):
+        deltas = snapshot_store.metric_deltas(load_history(history_version()))
+    
     st.markdown('<p class="main-header">📊 Job Trends & Skill-Gap Analyzer</p>', unsafe_allow_html=True)
     st.markdown("### Comprehensive Analysis of LinkedIn Job Market Data")
     
@@ -272,28 +547,28 @@ def show_overview(df, analytics):
         st.metric(
             "Total Job Postings",
             f"{analytics['metadata']['total_jobs']:,}",
-            delta=None
+            delta=history_delta(deltas, 'total_jobs')
         )
     
     with col2:
         st.metric(
             "Unique Companies",
             f"{analytics['companies']['total_companies']:,}",
-            delta=None
+            delta=history_delta(deltas, 'total_companies')
         )
     
     with col3:
         st.metric(
             "Unique Skills",
             f"{analytics['skills']['total_unique_skills']:,}",
-            delta=None
+            delta=history_delta(deltas, 'unique_skills')
         )
     
     with col4:
         st.metric(
             "Locations",
             f"{analytics['locations']['total_locations']:,}",
-            delta=None
+            delta=history_delta(deltas, 'total_locations')
         )
     
     st.markdown("---")
@@ -315,7 +590,7 @@ def show_overview(df, analytics):
             labels={'count': 'Number of Jobs', 'skill': 'Skill'}
         )
         fig.update_layout(height=500, showlegend=False, yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     with col2:
         st.subheader("💼 Work Type Distribution")
@@ -329,7 +604,7 @@ def show_overview(df, analytics):
         )
         fig.update_traces(textposition='inside', textinfo='percent+label')
         fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     # Top Roles
     st.markdown("---")
@@ -347,10 +622,13 @@ def show_overview(df, analytics):
         labels={'count': 'Number of Openings', 'role': 'Job Role'}
     )
     fig.update_layout(height=600, showlegend=False, yaxis={'categoryorder':'total ascending'})
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
 
-def show_skills_explorer(df, analytics, skill_df):
+@timed_page
+def show_skills_explorer(analytics):
     """Display skills analysis page"""
+    import plotly.graph_objects as go
+    
     st.markdown('<p class="main-header">🔍 Skills Explorer</p>', unsafe_allow_html=True)
     
     # Skills metrics
@@ -396,7 +674,7 @@ def show_skills_explorer(df, analytics, skill_df):
         yaxis={'categoryorder':'total ascending'}
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     # Skills table
     st.markdown("---")
@@ -410,7 +688,7 @@ def show_skills_explorer(df, analytics, skill_df):
         'percentage': 'Percentage'
     })
     
-    st.dataframe(skills_table, use_container_width=True, hide_index=True)
+    dataframe(skills_table, hide_index=True)
     
     # Download button
     csv = skills_table.to_csv(index=False)
@@ -420,9 +698,31 @@ def show_skills_explorer(df, analytics, skill_df):
         file_name="top_skills.csv",
         mime="text/csv"
     )
+    
+    # Skill pairs (written by 03_role_stats from the packed skill sets)
+    cooccurrence = analytics.get('skill_cooccurrence')
+    if cooccurrence and cooccurrence['pairs']:
+        st.markdown("---")
+        st.subheader("🔗 Skills Often Required Together")
+        st.caption(f"Among the {cooccurrence['skills_analyzed']} most demanded skills. "
+                   "Lift above 1 means the pair appears together more often than chance.")
+        
+        pairs_table = pd.DataFrame([
+            {
+                'Skill Pair': ' + '.join(pair['skills']),
+                'Jobs': pair['jobs'],
+                'Jaccard': pair['jaccard'],
+                'Lift': pair['lift']
+            }
+            for pair in cooccurrence['pairs']
+        ])
+        dataframe(pairs_table, hide_index=True)
 
-def show_company_insights(df, analytics):
+@timed_page
+def show_company_insights(analytics):
     """Display company analysis page"""
+    import plotly.express as px
+    
     st.markdown('<p class="main-header">🏢 Company Insights</p>', unsafe_allow_html=True)
     
     st.metric("Total Hiring Companies", f"{analytics['companies']['total_companies']:,}")
@@ -443,7 +743,7 @@ def show_company_insights(df, analytics):
         title="Top 20 Hiring Companies"
     )
     fig.update_layout(height=700, showlegend=False, yaxis={'categoryorder':'total ascending'})
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     # Company details table
     st.markdown("---")
@@ -457,10 +757,33 @@ def show_company_insights(df, analytics):
         'primary_location': 'Primary Location'
     })
     
-    st.dataframe(company_table, use_container_width=True, hide_index=True)
+    dataframe(company_table, hide_index=True)
+    
+    # Company size breakdown (analytics from runs before company sizes were parsed have none)
+    if analytics.get('company_sizes', {}).get('distribution'):
+        st.markdown("---")
+        st.subheader("🏭 Jobs by Company Size")
+        
+        sizes_data = pd.DataFrame(analytics['company_sizes']['distribution'])
+        
+        fig = px.bar(
+            sizes_data,
+            x='bucket',
+            y='count',
+            color='avg_applications',
+            color_continuous_scale='Reds',
+            labels={'bucket': 'Company Size (employees)', 'count': 'Number of Jobs',
+                    'avg_applications': 'Avg Applications'},
+            hover_data=['companies', 'percentage']
+        )
+        fig.update_layout(height=450, xaxis={'categoryorder': 'array', 'categoryarray': sizes_data['bucket'].tolist()})
+        plotly_chart(fig)
 
-def show_geographic_analysis(df, analytics):
+@timed_page
+def show_geographic_analysis(analytics):
     """Display geographic analysis page"""
+    import plotly.express as px
+    
     st.markdown('<p class="main-header">🌍 Geographic Analysis</p>', unsafe_allow_html=True)
     
     st.metric("Total Locations", f"{analytics['locations']['total_locations']:,}")
@@ -482,7 +805,7 @@ def show_geographic_analysis(df, analytics):
         hover_data=['primary_work_type']
     )
     fig.update_layout(height=700, yaxis={'categoryorder':'total ascending'})
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     # Location details
     st.markdown("---")
@@ -496,10 +819,13 @@ def show_geographic_analysis(df, analytics):
         'primary_work_type': 'Primary Work Type'
     })
     
-    st.dataframe(location_table, use_container_width=True, hide_index=True)
+    dataframe(location_table, hide_index=True)
 
-def show_job_categories(df, analytics):
+@timed_page
+def show_job_categories(analytics):
     """Display job categories analysis"""
+    import plotly.express as px
+    
     st.markdown('<p class="main-header">📋 Job Categories</p>', unsafe_allow_html=True)
     
     categories_data = pd.DataFrame(analytics['job_categories']['distribution'])
@@ -519,7 +845,7 @@ def show_job_categories(df, analytics):
             title="Job Category Distribution"
         )
         fig.update_layout(height=500, showlegend=False, yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     with col2:
         # Pie chart
@@ -531,7 +857,7 @@ def show_job_categories(df, analytics):
         )
         fig.update_traces(textposition='inside', textinfo='percent+label')
         fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     # Experience levels
     st.markdown("---")
@@ -551,7 +877,7 @@ def show_job_categories(df, analytics):
             title="Jobs by Experience Level"
         )
         fig.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     with col2:
         if analytics['experience'].get('years_statistics'):
@@ -561,14 +887,28 @@ def show_job_categories(df, analytics):
             st.metric("Median", f"{stats['median']} years")
             st.metric("Range", f"{stats['min']} - {stats['max']} years")
 
-def show_data_explorer(df):
+@timed_page
+def show_data_explorer(df, similarity_index=None, search_version=None):
     """Display raw data explorer"""
     st.markdown('<p class="main-header">🔎 Data Explorer</p>', unsafe_allow_html=True)
     
     st.markdown("### Filter and Explore Job Data")
     
+    # Keyword search over titles and descriptions
+    col1, col2 = st.columns([4, 1])
+    
+    with col1:
+        search_text = st.text_input(
+            "🔍 Keyword Search",
+            placeholder="e.g. data engineer, kubern, spark streaming",
+            help="Matches job titles and descriptions; the last word also matches as a prefix"
+        )
+    
+    with col2:
+        titles_only = st.checkbox("Titles only", help="Only match words in the job title")
+    
     # Filters
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         work_types = ['All'] + sorted(df['work_type'].unique().tolist())
@@ -582,8 +922,28 @@ def show_data_explorer(df):
         categories = ['All'] + sorted(df['job_category'].unique().tolist())
         selected_category = st.selectbox("Job Category", categories)
     
+    with col4:
+        # Smallest companies first rather than alphabetical
+        sizes = set(df['company_size_bucket'].dropna())
+        order = company_size_order()
+        company_sizes = ['All'] + [s for s in order if s in sizes] + sorted(sizes - set(order))
+        selected_company_size = st.selectbox("Company Size", company_sizes)
+    
     # Apply filters
     filtered_df = df.copy()
+    total_matches = None
+    
+    if search_text.strip():
+        if search_version is None or not SEARCH_INDEX_FILE.exists():
+            st.info("Run `python src/05_build_indexes.py` to enable keyword search.")
+        else:
+            filters = {'work_type': selected_work_type, 'city': selected_city, 'category': selected_category,
+                       'company_size': selected_company_size}
+            filters = tuple((name, value) for name, value in filters.items() if value != 'All')
+            with timed_block("search_jobs"):
+                hits, total_matches = search_jobs(search_version, search_text, filters, titles_only)
+            # Best match first; the dropdown filters were applied in the index (the pandas filters below cover any it lacks)
+            filtered_df = hits[['job_ID']].merge(df, on='job_ID')
     
     if selected_work_type != 'All':
         filtered_df = filtered_df[filtered_df['work_type'] == selected_work_type]
@@ -594,15 +954,19 @@ def show_data_explorer(df):
     if selected_category != 'All':
         filtered_df = filtered_df[filtered_df['job_category'] == selected_category]
     
-    st.metric("Filtered Results", f"{len(filtered_df):,} jobs")
+    if selected_company_size != 'All':
+        filtered_df = filtered_df[filtered_df['company_size_bucket'] == selected_company_size]
+    
+    st.metric("Filtered Results", f"{total_matches if total_matches is not None else len(filtered_df):,} jobs")
+    if total_matches is not None and total_matches > len(filtered_df):
+        st.caption(f"Showing the {len(filtered_df):,} best matches")
     
     # Display data
     display_cols = ['job', 'company_name', 'location', 'work_type', 'job_category', 
                     'experience_level', 'skill_count', 'no_of_application']
     
-    st.dataframe(
+    dataframe(
         filtered_df[display_cols].head(100),
-        use_container_width=True,
         hide_index=True
     )
     
@@ -614,9 +978,54 @@ def show_data_explorer(df):
         file_name="filtered_jobs.csv",
         mime="text/csv"
     )
+    
+    # Similar jobs (nearest neighbours by description text and skills)
+    st.markdown("---")
+    st.markdown("### 🧭 Similar Jobs")
+    
+    if similarity_index is None:
+        st.info("Run `python src/05_build_indexes.py` to enable similar job search.")
+        return
+    
+    # Jobs newer than the index cannot be looked up
+    indexed = filtered_df[filtered_df['job_ID'].isin(similarity_index.job_ids)].head(100)
+    if indexed.empty:
+        st.info("No indexed jobs match the current filters.")
+        return
+    
+    labels = dict(zip(indexed['job_ID'], indexed['job'] + " — " + indexed['company_name'].fillna('Unknown')))
+    selected_job = st.selectbox(
+        "Find jobs similar to",
+        options=list(labels),
+        format_func=labels.get
+    )
+    
+    with timed_block("similar_jobs"):
+        similar = similarity_index.similar(
+            selected_job, k=SIMILAR_JOBS,
+            approximate=similarity_index.signatures is not None,
+            n_candidates=SIMILARITY_LSH_CANDIDATES
+        )
+    
+    similar = similar.merge(df[['job_ID', 'job', 'company_name', 'location', 'work_type']], on='job_ID')
+    for column in ['similarity', 'text_similarity', 'skill_similarity']:
+        similar[column] = (similar[column] * 100).round(1)
+    
+    dataframe(
+        similar[['job', 'company_name', 'location', 'work_type',
+                 'similarity', 'text_similarity', 'skill_similarity']].rename(columns={
+            'similarity': 'Match %',
+            'text_similarity': 'Description %',
+            'skill_similarity': 'Skills %'
+        }),
+        hide_index=True
+    )
 
-def show_career_recommender(df, analytics, skill_df):
+@timed_page
+def show_career_recommender(df, analytics, bitsets=None, data_version=None):
     """AI-Powered Career Path Recommender"""
+    import plotly.express as px
+    
     st.markdown('<p class="main-header">🎯 AI Career Path Recommender</p>', unsafe_allow_html=True)
     st.markdown("### Discover Your Ideal Career Path Based on Market Data")
     
@@ -685,10 +1094,13 @@ def show_career_recommender(df, analytics, skill_df):
         else:
             with st.spinner("🤖 AI is analyzing market data and generating recommendations..."):
                 # Calculate recommendations
-                recommendations = calculate_career_recommendations(
-                    df, skill_df, selected_skills, experience_years,
-                    preferred_work_type, preferred_location, career_goal
-                )
+                with timed_block("calculate_career_recommendations"):
+                    recommendations = cached_recommendations(
+                        get_recommendation_cache(), data_version,
+                        df, selected_skills, experience_years,
+                        preferred_work_type, preferred_location, career_goal,
+                        top_k=10, bitsets=bitsets
+                    )
                 
                 # Display results
                 st.markdown("---")
@@ -765,7 +1177,7 @@ def show_career_recommender(df, analytics, skill_df):
                             labels={'demand': 'Jobs Requiring This Skill', 'skill': 'Skill'}
                         )
                         fig.update_layout(height=400, showlegend=False)
-                        st.plotly_chart(fig, use_container_width=True)
+                        plotly_chart(fig)
                 
                 with col2:
                     st.markdown("#### ✨ Your Skill Strengths")
@@ -781,7 +1193,7 @@ def show_career_recommender(df, analytics, skill_df):
                             labels={'value': 'Market Value (Job Count)', 'skill': 'Skill'}
                         )
                         fig.update_layout(height=400, showlegend=False)
-                        st.plotly_chart(fig, use_container_width=True)
+                        plotly_chart(fig)
                 
                 # Learning Path
                 st.markdown("---")
@@ -814,150 +1226,200 @@ def show_career_recommender(df, analytics, skill_df):
                     - Consider hybrid roles that leverage your existing expertise
                     - Estimated transition time: 3-6 months with focused learning
                     """)
+    
+    # Results are shared across sessions; same skills in any order reuse one entry
+    with st.expander("🧮 Recommendation Cache"):
+        cache_stats = get_recommendation_cache().stats()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Hit Rate", f"{cache_stats['hit_rate'] * 100:.0f}%")
+        col2.metric("Hits / Misses", f"{cache_stats['hits']} / {cache_stats['misses']}")
+        col3.metric("Entries", f"{cache_stats['entries']} / {RECOMMENDATION_CACHE_SIZE}")
+        col4.metric("Memory", f"{cache_stats['bytes'] / 1024:,.0f} KB")
+        st.caption(f"Evictions: {cache_stats['evictions']} | Expired: {cache_stats['expirations']}")
 
-def calculate_career_recommendations(df, skill_df, user_skills, experience, work_type, location, goal):
-    """Calculate personalized career recommendations using AI algorithms"""
+def show_market_history(history, analytics):
+    """Job volume and skill demand across pipeline snapshots"""
+    import plotly.express as px
+    
+    st.markdown("## 📅 Market History")
+    
+    if len(history) < 2:
+        st.info(f"📅 {len(history)} snapshot(s) recorded so far. Each run of `03_role_stats.py` "
+                "on new data adds one; trends appear once there are two.")
+        return
+    
+    dates = sorted(history['snapshot_date'].unique())
+    start, end = st.select_slider(
+        "Snapshot range",
+        options=dates,
+        value=(dates[max(0, len(dates) - 90)], dates[-1])
+    )
+    window = history[(history['snapshot_date'] >= start) & (history['snapshot_date'] <= end)]
     
-    # Filter jobs based on preferences
-    filtered_df = df.copy()
+    col1, col2 = st.columns(2)
     
-    if work_type != "Any":
-        filtered_df = filtered_df[filtered_df['work_type'] == work_type]
+    with col1:
+        fig = px.line(
+            window, x='snapshot_date', y=['total_jobs', 'remote_jobs'],
+            markers=True, labels={'snapshot_date': 'Snapshot', 'value': 'Postings', 'variable': ''}
+        )
+        fig.update_layout(title="Postings per Snapshot", height=400)
+        plotly_chart(fig)
     
-    if location != "Any":
-        filtered_df = filtered_df[filtered_df['city'] == location]
+    with col2:
+        top_skills = [s['skill'] for s in analytics['skills']['top_skills']]
+        skills = st.multiselect("Skills", options=top_skills, default=top_skills[:5])
+        skill_history = load_skill_history(history_version(), tuple(skills), start, end)
+        
+        fig = px.line(
+            skill_history, x='snapshot_date', y='share', color='skill', markers=True,
+            labels={'snapshot_date': 'Snapshot', 'share': '% of postings', 'skill': 'Skill'}
+        )
+        fig.update_layout(title="Skill Demand per Snapshot", height=400)
+        plotly_chart(fig)
+
+def show_skill_trends(trends):
+    """Rising/declining skills and their share of postings per posting-age window"""
+    import plotly.graph_objects as go
     
-    # Determine experience level
-    if experience <= 2:
-        exp_level = "Junior"
-    elif experience <= 5:
-        exp_level = "Mid-Level"
-    else:
-        exp_level = "Senior"
+    # Trending Skills (precomputed by 03_role_stats from posting-age windows)
+    st.markdown("## 🔥 Trending Skills Right Now")
     
-    # Calculate match scores for each job
-    job_scores = []
+    windows = trends['windows']
+    if len(windows) >= 2:
+        st.caption(
+            f"Share of postings mentioning each skill in the newest window ({windows[0]['label']}, "
+            f"{windows[0]['jobs']:,} jobs) vs the previous one ({windows[1]['label']}, {windows[1]['jobs']:,} jobs)"
+        )
     
-    for idx, job in filtered_df.iterrows():
-        job_skills = job.get('skills', [])
-        if isinstance(job_skills, str):
-            job_skills = job_skills.split('|') if job_skills else []
-        
-        # Calculate match score
-        if not job_skills:
-            match_score = 0
-        else:
-            matching_skills = set(user_skills) & set(job_skills)
-            match_score = (len(matching_skills) / len(job_skills)) * 100
+    skill_trends = trends['skills']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🚀 Rising Stars (Fastest Growing)")
+        rising_skills = [s for s in skill_trends if s['trend'] == 'up'][:8]
         
-        skills_you_have = list(set(user_skills) & set(job_skills))
-        skills_to_learn = list(set(job_skills) - set(user_skills))
+        for idx, skill in enumerate(rising_skills, 1):
+            st.markdown(f"""
+            <div style="padding: 0.8rem; margin: 0.5rem 0; background: linear-gradient(90deg, rgba(0,255,136,0.1), transparent); border-left: 3px solid #00ff88; border-radius: 5px;">
+                <strong>#{idx} {skill['skill']}</strong><br>
+                <span class="trend-up">↗ +{skill['velocity']}%</span> | {skill['demand']} jobs | accel {skill['acceleration']:+} pts
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### 📉 Declining Skills (Losing Momentum)")
+        declining_skills = [s for s in skill_trends if s['trend'] == 'down'][:8]
         
-        job_scores.append({
-            'job_id': job.get('job_ID', idx),
-            'title': job.get('job', 'Unknown'),
-            'company': job.get('company_name', 'Unknown'),
-            'location': job.get('city', 'Unknown'),
-            'work_type': job.get('work_type', 'Unknown'),
-            'match_score': match_score,
-            'skills_you_have': skills_you_have,
-            'skills_to_learn': skills_to_learn,
-            'job_skills': job_skills
-        })
+        for idx, skill in enumerate(declining_skills, 1):
+            st.markdown(f"""
+            <div style="padding: 0.8rem; margin: 0.5rem 0; background: linear-gradient(90deg, rgba(255,71,87,0.1), transparent); border-left: 3px solid #ff4757; border-radius: 5px;">
+                <strong>#{idx} {skill['skill']}</strong><br>
+                <span class="trend-down">↘ {skill['velocity']}%</span> | {skill['demand']} jobs | accel {skill['acceleration']:+} pts
+            </div>
+            """, unsafe_allow_html=True)
     
-    # Group by job title
-    from collections import defaultdict
-    role_aggregation = defaultdict(lambda: {
-        'job_count': 0,
-        'total_match_score': 0,
-        'companies': set(),
-        'locations': set(),
-        'work_types': set(),
-        'all_skills_needed': [],
-        'all_skills_you_have': [],
-        'all_skills_to_learn': []
-    })
+    # Share of postings per window for the top movers
+    movers = [s for s in skill_trends if s['trend'] != 'stable'][:8]
+    if movers:
+        window_order = [w['label'] for w in reversed(windows)]
+        fig = go.Figure()
+        for skill in movers:
+            fig.add_trace(go.Scatter(
+                x=window_order,
+                y=list(reversed(skill['window_shares'])),
+                mode='lines+markers',
+                name=skill['skill']
+            ))
+        fig.update_layout(
+            title="Skill Share of Postings by Posting Age (oldest → newest)",
+            xaxis_title="Posted",
+            yaxis_title="% of postings",
+            height=400
+        )
+        plotly_chart(fig)
+
+def show_supply_demand(supply_demand):
+    """Demand vs applicant supply for the most demanded skills"""
+    import plotly.graph_objects as go
     
-    for job in job_scores:
-        title = job['title']
-        role_aggregation[title]['job_count'] += 1
-        role_aggregation[title]['total_match_score'] += job['match_score']
-        role_aggregation[title]['companies'].add(job['company'])
-        role_aggregation[title]['locations'].add(job['location'])
-        role_aggregation[title]['work_types'].add(job['work_type'])
-        role_aggregation[title]['all_skills_needed'].extend(job['job_skills'])
-        role_aggregation[title]['all_skills_you_have'].extend(job['skills_you_have'])
-        role_aggregation[title]['all_skills_to_learn'].extend(job['skills_to_learn'])
-    
-    # Calculate top recommended roles
-    top_roles = []
-    for title, data in role_aggregation.items():
-        avg_match = data['total_match_score'] / data['job_count'] if data['job_count'] > 0 else 0
-        
-        # Get most common skills
-        from collections import Counter
-        skills_needed_counter = Counter(data['all_skills_needed'])
-        skills_you_have_counter = Counter(data['all_skills_you_have'])
-        skills_to_learn_counter = Counter(data['all_skills_to_learn'])
+    # Supply vs Demand Analysis
+    st.markdown("## ⚖️ Supply vs Demand Analysis")
+    
+    st.info("""
+    **📊 Understanding the Market Balance:**
+    - **High Demand, Low Supply** 🔥: Learn these skills NOW for maximum opportunity
+    - **High Demand, High Supply** ⚖️: Competitive but stable opportunities
+    - **Low Demand, Low Supply** 💤: Niche specializations
+    
+    Supply is estimated from applicants on postings that require the skill; the ratio
+    compares the market-wide applicants per posting with the skill's.
+    """)
+    
+    supply_demand_data = []
+    for skill in supply_demand:
+        ratio = skill['ratio']
+        category = "🔥 Hot" if ratio > 1.2 else "⚖️ Balanced" if ratio > 0.8 else "❄️ Saturated"
         
-        top_roles.append({
-            'title': title,
-            'match_score': avg_match,
-            'job_count': data['job_count'],
-            'top_companies': sorted(list(data['companies']), key=lambda x: x)[:5],
-            'locations': sorted(list(data['locations']), key=lambda x: x)[:5],
-            'work_types': sorted(list(data['work_types'])),
-            'skills_you_have': [s for s, _ in skills_you_have_counter.most_common(10)],
-            'skills_to_learn': [s for s, _ in skills_to_learn_counter.most_common(10)]
+        supply_demand_data.append({
+            'Skill': skill['skill'],
+            'Demand': skill['demand'],
+            'Supply': skill['supply'],
+            'Applicants/Job': skill['applicants_per_job'],
+            'Ratio': ratio,
+            'Status': category
         })
     
-    # Sort by match score
-    top_roles.sort(key=lambda x: (x['match_score'], x['job_count']), reverse=True)
-    
-    # Calculate missing skills across all jobs
-    all_missing_skills = []
-    for job in job_scores:
-        all_missing_skills.extend(job['skills_to_learn'])
-    
-    from collections import Counter
-    missing_skills_counter = Counter(all_missing_skills)
-    missing_skills = [{'skill': s, 'demand': c} for s, c in missing_skills_counter.most_common(20)]
-    
-    # Calculate value of user's current skills
-    user_skill_value = []
-    for skill in user_skills:
-        count = sum(1 for job in job_scores if skill in job['job_skills'])
-        if count > 0:
-            user_skill_value.append({'skill': skill, 'value': count})
-    user_skill_value.sort(key=lambda x: x['value'], reverse=True)
-    
-    # Create learning path (prioritize by demand)
-    learning_path = []
-    for item in missing_skills[:15]:
-        # Estimate learning time based on skill complexity (simplified)
-        learning_time = "2-4 weeks" if item['demand'] > 100 else "1-2 weeks"
-        learning_path.append({
-            'skill': item['skill'],
-            'demand': item['demand'],
-            'learning_time': learning_time
-        })
+    if not supply_demand_data:
+        st.info("No skill mentions to compare.")
+        return
     
-    matching_jobs = sum(1 for job in job_scores if job['match_score'] > 0)
-    avg_match = sum(job['match_score'] for job in job_scores) / len(job_scores) if job_scores else 0
-    
-    return {
-        'total_jobs': len(filtered_df),
-        'matching_jobs': matching_jobs,
-        'avg_match_score': avg_match,
-        'skills_gap': len(missing_skills),
-        'top_roles': top_roles,
-        'missing_skills': missing_skills,
-        'your_skill_value': user_skill_value,
-        'learning_path': learning_path
-    }
+    sd_df = pd.DataFrame(supply_demand_data)
+    
+    # Visualize supply vs demand
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=sd_df['Supply'],
+        y=sd_df['Demand'],
+        mode='markers+text',
+        marker=dict(
+            size=sd_df['Ratio'] * 20,
+            color=sd_df['Ratio'],
+            colorscale='RdYlGn',
+            showscale=True,
+            colorbar=dict(title="D/S Ratio")
+        ),
+        text=sd_df['Skill'],
+        textposition="top center",
+        hovertemplate='<b>%{text}</b><br>Demand: %{y}<br>Supply: %{x}<br>Ratio: %{marker.color:.2f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Supply vs Demand Matrix (Bubble Size = Opportunity Index)",
+        xaxis_title="Supply (Applicants on Postings with Skill)",
+        yaxis_title="Demand (Jobs Requiring Skill)",
+        height=500
+    )
+    
+    plotly_chart(fig)
+    
+    # Data table
+    dataframe(
+        sd_df.style.background_gradient(subset=['Ratio'], cmap='RdYlGn'),
+        hide_index=True
+    )
 
-def show_market_intelligence(df, analytics, skill_df):
+@timed_page
+def show_market_intelligence(df, analytics, trends):
     """Real-Time Market Intelligence Dashboard"""
+    import plotly.graph_objects as go
+    
+    with timed_block("load_history"):
+        history = load_history(history_version())
+    deltas = snapshot_store.metric_deltas(history)
+    
     st.markdown('<p class="main-header">📈 Real-Time Market Intelligence</p>', unsafe_allow_html=True)
     st.markdown("### Live Market Insights & Trend Analysis")
     
@@ -1020,23 +1482,20 @@ def show_market_intelligence(df, analytics, skill_df):
     st.markdown("---")
     
     # Real-time status indicator
-    import datetime
-    current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
         st.markdown(f"### 🔴 LIVE Dashboard | Last Updated: {current_time}")
     with col2:
         if st.button("🔄 Refresh Data", type="primary"):
-            st.cache_data.clear()
-            st.rerun()
+            # The rerun triggered by the click has already picked up new data
+            st.toast(f"Data is up to date (version {st.session_state['data_version'] or 'unknown'})")
     with col3:
         auto_refresh = st.checkbox("⚡ Auto-Refresh", value=False)
     
     if auto_refresh:
-        import time
-        time.sleep(30)  # Refresh every 30 seconds
-        st.rerun()
+        start_auto_refresh(st.session_state['data_version'])
     
     st.markdown("---")
     
@@ -1067,15 +1526,13 @@ def show_market_intelligence(df, analytics, skill_df):
         st.metric("Market Status", trend, delta=None)
     
     with col3:
-        st.metric("Active Companies", f"{companies_hiring:,}", delta="+12% vs last month")
+        st.metric("Active Companies", f"{companies_hiring:,}", delta=history_delta(deltas, 'total_companies'))
     
     with col4:
         competition = "Low" if avg_applications < 50 else "Medium" if avg_applications < 150 else "High"
         st.metric("Competition Level", competition, delta=None)
     
     # Market health visualization
-    import plotly.graph_objects as go
-    
     fig = go.Figure(go.Indicator(
         mode="gauge+number+delta",
         value=health_score,
@@ -1099,133 +1556,20 @@ def show_market_intelligence(df, analytics, skill_df):
     )
     
     fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     st.markdown("---")
     
-    # Trending Skills (Simulated real-time analysis)
-    st.markdown("## 🔥 Trending Skills Right Now")
-    
-    # Calculate skill velocity (change rate)
-    skill_trends = []
-    for skill in analytics['skills']['top_skills'][:20]:
-        # Simulate trend calculation
-        import random
-        trend_direction = random.choice(['up', 'up', 'stable', 'down'])  # Weighted towards up
-        trend_percentage = random.randint(5, 45) if trend_direction == 'up' else random.randint(-15, -5) if trend_direction == 'down' else random.randint(-3, 3)
-        
-        skill_trends.append({
-            'skill': skill['skill'],
-            'demand': skill['count'],
-            'trend': trend_direction,
-            'change': trend_percentage
-        })
-    
-    # Sort by trend
-    skill_trends.sort(key=lambda x: abs(x['change']), reverse=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 🚀 Rising Stars (Fastest Growing)")
-        rising_skills = [s for s in skill_trends if s['trend'] == 'up'][:8]
-        
-        for idx, skill in enumerate(rising_skills, 1):
-            st.markdown(f"""
-            <div style="padding: 0.8rem; margin: 0.5rem 0; background: linear-gradient(90deg, rgba(0,255,136,0.1), transparent); border-left: 3px solid #00ff88; border-radius: 5px;">
-                <strong>#{idx} {skill['skill']}</strong><br>
-                <span class="trend-up">↗ +{skill['change']}%</span> | {skill['demand']} jobs
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("### 📉 Declining Skills (Losing Momentum)")
-        declining_skills = [s for s in skill_trends if s['trend'] == 'down'][:8]
-        
-        for idx, skill in enumerate(declining_skills, 1):
-            st.markdown(f"""
-            <div style="padding: 0.8rem; margin: 0.5rem 0; background: linear-gradient(90deg, rgba(255,71,87,0.1), transparent); border-left: 3px solid #ff4757; border-radius: 5px;">
-                <strong>#{idx} {skill['skill']}</strong><br>
-                <span class="trend-down">↘ {skill['change']}%</span> | {skill['demand']} jobs
-            </div>
-            """, unsafe_allow_html=True)
+    show_market_history(history, analytics)
     
     st.markdown("---")
     
-    # Supply vs Demand Analysis
-    st.markdown("## ⚖️ Supply vs Demand Analysis")
-    
-    st.info("""
-    **📊 Understanding the Market Balance:**
-    - **High Demand, Low Supply** 🔥: Learn these skills NOW for maximum opportunity
-    - **High Demand, High Supply** ⚖️: Competitive but stable opportunities
-    - **Low Demand, Low Supply** 💤: Niche specializations
-    """)
-    
-    # Categorize skills
-    high_demand_skills = [s for s in analytics['skills']['top_skills'] if s['count'] > 500][:15]
-    
-    supply_demand_data = []
-    for skill in high_demand_skills:
-        # Simulate supply calculation (in real scenario, you'd have candidate data)
-        import random
-        demand = skill['count']
-        supply = random.randint(int(demand * 0.3), int(demand * 1.5))  # Simulated supply
-        ratio = demand / supply if supply > 0 else 0
-        
-        category = "🔥 Hot" if ratio > 1.2 else "⚖️ Balanced" if ratio > 0.8 else "❄️ Saturated"
-        
-        supply_demand_data.append({
-            'Skill': skill['skill'],
-            'Demand': demand,
-            'Supply': supply,
-            'Ratio': round(ratio, 2),
-            'Status': category
-        })
-    
-    sd_df = pd.DataFrame(supply_demand_data)
-    
-    # Visualize supply vs demand
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=sd_df['Supply'],
-        y=sd_df['Demand'],
-        mode='markers+text',
-        marker=dict(
-            size=sd_df['Ratio'] * 20,
-            color=sd_df['Ratio'],
-            colorscale='RdYlGn',
-            showscale=True,
-            colorbar=dict(title="D/S Ratio")
-        ),
-        text=sd_df['Skill'],
-        textposition="top center",
-        hovertemplate='<b>%{text}</b><br>Demand: %{y}<br>Supply: %{x}<br>Ratio: %{marker.color:.2f}<extra></extra>'
-    ))
-    
-    fig.add_shape(
-        type="line",
-        x0=0, y0=0,
-        x1=max(sd_df['Supply']), y1=max(sd_df['Demand']),
-        line=dict(color="gray", dash="dash"),
-    )
-    
-    fig.update_layout(
-        title="Supply vs Demand Matrix (Bubble Size = Opportunity Index)",
-        xaxis_title="Supply (Candidates with Skill)",
-        yaxis_title="Demand (Jobs Requiring Skill)",
-        height=500
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Data table
-    st.dataframe(
-        sd_df.style.background_gradient(subset=['Ratio'], cmap='RdYlGn'),
-        use_container_width=True,
-        hide_index=True
-    )
+    if trends is None:
+        st.info("📈 Skill trends not found. Run `python src/03_role_stats.py` to generate them.")
+    else:
+        show_skill_trends(trends)
+        st.markdown("---")
+        show_supply_demand(trends['supply_demand'])
     
     st.markdown("---")
     
@@ -1307,6 +1651,156 @@ def show_market_intelligence(df, analytics, skill_df):
         if st.button("🔔 Enable Alerts"):
             st.success("✅ Alerts configured! You'll be notified when market conditions change.")
 
+@timed_page
+def show_pipeline_performance():
+    """Display pipeline run traces: per-stage timings, memory and trends"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    st.markdown('<p class="main-header">⚡ Pipeline Performance</p>', unsafe_allow_html=True)
+    st.markdown("### Per-stage and per-function timings from recent pipeline runs")
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        max_runs = st.slider("Runs to compare", 2, 50, 10)
+    with col2:
+        include_bench = st.checkbox("Include benchmark runs", value=False)
+    
+    # Read extra files so enough real runs remain after dropping benchmark runs
+    traces = load_run_traces(list_trace_files(max_runs * 5))
+    
+    if traces.empty:
+        st.info("No run traces found yet. Run the pipeline to record one:")
+        st.code("python src/run_pipeline.py")
+        return
+    
+    if not include_bench:
+        traces = traces[~traces['run_id'].astype(str).str.startswith('bench_')]
+    
+    stage_summary = summarize_stages(traces)
+    if stage_summary.empty:
+        st.info("No completed stages in the selected runs yet.")
+        return
+    
+    run_order = stage_summary.groupby('run_id')['ts'].min().sort_values().index.tolist()[-max_runs:]
+    stage_summary = stage_summary[stage_summary['run_id'].isin(run_order)]
+    traces = traces[traces['run_id'].isin(run_order)]
+    latest_run = run_order[-1]
+    latest = stage_summary[stage_summary['run_id'] == latest_run]
+    
+    # Regression banner (latest run vs median of earlier runs)
+    st.markdown("---")
+    st.markdown(f"## 🚦 Latest Run: `{latest_run}`")
+    
+    regressions = detect_regressions(stage_summary, latest_run)
+    regressed = [r for r in regressions if r['regressed']]
+    if regressed:
+        for r in regressed:
+            st.error(f"⚠️ **{r['stage']}** took {r['latest']:.1f}s, "
+                     f"{r['ratio']:.1f}× the median of previous runs ({r['baseline']:.1f}s)")
+    elif regressions:
+        st.success("✅ No stage regressions against previous runs")
+    
+    cols = st.columns(max(len(latest), 1))
+    baseline = {r['stage']: r['baseline'] for r in regressions}
+    for col, (_, row) in zip(cols, latest.iterrows()):
+        with col:
+            base = baseline.get(row['stage'])
+            delta = f"{row['wall_seconds'] - base:+.1f}s vs median" if base is not None else None
+            st.metric(row['stage'], f"{row['wall_seconds']:.1f}s", delta=delta, delta_color="inverse")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Wall Time", f"{latest['wall_seconds'].sum():.1f}s")
+    with col2:
+        peak = latest['peak_rss_mb'].max()
+        st.metric("Peak Memory", f"{peak:,.0f} MB" if pd.notna(peak) else "n/a")
+    with col3:
+        if 'rows_per_sec' in latest.columns and latest['rows_per_sec'].notna().any():
+            slowest = latest.loc[latest['rows_per_sec'].idxmin()]
+            st.metric("Slowest Throughput", f"{slowest['rows_per_sec']:,.0f} rows/s",
+                      delta=slowest['stage'], delta_color="off")
+    
+    # Flame-style breakdown: run -> stage -> function -> nested function
+    st.markdown("---")
+    st.markdown("## 🔥 Time Breakdown")
+    
+    latest_functions = traces[(traces['run_id'] == latest_run) & (traces['kind'] == 'function')]
+    # Node ids follow the whole call chain, so a function under two callers gets two nodes
+    # (traces written before parent_path was recorded only know the direct caller)
+    parent_path = latest_functions['parent_path'] if 'parent_path' in latest_functions.columns else None
+    parent_path = latest_functions['parent'] if parent_path is None else parent_path.fillna(latest_functions['parent'])
+    latest_functions = latest_functions.assign(parent_path=parent_path.fillna('')).groupby(
+        ['stage', 'parent_path', 'function'], as_index=False, sort=False
+    ).agg(wall_seconds=('wall_seconds', 'sum'), cpu_seconds=('cpu_seconds', 'sum'),
+          rows_in=('rows_in', 'max'), rows_out=('rows_out', 'max'),
+          mem_delta_mb=('mem_delta_mb', 'sum'))
+    ids, labels, parents, values = [latest_run], [latest_run], [''], [latest['wall_seconds'].sum()]
+    for _, row in latest.iterrows():
+        ids.append(row['stage'])
+        labels.append(row['stage'])
+        parents.append(latest_run)
+        values.append(row['wall_seconds'])
+    for _, row in latest_functions.iterrows():
+        parent_id = f"{row['stage']}/{row['parent_path']}" if row['parent_path'] else row['stage']
+        ids.append(f"{parent_id}/{row['function']}")
+        labels.append(row['function'])
+        parents.append(parent_id)
+        values.append(row['wall_seconds'])
+    
+    fig = go.Figure(go.Icicle(
+        ids=ids, labels=labels, parents=parents, values=values,
+        branchvalues='remainder',
+        tiling=dict(orientation='v'),
+        hovertemplate='<b>%{label}</b><br>%{value:.2f}s<extra></extra>'
+    ))
+    fig.update_layout(height=500, margin=dict(l=10, r=10, t=30, b=10))
+    plotly_chart(fig)
+    
+    # Function table
+    if not latest_functions.empty:
+        func_table = latest_functions[['stage', 'function', 'wall_seconds', 'cpu_seconds',
+                                       'rows_in', 'rows_out', 'mem_delta_mb']].copy()
+        func_table['rows_per_sec'] = func_table['rows_in'] / func_table['wall_seconds']
+        func_table = func_table.sort_values('wall_seconds', ascending=False)
+        dataframe(func_table.round(3), hide_index=True)
+    
+    # Trends across runs
+    st.markdown("---")
+    st.markdown("## 📈 Trends Across Runs")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.line(
+            stage_summary, x='run_id', y='wall_seconds', color='stage', markers=True,
+            labels={'run_id': 'Run', 'wall_seconds': 'Wall Time (s)', 'stage': 'Stage'},
+            title="Stage Wall Time",
+            category_orders={'run_id': run_order}
+        )
+        fig.update_layout(height=400)
+        plotly_chart(fig)
+    
+    with col2:
+        fig = px.line(
+            stage_summary, x='run_id', y='peak_rss_mb', color='stage', markers=True,
+            labels={'run_id': 'Run', 'peak_rss_mb': 'Peak Memory (MB)', 'stage': 'Stage'},
+            title="Stage Peak Memory",
+            category_orders={'run_id': run_order}
+        )
+        fig.update_layout(height=400)
+        plotly_chart(fig)
+    
+    if 'rows_per_sec' in stage_summary.columns and stage_summary['rows_per_sec'].notna().any():
+        fig = px.bar(
+            stage_summary, x='run_id', y='rows_per_sec', color='stage', barmode='group',
+            labels={'run_id': 'Run', 'rows_per_sec': 'Rows / sec', 'stage': 'Stage'},
+            title="Throughput per Stage",
+            category_orders={'run_id': run_order}
+        )
+        fig.update_layout(height=400)
+        plotly_chart(fig)
+
+@timed_page
 def show_about():
     """Display About page"""
     st.markdown('<p class="main-header">📊 About This Dashboard</p>', unsafe_allow_html=True)
@@ -1639,6 +2133,13 @@ def show_about():
 
 def main():
     """Main application"""
+    rerun_start = time.perf_counter()
+    st.session_state['render_timings'] = []
+    
+    # Loaders are keyed on their artifact's content hash, so new pipeline output
+    # is picked up on the next rerun and unchanged artifacts stay cached
+    manifest = read_data_manifest()
+    st.session_state['data_version'] = manifest.get('version')
     
     # Initialize session state for navigation
     if 'main_page' not in st.session_state:
@@ -1682,7 +2183,8 @@ def main():
                 "📋 Job Categories",
                 "🔎 Data Explorer",
                 "🎯 Career Recommender",
-                "📈 Market Intelligence"
+                "📈 Market Intelligence",
+                "⚡ Pipeline Performance"
             ],
             key="sidebar_nav"
         )
@@ -1722,13 +2224,13 @@ def main():
         
         page = None
     
-    # Load data
+    # Each page loads only the artifacts it renders
     try:
-        df, analytics, skill_df = load_data()
-        
         # Show quick stats in sidebar for Overview
         if st.session_state.main_page == 'Overview':
-            st.sidebar.metric("Total Jobs", f"{len(df):,}")
+            with timed_block("load_analytics"):
+                analytics = load_analytics(artifact_version(manifest, 'analytics_summary.json'))
+            st.sidebar.metric("Total Jobs", f"{analytics['metadata']['total_jobs']:,}")
             st.sidebar.metric("Companies", f"{analytics['companies']['total_companies']:,}")
             st.sidebar.metric("Skills Tracked", f"{analytics['skills']['total_unique_skills']}")
         
@@ -1738,21 +2240,36 @@ def main():
         else:
             # Route to selected sub-page in Overview
             if page == "📈 Dashboard Home":
-                show_overview(df, analytics)
+                show_overview(analytics)
             elif page == "🔍 Skills Explorer":
-                show_skills_explorer(df, analytics, skill_df)
+                show_skills_explorer(analytics)
             elif page == "🏢 Company Insights":
-                show_company_insights(df, analytics)
+                show_company_insights(analytics)
             elif page == "🌍 Geographic Analysis":
-                show_geographic_analysis(df, analytics)
+                show_geographic_analysis(analytics)
             elif page == "📋 Job Categories":
-                show_job_categories(df, analytics)
+                show_job_categories(analytics)
             elif page == "🔎 Data Explorer":
-                show_data_explorer(df)
+                with timed_block("load_jobs"):
+                    df = load_jobs(artifact_version(manifest, 'jobs_with_skills.csv'))
+                with timed_block("load_similarity_index"):
+                    similarity_index = load_similarity_index(artifact_version(manifest, 'similarity_index.npz'))
+                show_data_explorer(df, similarity_index, artifact_version(manifest, 'search_index.db'))
             elif page == "🎯 Career Recommender":
-                show_career_recommender(df, analytics, skill_df)
+                jobs_version = artifact_version(manifest, 'jobs_with_skills.csv')
+                with timed_block("load_jobs"):
+                    df = load_jobs(jobs_version)
+                with timed_block("load_skill_bitsets"):
+                    bitsets = load_skill_bitsets(artifact_version(manifest, 'skill_bitsets.npz'), jobs_version)
+                show_career_recommender(df, analytics, bitsets, jobs_version)
             elif page == "📈 Market Intelligence":
-                show_market_intelligence(df, analytics, skill_df)
+                with timed_block("load_jobs"):
+                    df = load_jobs(artifact_version(manifest, 'jobs_with_skills.csv'))
+                with timed_block("load_skill_trends"):
+                    trends = load_skill_trends(artifact_version(manifest, 'skill_trends.json'))
+                show_market_intelligence(df, analytics, trends)
+            elif page == "⚡ Pipeline Performance":
+                show_pipeline_performance()
             
     except FileNotFoundError as e:
         st.error("❌ Data files not found!")
@@ -1765,6 +2282,8 @@ python src/04_generate_charts.py
         """)
     except Exception as e:
         st.error(f"❌ An error occurred: {str(e)}")
+    
+    log_render_metrics(page or st.session_state.main_page, rerun_start)
 
 if __name__ == "__main__":
     main()
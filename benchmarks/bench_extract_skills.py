@@ -0,0 +1,115 @@
+"""
+Skill Extraction Benchmark
+Times every 02_extract_skills extractor on synthetic corpora of increasing size
+
+Usage:
+    python benchmarks/bench_extract_skills.py --scales 10k,100k,1M --backends regex,spacy
+"""
+
+import argparse
+import time
+
+from bench_utils import load_stage, parse_scales, write_results
+from synthetic_corpus import generate_postings, load_vocabulary
+
+extract = load_stage('02_extract_skills')
+import nlp_backend  # noqa: E402  (src is on sys.path after bench_utils)
+
+
+def time_call(func, repeat=1):
+    """Return the best wall time of func() over `repeat` runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def extractor_suite(df, skill_model, backends):
+    """Build the named extractor callables for one corpus"""
+    texts = df['job_details']
+    suite = {}
+
+    if 'regex' in backends:
+        suite['skills[regex]'] = lambda: texts.apply(skill_model.match)
+    if 'spacy' in backends:
+        if nlp_backend.is_available():
+            # Load model and matcher outside the timed region
+            nlp_backend.build_phrase_matcher(skill_model)
+            suite['skills[spacy]'] = lambda: nlp_backend.extract_skills_batch(texts, skill_model)
+        else:
+            print("   ⚠️ spaCy not installed, skipping spacy backend")
+
+    suite['certifications'] = lambda: texts.apply(extract.extract_certifications)
+    suite['categories'] = lambda: df['job'].apply(extract.categorize_job_role)
+    suite['experience'] = lambda: df.apply(
+        lambda row: extract.extract_experience_years(row['job_details'], row['job']),
+        axis=1
+    )
+    return suite
+
+
+def run_benchmark(scales, backends, repeat=1, seed=42):
+    """Run every extractor at every scale and collect timings"""
+    vocab = load_vocabulary()
+    skill_model = extract.build_skill_dictionary()
+    runs = []
+
+    for n in scales:
+        print(f"\n🧪 Generating {n:,} synthetic postings...")
+        start = time.perf_counter()
+        df = generate_postings(n, seed=seed, vocab=vocab)
+        generate_seconds = time.perf_counter() - start
+        avg_chars = float(df['job_details'].str.len().mean())
+        print(f"   Generated in {generate_seconds:.1f}s (avg {avg_chars:,.0f} chars/description)")
+
+        extractors = {}
+        for name, func in extractor_suite(df, skill_model, backends).items():
+            seconds = time_call(func, repeat=repeat)
+            extractors[name] = {
+                'seconds': round(seconds, 4),
+                'docs_per_sec': round(n / seconds, 1) if seconds > 0 else None
+            }
+            print(f"   {name:.<25} {seconds:>9.3f}s {extractors[name]['docs_per_sec']:>12,.1f} docs/sec")
+
+        runs.append({
+            'docs': n,
+            'avg_description_chars': round(avg_chars, 1),
+            'generate_seconds': round(generate_seconds, 3),
+            'extractors': extractors
+        })
+
+    return runs
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark 02_extract_skills extractors")
+    parser.add_argument('--scales', default='10k,100k',
+                        help="Comma-separated corpus sizes, e.g. 10k,100k,1M")
+    parser.add_argument('--backends', default='regex,spacy',
+                        help="Skill extraction backends to time")
+    parser.add_argument('--repeat', type=int, default=1, help="Best-of repeats per extractor")
+    parser.add_argument('--seed', type=int, default=42, help="Corpus random seed")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("⏱️ SKILL EXTRACTION BENCHMARK")
+    print("="*60)
+
+    scales = parse_scales(args.scales)
+    backends = [b.strip() for b in args.backends.split(',') if b.strip()]
+    runs = run_benchmark(scales, backends, repeat=args.repeat, seed=args.seed)
+
+    write_results('extract_skills', {
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'backends': backends,
+        'runs': runs
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Import-Time Benchmark
+Measures cold-start import cost of the dashboard and each pipeline stage with
+`python -X importtime`, one fresh interpreter per measurement
+
+Usage:
+    python benchmarks/bench_imports.py --repeat 5 --top 10
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from bench_utils import ROOT_DIR, SRC_DIR, write_results
+
+APP_FILE = ROOT_DIR / 'app' / 'streamlit_app.py'
+
+# Executes a script's module body (imports and top-level setup) without main()
+LOAD_SNIPPET = """
+import importlib.util, sys
+sys.path.insert(0, {directory!r})
+spec = importlib.util.spec_from_file_location('bench_target', {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+"""
+
+
+def import_targets():
+    """Return name -> script path for the dashboard and every pipeline stage"""
+    targets = {'app': APP_FILE}
+    for script in sorted(SRC_DIR.glob('0*_*.py')):
+        targets[script.stem] = script
+    return targets
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output
+
+    Returns:
+        (total seconds of top-level imports, {package: cumulative seconds})
+    """
+    total_us = 0
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|', 2)
+        cumulative_us = int(cumulative)
+        package = name.strip().split('.')[0]
+        # Nested imports are indented under their parent; count each tree once
+        if not name[1:].startswith(' '):
+            total_us += cumulative_us
+            packages[package] = packages.get(package, 0) + cumulative_us
+    return total_us / 1e6, {k: v / 1e6 for k, v in packages.items()}
+
+
+def measure_target(path, repeat=3):
+    """Load one script in fresh interpreters and keep the fastest run"""
+    code = LOAD_SNIPPET.format(directory=str(path.parent), path=str(path))
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=ROOT_DIR, capture_output=True, text=True
+        )
+        wall_seconds = time.perf_counter() - start
+        if proc.returncode != 0:
+            raise RuntimeError(f"{path.name} failed to load:\n{proc.stderr[-2000:]}")
+
+        import_seconds, packages = parse_importtime(proc.stderr)
+        if best is None or import_seconds < best['seconds']:
+            best = {
+                'seconds': round(import_seconds, 4),
+                'wall_seconds': round(wall_seconds, 4),
+                'packages': packages
+            }
+    return best
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Measure cold-start import time")
+    parser.add_argument('--repeat', type=int, default=3, help="Best-of runs per target")
+    parser.add_argument('--top', type=int, default=8, help="Heaviest packages listed per target")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("⏱️ IMPORT-TIME BENCHMARK")
+    print("="*60)
+
+    stages = {}
+    for name, path in import_targets().items():
+        result = measure_target(path, repeat=args.repeat)
+        heaviest = sorted(result.pop('packages').items(), key=lambda x: x[1], reverse=True)[:args.top]
+        result['heaviest_packages'] = {pkg: round(sec, 4) for pkg, sec in heaviest}
+        stages[name] = result
+
+        print(f"\n📦 {name}: {result['seconds']:.3f}s imports, {result['wall_seconds']:.3f}s process")
+        for pkg, sec in heaviest:
+            print(f"   {pkg:.<30} {sec:>8.3f}s")
+
+    write_results('imports', {
+        'repeat': args.repeat,
+        'runs': [{'docs': None, 'stages': stages}]
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Career Recommender Benchmark
+Times the loop and vectorized career recommendation scoring on synthetic jobs
+and checks that both return identical results
+
+Usage:
+    python benchmarks/bench_recommender.py --scales 1k,10k,100k --queries 5
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench_utils import parse_scales, write_results
+from synthetic_corpus import _sample, load_vocabulary
+
+import recommender  # noqa: E402  (src is on sys.path after bench_utils)
+from skill_bitset import SkillBitsets  # noqa: E402
+
+
+def generate_jobs(n, seed=42, vocab=None):
+    """Synthetic processed jobs (title, company, city, work type, skill lists)"""
+    rng = np.random.default_rng(seed)
+    vocab = vocab or load_vocabulary()
+
+    skill_counts = _sample(rng, vocab['skills_per_job'], n)
+    skill_names, skill_weights = vocab['skills']
+    all_skills = skill_names[rng.choice(len(skill_names), size=int(skill_counts.sum()), p=skill_weights)]
+    bounds = np.concatenate([[0], np.cumsum(skill_counts)])
+    # Extracted skills are unique per job
+    skills = [list(dict.fromkeys(all_skills[bounds[i]:bounds[i + 1]])) for i in range(n)]
+
+    locations = pd.Series(_sample(rng, vocab['locations'], n))
+    return pd.DataFrame({
+        'job_ID': np.arange(1, n + 1) + 3_000_000_000,
+        'job': _sample(rng, vocab['titles'], n),
+        'company_name': _sample(rng, vocab['companies'], n),
+        'city': locations.str.split(',').str[0].str.strip().to_numpy(),
+        'work_type': rng.choice(np.array(['On-Site', 'Remote', 'Hybrid'], dtype=object), size=n),
+        'skills': skills
+    })
+
+
+def user_queries(vocab, count, seed=42):
+    """Skill sets drawn from the most demanded skills, like dashboard users pick them"""
+    rng = np.random.default_rng(seed)
+    common = list(vocab['skills'][0][:40])
+    return [list(rng.choice(common, size=rng.integers(2, 8), replace=False)) for _ in range(count)]
+
+
+def time_queries(func, df, queries, **kwargs):
+    """Total wall time of func over every query, and the results"""
+    start = time.perf_counter()
+    results = [func(df, skills, 3, "Any", "Any", "Current Level", **kwargs) for skills in queries]
+    return time.perf_counter() - start, results
+
+
+def run_benchmark(scales, queries_per_scale, loop_max, top_k, seed=42):
+    """Time both implementations at every scale and check parity"""
+    vocab = load_vocabulary()
+    queries = user_queries(vocab, queries_per_scale, seed=seed)
+    runs, mismatches = [], 0
+
+    for n in scales:
+        print(f"\n🧪 {n:,} synthetic jobs, {len(queries)} queries")
+        df = generate_jobs(n, seed=seed, vocab=vocab)
+        implementations = {}
+
+        vec_seconds, vec_results = time_queries(recommender.calculate_career_recommendations, df, queries)
+        implementations['vectorized'] = {'seconds': round(vec_seconds, 4)}
+        topk_seconds, topk_results = time_queries(
+            recommender.calculate_career_recommendations, df, queries, top_k=top_k
+        )
+        implementations[f'vectorized[top_k={top_k}]'] = {'seconds': round(topk_seconds, 4)}
+
+        # Packed once up front, like the persisted skill_bitsets.npz
+        bitsets = SkillBitsets.from_lists(df['skills'], job_ids=df['job_ID'])
+        bits_seconds, bits_results = time_queries(
+            recommender.calculate_career_recommendations, df, queries, bitsets=bitsets
+        )
+        implementations['vectorized[bitsets]'] = {'seconds': round(bits_seconds, 4)}
+
+        identical = None
+        if n <= loop_max:
+            loop_seconds, loop_results = time_queries(recommender.calculate_career_recommendations_loop, df, queries)
+            implementations['loop'] = {'seconds': round(loop_seconds, 4)}
+            identical = vec_results == loop_results == bits_results and all(
+                dict(full, top_roles=full['top_roles'][:top_k]) == part
+                for full, part in zip(loop_results, topk_results)
+            )
+            mismatches += not identical
+
+        for name, stats in implementations.items():
+            stats['queries_per_sec'] = round(len(queries) / stats['seconds'], 2) if stats['seconds'] > 0 else None
+            print(f"   {name:.<30} {stats['seconds']:>9.3f}s {stats['queries_per_sec']:>10,.2f} queries/sec")
+        if identical is not None:
+            print(f"   {'identical to loop':.<30} {'✅' if identical else '❌'}")
+
+        runs.append({'docs': n, 'queries': len(queries), 'identical': identical, 'implementations': implementations})
+
+    return runs, mismatches
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark career recommendation scoring")
+    parser.add_argument('--scales', default='1k,10k,50k', help="Comma-separated job counts")
+    parser.add_argument('--queries', type=int, default=5, help="User skill sets per scale")
+    parser.add_argument('--top-k', type=int, default=10, help="Roles built in the top_k run")
+    parser.add_argument('--loop-max', default='100k', help="Largest scale the loop version runs at")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("⏱️ CAREER RECOMMENDER BENCHMARK")
+    print("="*60)
+
+    runs, mismatches = run_benchmark(
+        parse_scales(args.scales), args.queries, parse_scales(args.loop_max)[0], args.top_k, seed=args.seed
+    )
+    write_results('recommender', {
+        'seed': args.seed,
+        'top_k': args.top_k,
+        'runs': runs
+    })
+
+    if mismatches:
+        print(f"\n❌ Vectorized results differ from the loop at {mismatches} scale(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Job Search Benchmark
+Times building the SQLite FTS5 search index and ranked keyword queries
+(terms, title prefixes, filters) on synthetic postings
+
+Usage:
+    python benchmarks/bench_search.py --scales 10k,100k,1M --repeat 5
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from bench_utils import parse_scales, write_results
+from synthetic_corpus import generate_postings, load_vocabulary
+
+import search_index  # noqa: E402  (src is on sys.path after bench_utils)
+import utils  # noqa: E402
+
+# Query name -> (text, filters, title_only)
+QUERIES = {
+    'term': ('python', None, False),
+    'two_terms': ('data engineer', None, False),
+    'title_prefix': ('soft', None, True),
+    'filtered': ('sql', {'work_type': 'Remote'}, False),
+    'size_filtered': ('sql', {'company_size': '51-200'}, False),
+    'common_term': ('experience', None, False)
+}
+
+
+def index_frame(postings):
+    """Columns the index stores, derived from raw postings the way 01_ingest_clean does"""
+    return pd.DataFrame({
+        'job_ID': postings['job_ID'],
+        'job': postings['job'],
+        'job_details': postings['job_details'],
+        'company_name': postings['company_name'],
+        'city': postings['location'].str.split(',').str[0].str.strip(),
+        'work_type': postings['work_type'],
+        'job_category': None,
+        'experience_level': None,
+        'company_size_bucket': postings['no_of_employ'].map(
+            utils.company_size_table(postings['no_of_employ'].unique())['company_size_bucket'])
+    })
+
+
+def run_benchmark(scales, repeat, limit, seed=42):
+    """Build the index and time every query at every scale"""
+    vocab = load_vocabulary()
+    runs = []
+
+    for n in scales:
+        print(f"\n🧪 {n:,} synthetic postings, best {limit} per query")
+        df = index_frame(generate_postings(n, seed=seed, vocab=vocab))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / 'search_index.db'
+            start = time.perf_counter()
+            search_index.build_index(db_path, df)
+            build_seconds = time.perf_counter() - start
+            size_mb = db_path.stat().st_size / (1024 * 1024)
+            print(f"   {'build':.<30} {build_seconds:>9.3f}s {size_mb:>9.1f} MB")
+
+            queries = {}
+            conn = search_index.connect(db_path)
+            try:
+                for name, (text, filters, title_only) in QUERIES.items():
+                    timings = []
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        hits = search_index.search(conn, text, filters, limit=limit, title_only=title_only)
+                        timings.append(time.perf_counter() - start)
+                    # Every match scored, as before RANK_CANDIDATES bounded the ranking
+                    start = time.perf_counter()
+                    search_index.search(conn, text, filters, limit=limit, title_only=title_only, candidates=None)
+                    exact_seconds = time.perf_counter() - start
+                    matches = search_index.count(conn, text, filters, title_only=title_only)
+                    best_ms = min(timings) * 1000
+                    queries[name] = {
+                        'seconds': round(min(timings), 6),
+                        'exact_seconds': round(exact_seconds, 6),
+                        'matches': matches,
+                        'returned': len(hits)
+                    }
+                    print(f"   {name:.<30} {best_ms:>9.3f} ms {exact_seconds * 1000:>9.3f} ms exact "
+                          f"{matches:>10,} matches")
+            finally:
+                conn.close()
+
+        runs.append({
+            'docs': n,
+            'build_seconds': round(build_seconds, 4),
+            'index_mb': round(size_mb, 2),
+            'queries': queries
+        })
+
+    return runs
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark the full-text job search index")
+    parser.add_argument('--scales', default='10k,100k', help="Comma-separated posting counts")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per query (best is reported)")
+    parser.add_argument('--limit', type=int, default=20, help="Results per query")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("⏱️ JOB SEARCH BENCHMARK")
+    print("="*60)
+
+    runs = run_benchmark(parse_scales(args.scales), args.repeat, args.limit, seed=args.seed)
+    write_results('search', {
+        'seed': args.seed,
+        'limit': args.limit,
+        'runs': runs
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Job Similarity Benchmark
+Times building the similarity index and exact vs LSH top-k queries on
+synthetic postings, with the recall of the LSH results against exact search
+
+Usage:
+    python benchmarks/bench_similarity.py --scales 10k,100k --queries 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bench_recommender import generate_jobs
+from bench_utils import parse_scales, write_results
+from synthetic_corpus import generate_postings, load_vocabulary
+
+from similarity_index import SimilarityIndex  # noqa: E402  (src is on sys.path after bench_utils)
+from skill_bitset import SkillBitsets  # noqa: E402
+
+
+def time_queries(index, job_ids, k, **kwargs):
+    """Total wall time of index.similar over every job, and the result ID sets"""
+    start = time.perf_counter()
+    results = [set(index.similar(job_id, k, **kwargs)['job_ID']) for job_id in job_ids]
+    return time.perf_counter() - start, results
+
+
+def run_benchmark(scales, n_queries, k, lsh_bits, n_candidates, seed=42):
+    """Build the index and time queries at every scale"""
+    vocab = load_vocabulary()
+    rng = np.random.default_rng(seed)
+    runs = []
+
+    for n in scales:
+        print(f"\n🧪 {n:,} synthetic postings, {n_queries} queries, top {k}")
+        postings = generate_postings(n, seed=seed, vocab=vocab)
+        jobs = generate_jobs(n, seed=seed, vocab=vocab)
+        texts = postings['job'] + ' ' + postings['job_details']
+
+        start = time.perf_counter()
+        bitsets = SkillBitsets.from_lists(jobs['skills'], job_ids=jobs['job_ID'])
+        index = SimilarityIndex.build(texts, bitsets, lsh_bits=lsh_bits, seed=seed)
+        build_seconds = time.perf_counter() - start
+        print(f"   {'build':.<30} {build_seconds:>9.3f}s {len(index.vocab):>10,} terms")
+
+        job_ids = rng.choice(index.job_ids, size=min(n_queries, n), replace=False)
+        implementations = {}
+        exact_seconds, exact = time_queries(index, job_ids, k)
+        implementations['exact'] = {'seconds': round(exact_seconds, 4)}
+        lsh_seconds, approximate = time_queries(index, job_ids, k, approximate=True, n_candidates=n_candidates)
+        implementations[f'lsh[{lsh_bits} bits, {n_candidates} candidates]'] = {'seconds': round(lsh_seconds, 4)}
+        recall = float(np.mean([len(a & e) / max(len(e), 1) for a, e in zip(approximate, exact)]))
+
+        for name, stats in implementations.items():
+            stats['ms_per_query'] = round(stats['seconds'] / len(job_ids) * 1000, 3)
+            print(f"   {name:.<30} {stats['ms_per_query']:>9.3f} ms/query")
+        print(f"   {'LSH recall@' + str(k):.<30} {recall:>9.3f}")
+
+        runs.append({
+            'docs': n,
+            'queries': len(job_ids),
+            'build_seconds': round(build_seconds, 4),
+            'lsh_recall': round(recall, 4),
+            'implementations': implementations
+        })
+
+    return runs
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark the job similarity index")
+    parser.add_argument('--scales', default='10k,100k', help="Comma-separated posting counts")
+    parser.add_argument('--queries', type=int, default=50, help="Query jobs per scale")
+    parser.add_argument('--k', type=int, default=10, help="Neighbours per query")
+    parser.add_argument('--lsh-bits', type=int, default=256, help="Random-projection signature bits")
+    parser.add_argument('--candidates', type=int, default=1000, help="LSH candidates rescored per query")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("⏱️ JOB SIMILARITY BENCHMARK")
+    print("="*60)
+
+    runs = run_benchmark(
+        parse_scales(args.scales), args.queries, args.k, args.lsh_bits, args.candidates, seed=args.seed
+    )
+    write_results('similarity', {
+        'seed': args.seed,
+        'k': args.k,
+        'lsh_bits': args.lsh_bits,
+        'candidates': args.candidates,
+        'runs': runs
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark Helpers
+Shared helpers for loading pipeline stages and writing machine-readable results
+"""
+
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+ROOT_DIR = BENCH_DIR.parent
+SRC_DIR = ROOT_DIR / 'src'
+RESULTS_DIR = BENCH_DIR / 'results'
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
+
+
+def load_stage(module_name):
+    """Import a numbered pipeline script (e.g. '02_extract_skills') as a module"""
+    return importlib.import_module(module_name)
+
+
+def git_commit():
+    """Return the short commit hash of the working tree, if available"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def parse_scales(text):
+    """Parse '10k,100k,1M' style scale lists into integers"""
+    multipliers = {'k': 1_000, 'm': 1_000_000}
+    scales = []
+    for item in text.split(','):
+        item = item.strip().lower()
+        if item[-1] in multipliers:
+            scales.append(int(float(item[:-1]) * multipliers[item[-1]]))
+        else:
+            scales.append(int(item))
+    return scales
+
+
+def write_results(name, results, output_dir=RESULTS_DIR):
+    """Write a benchmark result document as JSON and return its path"""
+    commit = git_commit()
+    document = {
+        'benchmark': name,
+        'git_commit': commit,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        **results
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"{name}_{commit}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+
+    print(f"\n💾 Results saved to: {output_file}")
+    return output_file
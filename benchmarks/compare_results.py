@@ -0,0 +1,67 @@
+"""
+Benchmark Comparison
+Compares two benchmark result files and flags regressions
+
+Usage:
+    python benchmarks/compare_results.py results/base.json results/new.json --threshold 0.10
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def flatten_timings(document):
+    """Map (docs, name) -> seconds for any benchmark result document"""
+    timings = {}
+    for run in document.get('runs', []):
+        docs = run.get('docs')
+        for section in ('extractors', 'stages', 'implementations', 'queries'):
+            for name, stats in run.get(section, {}).items():
+                seconds = stats.get('seconds', stats.get('wall_seconds'))
+                if seconds is not None:
+                    timings[(docs, name)] = seconds
+    return timings
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument('base', type=Path, help="Baseline results JSON")
+    parser.add_argument('new', type=Path, help="New results JSON")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    with open(args.base, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+
+    base_timings = flatten_timings(base)
+    new_timings = flatten_timings(new)
+
+    print(f"📊 {base.get('git_commit')} → {new.get('git_commit')}\n")
+    print(f"   {'docs':>10} {'name':<25} {'base':>10} {'new':>10} {'change':>9}")
+
+    regressions = 0
+    for key in sorted(base_timings.keys() & new_timings.keys(), key=lambda k: (k[0] or 0, k[1])):
+        docs, name = key
+        old, cur = base_timings[key], new_timings[key]
+        change = (cur - old) / old if old else 0.0
+        flag = ''
+        if change > args.threshold:
+            flag = ' ⚠️'
+            regressions += 1
+        docs_label = f"{docs:,}" if docs is not None else '-'
+        print(f"   {docs_label:>10} {name:<25} {old:>9.3f}s {cur:>9.3f}s {change:>+8.1%}{flag}")
+
+    if regressions:
+        print(f"\n⚠️ {regressions} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Synthetic Corpus Generator
+Generates LinkedIn-style job postings for benchmarking, using the real skill
+vocabulary and distributions from data/processed/skills_extracted.csv
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add src directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+from config import (
+    SKILLS_CSV_FILE, ANALYTICS_JSON_FILE, CLEANED_CSV_FILE, RAW_DATA_DIR
+)
+
+# Description length (characters) used when no real descriptions are on disk:
+# log-normal with a median of ~2,500 characters, typical for LinkedIn postings
+DEFAULT_LENGTH_MEDIAN = 2500
+DEFAULT_LENGTH_SIGMA = 0.45
+
+FILLER_WORDS = [
+    "we", "are", "looking", "for", "a", "team", "to", "join", "our", "growing",
+    "the", "and", "with", "in", "of", "candidate", "will", "work", "on", "build",
+    "design", "develop", "maintain", "scalable", "solutions", "clients", "across",
+    "responsibilities", "include", "collaborate", "stakeholders", "deliver",
+    "quality", "software", "products", "strong", "communication", "skills",
+    "experience", "requirements", "good", "understanding", "knowledge", "ability",
+    "problem", "solving", "environment", "fast", "paced", "agile", "projects",
+    "business", "technical", "support", "customers", "ensure", "best", "practices",
+    "review", "code", "write", "documentation", "participate", "meetings",
+    "benefits", "competitive", "salary", "health", "insurance", "flexible", "hours"
+]
+
+WORK_TYPES = ["On-site", "Remote", "Hybrid", None]
+WORK_TYPE_WEIGHTS = [0.41, 0.38, 0.19, 0.02]
+
+EMPLOYEE_COUNTS = [
+    "1-10 employees", "11-50 employees", "51-200 employees", "201-500 employees",
+    "501-1,000 employees", "1,001-5,000 employees", "5,001-10,000 employees",
+    "10,001+ employees"
+]
+
+POSTED_AGO = ["2 hours", "9 hours", "1 day", "3 days", "5 days", "1 week",
+              "2 weeks", "3 weeks", "1 month", "2 months"]
+
+EXPERIENCE_PHRASES = ["{n}+ years of experience", "{n}-{m} years experience",
+                      "minimum {n} years", "{n} to {m} years of relevant experience"]
+
+CERT_PHRASES = ["AWS Certified", "Azure Certified", "PMP", "ITIL", "CISSP",
+                "Certified Scrum Master", "Salesforce Certified Administrator"]
+
+
+def load_vocabulary():
+    """Load skill, title, company and location distributions from real outputs"""
+    if not SKILLS_CSV_FILE.exists():
+        print(f"❌ Error: {SKILLS_CSV_FILE} not found!")
+        sys.exit(1)
+
+    skill_df = pd.read_csv(SKILLS_CSV_FILE)
+    jobs = skill_df.drop_duplicates('job_ID')
+
+    total_jobs = len(jobs)
+    if ANALYTICS_JSON_FILE.exists():
+        with open(ANALYTICS_JSON_FILE, 'r', encoding='utf-8') as f:
+            total_jobs = max(total_jobs, json.load(f)['metadata']['total_jobs'])
+
+    skills_per_job = skill_df.groupby('job_ID').size().value_counts()
+    # Jobs without any skill never appear in the mapping table
+    skills_per_job.loc[0] = total_jobs - len(jobs)
+
+    skill_freq = skill_df['skill'].value_counts()
+    title_freq = jobs['job_title'].value_counts()
+    company_freq = jobs['company_name'].value_counts()
+    location_freq = jobs['location'].value_counts()
+
+    lengths = None
+    if CLEANED_CSV_FILE.exists():
+        details = pd.read_csv(CLEANED_CSV_FILE, usecols=['job_details'])['job_details']
+        lengths = details.dropna().str.len().to_numpy()
+
+    return {
+        'skills': (skill_freq.index.to_numpy(), _weights(skill_freq)),
+        'skills_per_job': (skills_per_job.index.to_numpy(), _weights(skills_per_job)),
+        'titles': (title_freq.index.to_numpy(), _weights(title_freq)),
+        'companies': (company_freq.index.to_numpy(), _weights(company_freq)),
+        'locations': (location_freq.index.to_numpy(), _weights(location_freq)),
+        'lengths': lengths
+    }
+
+
+def _weights(counts):
+    """Normalize a value_counts Series into sampling probabilities"""
+    values = counts.to_numpy(dtype=float)
+    return values / values.sum()
+
+
+def _sample(rng, vocab, n):
+    values, weights = vocab
+    return values[rng.choice(len(values), size=n, p=weights)]
+
+
+def generate_postings(n, seed=42, vocab=None):
+    """
+    Generate n synthetic postings with the raw LinkedIn CSV schema
+
+    Args:
+        n: Number of postings
+        seed: Random seed (same seed, same corpus)
+        vocab: Output of load_vocabulary(), loaded if not given
+
+    Returns:
+        DataFrame with the columns 01_ingest_clean.py expects
+    """
+    rng = np.random.default_rng(seed)
+    vocab = vocab or load_vocabulary()
+
+    # Description lengths follow the real distribution when available
+    if vocab['lengths'] is not None and len(vocab['lengths']) > 0:
+        lengths = rng.choice(vocab['lengths'], size=n)
+    else:
+        lengths = rng.lognormal(np.log(DEFAULT_LENGTH_MEDIAN), DEFAULT_LENGTH_SIGMA, size=n)
+    lengths = np.clip(lengths, 200, 20000).astype(int)
+
+    # One long filler text; each description is a slice of it
+    filler = ' '.join(rng.choice(FILLER_WORDS, size=200_000))
+    offsets = rng.integers(0, len(filler) - 20_001, size=n)
+
+    skill_counts = _sample(rng, vocab['skills_per_job'], n)
+    skill_names, skill_weights = vocab['skills']
+    all_skills = skill_names[rng.choice(len(skill_names), size=int(skill_counts.sum()), p=skill_weights)]
+    skill_bounds = np.concatenate([[0], np.cumsum(skill_counts)])
+
+    exp_years = rng.integers(1, 12, size=n)
+    has_exp = rng.random(n) < 0.6
+    exp_phrase = rng.integers(0, len(EXPERIENCE_PHRASES), size=n)
+    has_cert = rng.random(n) < 0.05
+    cert_idx = rng.integers(0, len(CERT_PHRASES), size=n)
+
+    details = []
+    for i in range(n):
+        body = filler[offsets[i]:offsets[i] + lengths[i]]
+        half = len(body) // 2
+        parts = [body[:half]]
+        skills = all_skills[skill_bounds[i]:skill_bounds[i + 1]]
+        if len(skills):
+            parts.append('. Required skills: ' + ', '.join(skills) + '. ')
+        if has_exp[i]:
+            parts.append(EXPERIENCE_PHRASES[exp_phrase[i]].format(n=exp_years[i], m=exp_years[i] + 3) + '. ')
+        if has_cert[i]:
+            parts.append(CERT_PHRASES[cert_idx[i]] + ' preferred. ')
+        parts.append(body[half:])
+        details.append(''.join(parts))
+
+    return pd.DataFrame({
+        'job_ID': np.arange(1, n + 1) + 3_000_000_000,
+        'job': _sample(rng, vocab['titles'], n),
+        'location': _sample(rng, vocab['locations'], n),
+        'company_id': np.nan,
+        'company_name': _sample(rng, vocab['companies'], n),
+        'work_type': rng.choice(np.array(WORK_TYPES, dtype=object), size=n, p=WORK_TYPE_WEIGHTS),
+        'full_time_remote': np.where(rng.random(n) < 0.9, 'Full-time', 'Contract'),
+        'no_of_employ': rng.choice(EMPLOYEE_COUNTS, size=n),
+        'no_of_application': rng.integers(0, 500, size=n),
+        'posted_day_ago': rng.choice(POSTED_AGO, size=n),
+        'job_details': details
+    })
+
+
+def main():
+    """Write a synthetic raw CSV for manual pipeline runs"""
+    parser = argparse.ArgumentParser(description="Generate synthetic LinkedIn job postings")
+    parser.add_argument('--rows', type=int, default=10_000, help="Number of postings")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    parser.add_argument('--output', type=Path,
+                        default=RAW_DATA_DIR / 'synthetic_jobs.csv',
+                        help="Output CSV path")
+    args = parser.parse_args()
+
+    print(f"🧪 Generating {args.rows:,} synthetic postings...")
+    df = generate_postings(args.rows, seed=args.seed)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(args.output, index=False, encoding='utf-8')
+    print(f"✅ Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,15 @@ import sys
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 from config import (
-    RAW_CSV_FILE, CLEANED_CSV_FILE, PROCESSED_DATA_DIR,
-    MIN_JOB_TITLE_LENGTH
+    RAW_CSV_FILE, CLEANED_CSV_FILE, PROCESSED_DATA_DIR, TITLE_MAPPING_FILE, COMPANY_CACHE_FILE,
+    GAZETTEER_FILE, LOCATION_CACHE_FILE,
+    MIN_JOB_TITLE_LENGTH, TITLE_CLUSTER_THRESHOLD
 )
+from company_resolver import CompanyResolver
+from location_resolver import Gazetteer, LocationResolver
+from logger import log_execution_time
+from title_normalizer import build_title_mapping
+from utils import write_data_version, company_size_table
 
 def load_data():
     """Load raw CSV data with proper encoding"""
@@ -28,6 +34,7 @@ def load_data():
         print(f"✅ Loaded {len(df):,} records (latin-1 encoding)")
         return df
 
+@log_execution_time
 def clean_job_titles(df):
     """Clean and standardize job titles"""
     print("\n🔧 Cleaning job titles...")
@@ -45,6 +52,7 @@ def clean_job_titles(df):
     print(f"   Removed {initial_count - len(df):,} invalid job titles")
     return df
 
+@log_execution_time
 def clean_locations(df):
     """Standardize location data"""
     print("\n🌍 Cleaning locations...")
@@ -55,29 +63,34 @@ def clean_locations(df):
     # Standardize location format
     df['location'] = df['location'].str.strip()
     
-    # Extract city and state
-    def parse_location(loc):
-        if pd.isna(loc) or loc == 'Unknown':
-            return 'Unknown', 'Unknown', 'Unknown'
-        
-        parts = [p.strip() for p in str(loc).split(',')]
-        
-        if len(parts) >= 3:
-            return parts[0], parts[1], parts[2]  # City, State, Country
-        elif len(parts) == 2:
-            return parts[0], parts[1], 'India'
-        elif len(parts) == 1:
-            return parts[0], 'Unknown', 'India'
-        else:
-            return 'Unknown', 'Unknown', 'Unknown'
+    # Resolve city, state and country against the gazetteer, once per distinct location
+    resolver = LocationResolver(GAZETTEER_FILE, LOCATION_CACHE_FILE)
+    resolved, new_locations = resolver.resolve_all(df['location'])
+    resolver.save()
     
-    df[['city', 'state', 'country']] = df['location'].apply(
-        lambda x: pd.Series(parse_location(x))
-    )
+    parsed = pd.DataFrame.from_dict(resolved, orient='index', columns=['city', 'state', 'country'])
+    df[['city', 'state', 'country']] = parsed.reindex(df['location']).to_numpy()
     
+    print(f"   {len(resolved):,} distinct locations ({new_locations:,} newly resolved, "
+          f"{len(resolved) - new_locations:,} from cache)")
     print(f"   Parsed {df['city'].nunique()} unique cities")
     return df
 
+@log_execution_time
+def normalize_titles(df):
+    """Map job titles to canonical roles (noise stripped, near-duplicates merged)"""
+    print("\n🏷️ Normalizing job titles...")
+    
+    # Place names and their aliases are stripped from titles ("Data Engineer (Bangalore)")
+    locations = set(df['city']) | set(df['state']) | Gazetteer.load(GAZETTEER_FILE).names
+    mapping = build_title_mapping(df['job'], locations, threshold=TITLE_CLUSTER_THRESHOLD)
+    
+    df['canonical_role'] = df['job'].map(mapping.set_index('job')['canonical_role'])
+    
+    print(f"   {len(mapping):,} distinct titles -> {mapping['canonical_role'].nunique():,} canonical roles")
+    return df, mapping
+
+@log_execution_time
 def clean_work_type(df):
     """Standardize work type field"""
     print("\n💼 Cleaning work types...")
@@ -103,6 +116,7 @@ def clean_work_type(df):
     print(df['work_type'].value_counts().to_string())
     return df
 
+@log_execution_time
 def clean_company_data(df):
     """Clean company-related fields"""
     print("\n🏢 Cleaning company data...")
@@ -111,12 +125,35 @@ def clean_company_data(df):
     df['company_name'] = df['company_name'].fillna('Unknown Company')
     df['company_name'] = df['company_name'].str.strip()
     
+    # Merge spelling, suffix and initialism variants ("TCS", "Tata Consultancy Services Ltd")
+    df['company_name_raw'] = df['company_name']
+    resolver = CompanyResolver.load(COMPANY_CACHE_FILE)
+    name_counts = df['company_name'].value_counts().to_dict()
+    new_names = len(resolver.unseen(name_counts))
+    df['company_name'] = df['company_name'].map(resolver.resolve(name_counts))
+    resolver.save(COMPANY_CACHE_FILE)
+    print(f"   {len(name_counts):,} company names ({new_names:,} newly resolved, "
+          f"{len(name_counts) - new_names:,} from cache)")
+    
     # Clean employee count
     df['no_of_employ'] = df['no_of_employ'].fillna('Not Specified')
     
     print(f"   {df['company_name'].nunique()} unique companies")
     return df
 
+@log_execution_time
+def parse_company_sizes(df):
+    """Numeric company size and size bucket from the employee-count ranges"""
+    print("\n🏭 Parsing company sizes...")
+    
+    # A handful of distinct range strings, each parsed once and mapped onto the postings
+    sizes = company_size_table(df['no_of_employ'].unique())
+    df['company_size'] = df['no_of_employ'].map(sizes['company_size']).fillna(0).astype(int)
+    df['company_size_bucket'] = df['no_of_employ'].map(sizes['company_size_bucket'])
+    
+    print(f"   {len(sizes)} distinct employee counts -> {sizes['company_size_bucket'].nunique()} size buckets")
+    return df
+
 def parse_numeric_fields(df):
     """Parse and clean numeric fields"""
     print("\n🔢 Parsing numeric fields...")
@@ -168,6 +205,7 @@ def remove_duplicates(df):
     
     return df
 
+@log_execution_time
 def create_additional_features(df):
     """Create additional useful features"""
     print("\n✨ Creating additional features...")
@@ -208,6 +246,7 @@ def generate_summary_stats(df):
     print(f"✅ Unique Companies: {df['company_name'].nunique():,}")
     print(f"✅ Unique Locations: {df['location'].nunique():,}")
     print(f"✅ Unique Job Titles: {df['job'].nunique():,}")
+    print(f"✅ Canonical Roles: {df['canonical_role'].nunique():,}")
     
     print(f"\n📍 Top 5 Cities:")
     print(df['city'].value_counts().head().to_string())
@@ -231,8 +270,8 @@ def generate_summary_stats(df):
     
     print("\n" + "="*60)
 
-def save_cleaned_data(df):
-    """Save cleaned data to CSV"""
+def save_cleaned_data(df, title_mapping):
+    """Save cleaned data and the title mapping to CSV"""
     print(f"\n💾 Saving cleaned data...")
     
     # Ensure output directory exists
@@ -243,6 +282,15 @@ def save_cleaned_data(df):
     
     print(f"✅ Saved to: {CLEANED_CSV_FILE}")
     print(f"   {len(df):,} records × {len(df.columns)} columns")
+    
+    title_mapping.to_csv(TITLE_MAPPING_FILE, index=False, encoding='utf-8')
+    print(f"✅ Title mapping saved to: {TITLE_MAPPING_FILE}")
+    
+    version = write_data_version('01_ingest_clean', {
+        CLEANED_CSV_FILE: len(df),
+        TITLE_MAPPING_FILE: len(title_mapping)
+    })
+    print(f"✅ Data version: {version}")
 
 def main():
     """Main execution function"""
@@ -258,15 +306,17 @@ def main():
     df = clean_locations(df)
     df = clean_work_type(df)
     df = clean_company_data(df)
+    df = parse_company_sizes(df)
     df = parse_numeric_fields(df)
     df = remove_duplicates(df)
+    df, title_mapping = normalize_titles(df)
     df = create_additional_features(df)
     
     # Generate summary
     generate_summary_stats(df)
     
     # Save cleaned data
-    save_cleaned_data(df)
+    save_cleaned_data(df, title_mapping)
     
     print("\n✅ Data cleaning completed successfully!")
     print("="*60 + "\n")
@@ -5,6 +5,7 @@ Extracts technical skills, certifications, and job categories from job descripti
 
 import pandas as pd
 import re
+import importlib.util
 from pathlib import Path
 from collections import Counter
 import sys
@@ -12,9 +13,15 @@ import sys
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 from config import (
-    CLEANED_CSV_FILE, SKILLS_CSV_FILE, PROCESSED_DATA_DIR,
-    SKILL_CATEGORIES, JOB_CATEGORIES, MIN_SKILL_FREQUENCY
+    CLEANED_CSV_FILE, SKILLS_CSV_FILE, PROCESSED_DATA_DIR, JOBS_PARQUET_FILE, SKILL_BITSETS_FILE,
+    SKILL_CATEGORIES, JOB_CATEGORIES, MIN_SKILL_FREQUENCY,
+    SKILL_EXTRACTION_BACKEND
 )
+from logger import log_execution_time
+from skill_model import SkillModel
+from skill_bitset import SkillBitsets
+from utils import write_data_version
+import nlp_backend
 
 def load_cleaned_data():
     """Load cleaned data from previous step"""
@@ -30,54 +37,26 @@ def load_cleaned_data():
     return df
 
 def build_skill_dictionary():
-    """Build comprehensive skill dictionary from config"""
+    """Build the skill model (canonical skills, aliases, category masks) from config"""
     print("\n📚 Building skill dictionary...")
     
-    all_skills = {}
+    skill_model = SkillModel(SKILL_CATEGORIES)
     
-    for category, skills in SKILL_CATEGORIES.items():
-        for skill in skills:
-            # Add skill and common variations
-            all_skills[skill.lower()] = {
-                'name': skill,
-                'category': category
-            }
-            
-            # Add variations
-            variations = [
-                skill.lower(),
-                skill.replace('.', ''),
-                skill.replace(' ', ''),
-                skill.replace('-', '')
-            ]
-            
-            for var in variations:
-                if var and var not in all_skills:
-                    all_skills[var] = {
-                        'name': skill,
-                        'category': category
-                    }
-    
-    print(f"   Built dictionary with {len(set(s['name'] for s in all_skills.values()))} unique skills")
-    return all_skills
+    multi_category = [
+        skill for skill, mask in zip(skill_model.skills, skill_model.skill_masks)
+        if mask & (mask - 1)
+    ]
+    
+    print(f"   Built dictionary with {skill_model.num_skills} unique skills "
+          f"({len(skill_model.alias_to_id)} aliases, {len(skill_model.categories)} categories)")
+    if multi_category:
+        print(f"   Multi-category skills: {', '.join(multi_category)}")
+    return skill_model
 
 def extract_skills_from_text(text, skill_dict):
     """Extract skills from job description text"""
-    if pd.isna(text):
-        return []
-    
-    text_lower = str(text).lower()
-    found_skills = set()
-    
-    # Search for each skill
-    for skill_key, skill_info in skill_dict.items():
-        # Use word boundaries for better matching
-        pattern = r'\b' + re.escape(skill_key) + r'\b'
-        
-        if re.search(pattern, text_lower):
-            found_skills.add(skill_info['name'])
-    
-    return list(found_skills)
+    skill_ids, _ = skill_dict.match(text)
+    return skill_dict.names(skill_ids)
 
 def categorize_job_role(title):
     """Categorize job based on title"""
@@ -148,14 +127,28 @@ def extract_experience_years(text, title):
     
     return None
 
+def match_skills(texts, skill_dict, backend=SKILL_EXTRACTION_BACKEND):
+    """Run the configured extraction backend, returning (skill IDs, mask) per text"""
+    if backend == 'spacy':
+        if nlp_backend.is_available():
+            print("   Using spaCy PhraseMatcher backend")
+            return pd.Series(
+                nlp_backend.extract_skills_batch(texts, skill_dict),
+                index=texts.index
+            )
+        print("   ⚠️ spaCy not installed, falling back to regex backend")
+    
+    return texts.apply(skill_dict.match)
+
+@log_execution_time
 def analyze_skills(df, skill_dict):
     """Perform skill extraction and analysis"""
     print("\n🔍 Extracting skills from job descriptions...")
     
-    # Extract skills
-    df['skills'] = df['job_details'].apply(
-        lambda x: extract_skills_from_text(x, skill_dict)
-    )
+    # Extract skills and category bitmasks in a single scan per description
+    matches = match_skills(df['job_details'], skill_dict)
+    df['skills'] = matches.apply(lambda m: skill_dict.names(m[0]))
+    df['skill_category_mask'] = matches.apply(lambda m: m[1]).astype('int64')
     
     # Count skills per job
     df['skill_count'] = df['skills'].apply(len)
@@ -177,7 +170,7 @@ def analyze_skills(df, skill_dict):
     
     return df
 
-def generate_skill_statistics(df):
+def generate_skill_statistics(df, skill_dict):
     """Generate statistics about skills"""
     print("\n📊 Generating skill statistics...")
     
@@ -194,6 +187,12 @@ def generate_skill_statistics(df):
         percentage = (count / len(df)) * 100
         print(f"   {skill:.<30} {count:>5} ({percentage:>5.1f}%)")
     
+    # Skill category coverage (read straight from the bitmasks)
+    print(f"\n🧩 Jobs per Skill Category:")
+    category_counts = skill_dict.category_counts(df['skill_category_mask'])
+    for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
+        print(f"   {category:.<30} {count:>5}")
+    
     # Job category distribution
     print(f"\n📋 Job Category Distribution:")
     print(df['job_category'].value_counts().head(10).to_string())
@@ -217,6 +216,7 @@ def generate_skill_statistics(df):
         print(f"   Median: {exp_data.median():.1f} years")
         print(f"   Range: {exp_data.min():.0f} - {exp_data.max():.0f} years")
 
+@log_execution_time
 def create_skill_mapping_table(df):
     """Create a separate table for skill mappings"""
     print("\n🗂️ Creating skill mapping table...")
@@ -242,7 +242,7 @@ def create_skill_mapping_table(df):
     
     return skill_df
 
-def save_results(df, skill_mapping_df):
+def save_results(df, skill_mapping_df, skill_dict):
     """Save extraction results"""
     print(f"\n💾 Saving results...")
     
@@ -263,6 +263,30 @@ def save_results(df, skill_mapping_df):
     skill_mapping_df.to_csv(SKILLS_CSV_FILE, index=False, encoding='utf-8')
     print(f"✅ Saved skill mappings: {SKILLS_CSV_FILE}")
     
+    # Skill sets packed over the skill model's IDs, for set operations downstream
+    bitsets = SkillBitsets.from_lists(df['skills'], skill_dict.skills, df['job_ID'])
+    bitsets.save(SKILL_BITSETS_FILE)
+    print(f"✅ Saved skill bitsets: {SKILL_BITSETS_FILE} ({bitsets.bits.shape[1]} words/job)")
+    
+    artifacts = {
+        skills_file: len(df_to_save),
+        SKILLS_CSV_FILE: len(skill_mapping_df),
+        SKILL_BITSETS_FILE: len(bitsets)
+    }
+    
+    # Columnar copy for the DuckDB analytics backend (skills stay list columns)
+    if importlib.util.find_spec('pyarrow') is not None:
+        df.to_parquet(JOBS_PARQUET_FILE, index=False)
+        artifacts[JOBS_PARQUET_FILE] = len(df)
+        print(f"✅ Saved Parquet copy: {JOBS_PARQUET_FILE}")
+    else:
+        # A stale copy would shadow the fresh CSV
+        JOBS_PARQUET_FILE.unlink(missing_ok=True)
+    
+    # Tell the dashboard new data is available
+    version = write_data_version('02_extract_skills', artifacts)
+    print(f"✅ Data version: {version}")
+    
     print(f"   {len(df):,} jobs × {len(df.columns)} columns")
     print(f"   {len(skill_mapping_df):,} skill mappings")
 
@@ -282,13 +306,13 @@ def main():
     df = analyze_skills(df, skill_dict)
     
     # Generate statistics
-    generate_skill_statistics(df)
+    generate_skill_statistics(df, skill_dict)
     
     # Create skill mapping table
     skill_mapping_df = create_skill_mapping_table(df)
     
     # Save results
-    save_results(df, skill_mapping_df)
+    save_results(df, skill_mapping_df, skill_dict)
     
     print("\n✅ Skill extraction completed successfully!")
     print("="*60 + "\n")
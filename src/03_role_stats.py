@@ -4,6 +4,7 @@ Generates comprehensive statistics and analytics from processed job data
 """
 
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 from collections import Counter
@@ -13,11 +14,28 @@ import sys
 sys.path.append(str(Path(__file__).parent))
 from config import (
     SKILLS_CSV_FILE, ANALYTICS_JSON_FILE, PROCESSED_DATA_DIR,
-    TOP_N_ROLES, TOP_N_SKILLS, TOP_N_COMPANIES, TOP_N_LOCATIONS
+    TOP_N_ROLES, TOP_N_SKILLS, TOP_N_COMPANIES, TOP_N_LOCATIONS,
+    SKILL_CATEGORIES, SKILL_TRENDS_JSON_FILE, TREND_WINDOW_DAYS, TREND_STABLE_PCT,
+    TREND_MIN_JOBS, TOP_N_SUPPLY_SKILLS, SNAPSHOT_DB_FILE, SNAPSHOT_DATE,
+    ANALYTICS_BACKEND, STATIC_API_EXPORT, API_DIR, API_VERSION,
+    SKILL_BITSETS_FILE, TOP_N_COOCCURRENCE_SKILLS, TOP_N_SKILL_PAIRS
 )
+from logger import log_execution_time
+from skill_model import SkillModel
+from skill_bitset import SkillBitsets, transpose, pairwise_intersections
+from skill_trends import compute_skill_trends, compute_skill_supply
+from utils import (
+    write_data_version, read_data_manifest, role_column, ensure_company_size_bucket, company_size_order
+)
+import snapshot_store
+import duckdb_backend
+import static_api
+
+# Columns trends and history still read into pandas when analytics run in DuckDB
+LIGHT_COLUMNS = ['job_ID', 'job', 'canonical_role', 'work_type', 'no_of_application', 'days_since_posted', 'skills']
 
-def load_processed_data():
-    """Load processed data from previous steps"""
+def load_processed_data(columns=None):
+    """Load processed data from previous steps (optionally only some columns)"""
     print("📂 Loading processed data...")
     
     jobs_file = PROCESSED_DATA_DIR / 'jobs_with_skills.csv'
@@ -27,11 +45,13 @@ def load_processed_data():
         print(f"   Please run 01_ingest_clean.py and 02_extract_skills.py first")
         sys.exit(1)
     
-    df = pd.read_csv(jobs_file)
+    # Columns missing from older processed data (e.g. canonical_role) are skipped
+    df = pd.read_csv(jobs_file, usecols=(lambda c: c in columns) if columns else None)
     
     # Convert pipe-separated skills back to lists
     df['skills'] = df['skills'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
-    df['certifications'] = df['certifications'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
+    if 'certifications' in df.columns:
+        df['certifications'] = df['certifications'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
     
     print(f"✅ Loaded {len(df):,} records")
     
@@ -43,14 +63,18 @@ def load_processed_data():
     
     return df, skill_df
 
+@log_execution_time
 def analyze_top_roles(df):
     """Analyze top job roles"""
     print("\n📊 Analyzing top roles...")
     
-    top_roles = df['job'].value_counts().head(TOP_N_ROLES)
+    # Canonical roles merge title variants ("Sr. Data Engineer - WFH" -> "Data Engineer")
+    roles = df[role_column(df)]
+    top_roles = roles.value_counts().head(TOP_N_ROLES)
     
     results = {
-        'total_unique_roles': df['job'].nunique(),
+        'total_unique_roles': roles.nunique(),
+        'total_unique_titles': df['job'].nunique(),
         'top_roles': [
             {
                 'role': role,
@@ -61,13 +85,15 @@ def analyze_top_roles(df):
         ]
     }
     
-    print(f"   Found {results['total_unique_roles']:,} unique roles")
+    print(f"   Found {results['total_unique_roles']:,} unique roles "
+          f"({results['total_unique_titles']:,} distinct titles)")
     print(f"\n   Top {TOP_N_ROLES} Roles:")
     for item in results['top_roles'][:10]:
         print(f"   {item['role']:.<50} {item['count']:>5} ({item['percentage']:>5.1f}%)")
     
     return results
 
+@log_execution_time
 def analyze_top_skills(df, skill_df):
     """Analyze most demanded skills"""
     print("\n🔥 Analyzing top skills...")
@@ -102,6 +128,36 @@ def analyze_top_skills(df, skill_df):
     
     return results
 
+@log_execution_time
+def analyze_skill_categories(df):
+    """Analyze how many jobs need at least one skill from each skill category"""
+    print("\n🧩 Analyzing skill categories...")
+    
+    if 'skill_category_mask' not in df.columns:
+        print("   ⚠️ skill_category_mask not found, re-run 02_extract_skills.py")
+        return {'distribution': []}
+    
+    skill_model = SkillModel(SKILL_CATEGORIES)
+    category_counts = skill_model.category_counts(df['skill_category_mask'].fillna(0))
+    
+    results = {
+        'distribution': [
+            {
+                'category': category,
+                'count': count,
+                'percentage': round((count / len(df)) * 100, 2)
+            }
+            for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
+        ]
+    }
+    
+    print(f"\n   Jobs per Skill Category:")
+    for item in results['distribution']:
+        print(f"   {item['category']:.<30} {item['count']:>5} ({item['percentage']:>5.1f}%)")
+    
+    return results
+
+@log_execution_time
 def analyze_companies(df):
     """Analyze top hiring companies"""
     print("\n🏢 Analyzing companies...")
@@ -135,6 +191,7 @@ def analyze_companies(df):
     
     return results
 
+@log_execution_time
 def analyze_locations(df):
     """Analyze geographic distribution"""
     print("\n🌍 Analyzing locations...")
@@ -168,6 +225,7 @@ def analyze_locations(df):
     
     return results
 
+@log_execution_time
 def analyze_work_types(df):
     """Analyze work type distribution"""
     print("\n💼 Analyzing work types...")
@@ -191,6 +249,44 @@ def analyze_work_types(df):
     
     return results
 
+@log_execution_time
+def analyze_company_sizes(df):
+    """Analyze postings by company size bucket"""
+    print("\n🏭 Analyzing company sizes...")
+    
+    buckets = ensure_company_size_bucket(df)['company_size_bucket']
+    order = company_size_order()
+    size_stats = df.groupby(buckets.fillna(order[-1]).rename('bucket')).agg(
+        count=('job_ID', 'count'),
+        companies=('company_name', 'nunique'),
+        avg_applications=('no_of_application', 'mean')
+    )
+    
+    # Smallest companies first, as the buckets are ordered
+    size_stats = size_stats.reindex([b for b in order if b in size_stats.index] +
+                                    [b for b in size_stats.index if b not in order])
+    
+    results = {
+        'distribution': [
+            {
+                'bucket': bucket,
+                'count': int(row['count']),
+                'percentage': round((row['count'] / len(df)) * 100, 2),
+                'companies': int(row['companies']),
+                'avg_applications': round(row['avg_applications'], 1) if pd.notna(row['avg_applications']) else None
+            }
+            for bucket, row in size_stats.iterrows()
+        ]
+    }
+    
+    print(f"\n   Company Size Distribution:")
+    for item in results['distribution']:
+        print(f"   {item['bucket']:.<20} {item['count']:>5} ({item['percentage']:>5.1f}%) "
+              f"{item['companies']:>5} companies")
+    
+    return results
+
+@log_execution_time
 def analyze_job_categories(df):
     """Analyze job category distribution"""
     print("\n📋 Analyzing job categories...")
@@ -216,6 +312,7 @@ def analyze_job_categories(df):
     
     return results
 
+@log_execution_time
 def analyze_experience_levels(df):
     """Analyze experience level distribution"""
     print("\n📈 Analyzing experience levels...")
@@ -253,6 +350,68 @@ def analyze_experience_levels(df):
     
     return results
 
+@log_execution_time
+def analyze_skill_cooccurrence(bitsets):
+    """Find the skill pairs most often required together, via bitset intersections"""
+    print("\n🔗 Analyzing skill co-occurrence...")
+    
+    total_jobs = len(bitsets)
+    counts = bitsets.skill_counts()
+    # Most demanded skills, ties by name
+    top = sorted(np.flatnonzero(counts), key=lambda i: (-counts[i], bitsets.vocab[i]))[:TOP_N_COOCCURRENCE_SKILLS]
+    
+    # One job set per skill; |A ∩ B| is AND + popcount over the job bits
+    together = pairwise_intersections(transpose(bitsets.bits, top))
+    
+    pairs = []
+    for a in range(len(top)):
+        for b in range(a + 1, len(top)):
+            both = int(together[a, b])
+            if both == 0:
+                continue
+            n_a, n_b = int(together[a, a]), int(together[b, b])
+            pairs.append({
+                'skills': sorted([bitsets.vocab[top[a]], bitsets.vocab[top[b]]]),
+                'jobs': both,
+                'jaccard': round(both / (n_a + n_b - both), 3),
+                'lift': round(both * total_jobs / (n_a * n_b), 2)
+            })
+    pairs.sort(key=lambda p: (-p['jobs'], p['skills']))
+    
+    results = {
+        'skills_analyzed': len(top),
+        'pairs': pairs[:TOP_N_SKILL_PAIRS]
+    }
+    
+    print(f"   Top skill pairs (of {len(top)} most demanded skills):")
+    for item in results['pairs'][:10]:
+        print(f"   {' + '.join(item['skills']):.<40} {item['jobs']:>5} (lift {item['lift']:.2f})")
+    
+    return results
+
+@log_execution_time
+def analyze_skill_trends(df):
+    """Compute skill velocity/acceleration across posting-age windows"""
+    print("\n📈 Analyzing skill trends...")
+    
+    trends = compute_skill_trends(
+        df, TREND_WINDOW_DAYS,
+        min_count=TREND_MIN_JOBS, stable_pct=TREND_STABLE_PCT
+    )
+    trends['generation_date'] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+    trends['supply_demand'] = compute_skill_supply(df, top_n=TOP_N_SUPPLY_SKILLS)
+    
+    windows = ', '.join(f"{w['label']}: {w['jobs']:,}" for w in trends['windows'])
+    print(f"   Jobs per window: {windows}")
+    
+    rising = [s for s in trends['skills'] if s['trend'] == 'up']
+    print(f"\n   Fastest rising skills:")
+    for item in rising[:5]:
+        print(f"   {item['skill']:.<30} {item['velocity']:>+7.1f}% ({item['demand']:,} jobs)")
+    
+    return trends
+
+@log_execution_time
 def create_summary_analytics(df, skill_df):
     """Create comprehensive analytics summary"""
     print("\n" + "="*60)
@@ -267,15 +426,32 @@ def create_summary_analytics(df, skill_df):
         },
         'roles': analyze_top_roles(df),
         'skills': analyze_top_skills(df, skill_df),
+        'skill_categories': analyze_skill_categories(df),
         'companies': analyze_companies(df),
         'locations': analyze_locations(df),
         'work_types': analyze_work_types(df),
+        'company_sizes': analyze_company_sizes(df),
         'job_categories': analyze_job_categories(df),
         'experience': analyze_experience_levels(df)
     }
     
     return analytics
 
+@log_execution_time
+def create_summary_analytics_duckdb():
+    """Create the analytics summary with every aggregation run as DuckDB SQL"""
+    print("\n" + "="*60)
+    print("📊 GENERATING COMPREHENSIVE ANALYTICS (DuckDB)")
+    print("="*60)
+    
+    analytics = duckdb_backend.create_summary_analytics()
+    
+    print(f"   {analytics['metadata']['total_jobs']:,} jobs, "
+          f"{analytics['roles']['total_unique_roles']:,} roles, "
+          f"{analytics['skills']['total_unique_skills']:,} skills, "
+          f"{analytics['companies']['total_companies']:,} companies")
+    return analytics
+
 def save_analytics(analytics):
     """Save analytics to JSON file"""
     print(f"\n💾 Saving analytics...")
@@ -289,24 +465,114 @@ def save_analytics(analytics):
     
     print(f"✅ Saved analytics to: {ANALYTICS_JSON_FILE}")
     
+    # Tell the dashboard new data is available
+    version = write_data_version('03_role_stats', {
+        ANALYTICS_JSON_FILE: analytics['metadata']['total_jobs']
+    })
+    print(f"✅ Data version: {version}")
+    
     # Calculate file size
     file_size = ANALYTICS_JSON_FILE.stat().st_size
     print(f"   File size: {file_size:,} bytes ({file_size/1024:.1f} KB)")
 
+def save_skill_trends(trends):
+    """Save skill trends to JSON file"""
+    with open(SKILL_TRENDS_JSON_FILE, 'w', encoding='utf-8') as f:
+        json.dump(trends, f, indent=2, ensure_ascii=False)
+    
+    print(f"✅ Saved skill trends to: {SKILL_TRENDS_JSON_FILE}")
+    
+    version = write_data_version('03_role_stats', {
+        SKILL_TRENDS_JSON_FILE: len(trends['skills'])
+    })
+    print(f"✅ Data version: {version}")
+
+@log_execution_time
+def export_static_api(df, analytics):
+    """Write the sharded static API, rewriting only shards whose content changed"""
+    print(f"\n🗂️ Exporting static API...")
+    
+    stats = static_api.export_static_api(df, analytics, data_version=read_data_manifest().get('version'))
+    print(f"✅ Static API in {API_DIR / API_VERSION}: {stats['written']} written, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed")
+    return stats
+
+@log_execution_time
+def record_snapshot(df, analytics):
+    """Append this run's aggregates and skill/role counts to the history store"""
+    print(f"\n🗄️ Recording history snapshot...")
+    
+    snapshot_date = SNAPSHOT_DATE or pd.Timestamp.now().strftime('%Y-%m-%d')
+    metrics = {
+        'total_jobs': len(df),
+        'total_companies': analytics['companies']['total_companies'],
+        'total_locations': analytics['locations']['total_locations'],
+        'unique_skills': analytics['skills']['total_unique_skills'],
+        'remote_jobs': int((df['work_type'] == 'Remote').sum()),
+        'avg_applications': float(df['no_of_application'].mean())
+    }
+    skill_counts = df['skills'].explode().dropna().value_counts()
+    role_counts = df[role_column(df)].value_counts()
+    
+    # The jobs table's content hash identifies the input; the same input is stored once
+    source_hash = read_data_manifest().get('artifacts', {}).get('jobs_with_skills.csv', {}).get('sha256')
+    
+    conn = snapshot_store.connect(SNAPSHOT_DB_FILE)
+    try:
+        snapshot_id = snapshot_store.append_snapshot(
+            conn, snapshot_date, metrics,
+            skill_counts.to_dict(), role_counts.to_dict(),
+            source_hash=source_hash
+        )
+        total = conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+    finally:
+        conn.close()
+    
+    if snapshot_id is None:
+        print(f"   Data unchanged since the last snapshot, nothing added")
+    else:
+        print(f"✅ Snapshot #{snapshot_id} for {snapshot_date} saved to: {SNAPSHOT_DB_FILE}")
+    print(f"   {total:,} snapshots in history")
+
 def main():
     """Main execution function"""
     print("\n" + "="*60)
     print("📊 JOB TRENDS ANALYZER - ANALYTICS GENERATION")
     print("="*60)
     
-    # Load data
-    df, skill_df = load_processed_data()
+    use_duckdb = ANALYTICS_BACKEND == 'duckdb'
+    if use_duckdb and not duckdb_backend.is_available():
+        print("⚠️ duckdb not installed, falling back to the pandas backend")
+        use_duckdb = False
     
     # Generate analytics
-    analytics = create_summary_analytics(df, skill_df)
+    if use_duckdb:
+        # Descriptions never enter pandas; DuckDB scans the files itself
+        columns = LIGHT_COLUMNS
+        if STATIC_API_EXPORT:
+            columns = columns + [c for c in static_api.REQUIRED_COLUMNS if c not in columns]
+        df, skill_df = load_processed_data(columns=columns)
+        analytics = create_summary_analytics_duckdb()
+    else:
+        df, skill_df = load_processed_data()
+        analytics = create_summary_analytics(df, skill_df)
+    
+    # Co-occurrence works on the packed skill sets, whichever backend ran
+    analytics['skill_cooccurrence'] = analyze_skill_cooccurrence(SkillBitsets.load_aligned(SKILL_BITSETS_FILE, df))
+    
+    # Skill trends are a separate artifact for the Market Intelligence page
+    trends = analyze_skill_trends(df)
     
     # Save results
     save_analytics(analytics)
+    save_skill_trends(trends)
+    
+    # Keep history for month-over-month trends
+    record_snapshot(df, analytics)
+    
+    # Optional pre-rendered JSON for static hosting (JOB_ANALYZER_STATIC_API=1)
+    if STATIC_API_EXPORT:
+        export_static_api(df, analytics)
     
     print("\n✅ Analytics generation completed successfully!")
     print("="*60 + "\n")
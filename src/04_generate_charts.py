@@ -4,11 +4,7 @@ Creates comprehensive visualizations from analytics data
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from wordcloud import WordCloud
+import functools
 import json
 from pathlib import Path
 import sys
@@ -19,10 +15,19 @@ from config import (
     ANALYTICS_JSON_FILE, PROCESSED_DATA_DIR, CHARTS_DIR,
     COLOR_PALETTE
 )
+from logger import log_execution_time
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette(COLOR_PALETTE)
+@functools.lru_cache(maxsize=None)
+def get_pyplot():
+    """Import matplotlib and seaborn on first use and apply the chart style"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette(COLOR_PALETTE)
+    return plt, sns
 
 def load_data():
     """Load processed data and analytics"""
@@ -49,8 +54,10 @@ def load_data():
     print(f"✅ Data loaded successfully")
     return analytics, df, skill_df
 
+@log_execution_time
 def create_top_skills_chart(analytics):
     """Create top skills bar chart"""
+    plt, sns = get_pyplot()
     print("\n📊 Creating top skills chart...")
     
     skills_data = analytics['skills']['top_skills'][:20]
@@ -81,8 +88,10 @@ def create_top_skills_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_top_roles_chart(analytics):
     """Create top roles bar chart"""
+    plt, sns = get_pyplot()
     print("📊 Creating top roles chart...")
     
     roles_data = analytics['roles']['top_roles'][:15]
@@ -110,8 +119,10 @@ def create_top_roles_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_work_type_pie_chart(analytics):
     """Create work type distribution pie chart"""
+    plt, sns = get_pyplot()
     print("📊 Creating work type distribution chart...")
     
     work_data = analytics['work_types']['distribution']
@@ -139,8 +150,10 @@ def create_work_type_pie_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_top_companies_chart(analytics):
     """Create top companies chart"""
+    plt, sns = get_pyplot()
     print("📊 Creating top companies chart...")
     
     company_data = analytics['companies']['top_companies'][:15]
@@ -169,8 +182,10 @@ def create_top_companies_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_top_locations_chart(analytics):
     """Create top locations chart"""
+    plt, sns = get_pyplot()
     print("📊 Creating top locations chart...")
     
     location_data = analytics['locations']['top_locations'][:15]
@@ -199,8 +214,10 @@ def create_top_locations_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_job_category_chart(analytics):
     """Create job category distribution chart"""
+    plt, sns = get_pyplot()
     print("📊 Creating job category chart...")
     
     category_data = analytics['job_categories']['distribution']
@@ -229,8 +246,10 @@ def create_job_category_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_experience_level_chart(analytics):
     """Create experience level distribution chart"""
+    plt, sns = get_pyplot()
     print("📊 Creating experience level chart...")
     
     exp_data = analytics['experience']['level_distribution']
@@ -259,8 +278,12 @@ def create_experience_level_chart(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_skills_wordcloud(analytics):
     """Create word cloud of skills"""
+    from wordcloud import WordCloud
+    
+    plt, sns = get_pyplot()
     print("📊 Creating skills word cloud...")
     
     skills_data = analytics['skills']['top_skills']
@@ -290,8 +313,10 @@ def create_skills_wordcloud(analytics):
     
     print(f"   ✅ Saved: {output_file.name}")
 
+@log_execution_time
 def create_interactive_charts(analytics, df):
     """Create interactive Plotly charts"""
+    import plotly.express as px
     print("📊 Creating interactive charts...")
     
     # Top Skills Interactive
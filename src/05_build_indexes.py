@@ -0,0 +1,109 @@
+"""
+Index Building Script
+Builds the lookup indexes the dashboard queries postings with (job
+similarity, full-text search)
+"""
+
+import pandas as pd
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+from config import (
+    PROCESSED_DATA_DIR, SKILL_BITSETS_FILE, SIMILARITY_INDEX_FILE, SEARCH_INDEX_FILE,
+    SIMILARITY_MIN_DF, SIMILARITY_MAX_DF, SIMILARITY_MAX_FEATURES,
+    SIMILARITY_SKILL_WEIGHT, SIMILARITY_LSH_BITS
+)
+from logger import log_execution_time
+from similarity_index import SimilarityIndex
+from skill_bitset import SkillBitsets
+from utils import write_data_version, ensure_company_size_bucket
+import search_index
+
+# Columns the indexes are built from
+INDEX_COLUMNS = search_index.INDEX_COLUMNS + ['skills']
+
+def load_jobs():
+    """Load the processed jobs table"""
+    print("📂 Loading processed data...")
+    
+    jobs_file = PROCESSED_DATA_DIR / 'jobs_with_skills.csv'
+    
+    if not jobs_file.exists():
+        print("❌ Error: Processed data not found!")
+        print(f"   Please run 01_ingest_clean.py and 02_extract_skills.py first")
+        sys.exit(1)
+    
+    df = pd.read_csv(jobs_file, usecols=lambda c: c in INDEX_COLUMNS or c == 'no_of_employ')
+    df['skills'] = df['skills'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
+    ensure_company_size_bucket(df)
+    
+    print(f"✅ Loaded {len(df):,} records")
+    return df
+
+@log_execution_time
+def build_similarity_index(df):
+    """Build the job similarity index (TF-IDF of title + description, skill sets)"""
+    print("\n🧭 Building job similarity index...")
+    
+    start = time.perf_counter()
+    texts = df['job'].fillna('') + ' ' + df['job_details'].fillna('')
+    index = SimilarityIndex.build(
+        texts, SkillBitsets.load_aligned(SKILL_BITSETS_FILE, df),
+        min_df=SIMILARITY_MIN_DF,
+        max_df=SIMILARITY_MAX_DF,
+        max_features=SIMILARITY_MAX_FEATURES,
+        skill_weight=SIMILARITY_SKILL_WEIGHT,
+        lsh_bits=SIMILARITY_LSH_BITS
+    )
+    index.save(SIMILARITY_INDEX_FILE)
+    
+    print(f"✅ Indexed {len(index):,} jobs over {len(index.vocab):,} terms "
+          f"({len(index.data):,} weights) in {time.perf_counter() - start:.1f}s")
+    if index.signatures is not None:
+        print(f"   LSH signatures: {index.signatures.shape[1] * 64} bits")
+    print(f"   Saved to: {SIMILARITY_INDEX_FILE}")
+    return index
+
+@log_execution_time
+def build_search_index(df):
+    """Build the full-text search index (SQLite FTS5 over titles and descriptions)"""
+    print("\n🔍 Building full-text search index...")
+    
+    start = time.perf_counter()
+    indexed = search_index.build_index(SEARCH_INDEX_FILE, df)
+    
+    size_mb = SEARCH_INDEX_FILE.stat().st_size / (1024 * 1024)
+    print(f"✅ Indexed {indexed:,} jobs in {time.perf_counter() - start:.1f}s ({size_mb:.1f} MB)")
+    print(f"   Saved to: {SEARCH_INDEX_FILE}")
+    return indexed
+
+def main():
+    """Main execution function"""
+    print("\n" + "="*60)
+    print("🗂️ JOB TRENDS ANALYZER - INDEX BUILDING")
+    print("="*60)
+    
+    df = load_jobs()
+    
+    index = build_similarity_index(df)
+    indexed = build_search_index(df)
+    
+    # Tell the dashboard new data is available
+    version = write_data_version('05_build_indexes', {
+        SIMILARITY_INDEX_FILE: len(index),
+        SEARCH_INDEX_FILE: indexed
+    })
+    print(f"✅ Data version: {version}")
+    
+    print("\n✅ Index building completed successfully!")
+    print("="*60 + "\n")
+    
+    print("📌 Next Steps:")
+    print("   Run: streamlit run app/streamlit_app.py (search and similar jobs in the Data Explorer)")
+    print()
+
+if __name__ == "__main__":
+    main()
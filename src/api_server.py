@@ -0,0 +1,436 @@
+"""
+Query API Server
+Read-only JSON API over the processed job data, so other tools can query
+skills, roles, companies, jobs and career recommendations without loading
+the pipeline outputs themselves
+
+Usage:
+    python src/api_server.py                      # http://127.0.0.1:8000/api/v1/
+    python src/api_server.py --host 0.0.0.0 --port 8080
+"""
+
+import argparse
+import functools
+import json
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+from config import (
+    PROCESSED_DATA_DIR, ANALYTICS_JSON_FILE, DATA_VERSION_FILE, SKILL_BITSETS_FILE, SKILL_CATEGORIES,
+    API_VERSION, API_RATE_LIMIT, API_HOST, API_PORT, API_CACHE_SIZE,
+    API_DEFAULT_PAGE_SIZE, API_MAX_PAGE_SIZE,
+    RECOMMENDATION_CACHE_SIZE, RECOMMENDATION_CACHE_TTL, RECOMMENDATION_CACHE_MAX_MB
+)
+from logger import setup_logger
+from recommender import RecommendationCache, cached_recommendations
+from skill_bitset import SkillBitsets
+from utils import read_data_manifest, role_column
+
+logger = setup_logger('api_server')
+
+API_PREFIX = f"/api/{API_VERSION}"
+JOBS_CSV_FILE = PROCESSED_DATA_DIR / 'jobs_with_skills.csv'
+
+# Columns returned for each job (job_details is left out to keep pages small)
+JOB_FIELDS = [
+    'job_ID', 'job', 'canonical_role', 'company_name', 'city', 'state', 'country', 'work_type',
+    'experience_level', 'job_category', 'company_size', 'company_size_bucket', 'days_since_posted',
+    'no_of_application', 'skills'
+]
+
+# Query parameter -> jobs column for exact-match filters (role is matched on role_column)
+JOB_FILTERS = {
+    'company': 'company_name',
+    'city': 'city',
+    'work_type': 'work_type',
+    'experience_level': 'experience_level',
+    'category': 'job_category',
+    'company_size': 'company_size_bucket'
+}
+
+# Endpoint -> artifact its responses are built from (its hash is the ETag)
+ENDPOINT_SOURCES = {
+    'skills': 'analytics_summary.json',
+    'roles': 'analytics_summary.json',
+    'companies': 'analytics_summary.json',
+    'jobs': 'jobs_with_skills.csv',
+    'recommendations': 'jobs_with_skills.csv'
+}
+
+
+class ApiError(Exception):
+    """Error returned to the client as a JSON body with an HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class DataStore:
+    """Processed artifacts held in memory and reloaded when the data manifest changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._manifest_mtime = None
+        self.versions = {}
+        self.analytics = None
+        self.jobs = None
+        self.bitsets = None
+
+    def refresh(self) -> Dict[str, str]:
+        """Reload any artifact whose content hash changed; return artifact -> version"""
+        mtime = DATA_VERSION_FILE.stat().st_mtime_ns if DATA_VERSION_FILE.exists() else None
+        if mtime is not None and mtime == self._manifest_mtime:
+            return self.versions
+
+        with self._lock:
+            if mtime is not None and mtime == self._manifest_mtime:
+                return self.versions
+
+            artifacts = read_data_manifest().get('artifacts', {})
+            versions = {}
+            for name in set(ENDPOINT_SOURCES.values()):
+                path = PROCESSED_DATA_DIR / name
+                sha = artifacts.get(name, {}).get('sha256')
+                # Outputs from before the manifest existed fall back to their mtime
+                if sha is None and path.exists():
+                    sha = f"m{path.stat().st_mtime_ns}"
+                if sha is not None:
+                    versions[name] = sha[:16]
+
+            if versions.get('analytics_summary.json') != self.versions.get('analytics_summary.json'):
+                self.analytics = self._load_analytics()
+            if versions.get('jobs_with_skills.csv') != self.versions.get('jobs_with_skills.csv'):
+                self.jobs = self._load_jobs()
+                self.bitsets = self._load_bitsets(self.jobs)
+
+            self.versions = versions
+            self._manifest_mtime = mtime
+            return versions
+
+    @staticmethod
+    def _load_analytics() -> Optional[Dict[str, Any]]:
+        if not ANALYTICS_JSON_FILE.exists():
+            return None
+        with open(ANALYTICS_JSON_FILE, 'r', encoding='utf-8') as f:
+            analytics = json.load(f)
+        logger.info(f"Loaded analytics ({analytics['metadata']['total_jobs']:,} jobs)")
+        return analytics
+
+    @staticmethod
+    def _load_jobs() -> Optional[pd.DataFrame]:
+        if not JOBS_CSV_FILE.exists():
+            return None
+        header = pd.read_csv(JOBS_CSV_FILE, nrows=0).columns
+        columns = [c for c in JOB_FIELDS if c in header]
+        df = pd.read_csv(JOBS_CSV_FILE, usecols=columns)[columns]
+        df['skills'] = df['skills'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
+        logger.info(f"Loaded {len(df):,} jobs")
+        return df
+
+    @staticmethod
+    def _load_bitsets(jobs: Optional[pd.DataFrame]) -> Optional[SkillBitsets]:
+        # Recommendations fall back to packing df['skills'] when missing or stale
+        if jobs is None or not SKILL_BITSETS_FILE.exists():
+            return None
+        return SkillBitsets.load(SKILL_BITSETS_FILE).align(jobs['job_ID'])
+
+
+class RateLimiter:
+    """Sliding one-minute window of requests per client address"""
+
+    def __init__(self, limit: int = API_RATE_LIMIT, window: float = 60.0):
+        self.limit = limit
+        self.window = window
+        self._lock = threading.Lock()
+        self._hits = defaultdict(deque)
+        self._last_sweep = time.monotonic()
+
+    def check(self, client: str) -> Tuple[bool, int, int]:
+        """
+        Record one request from client
+
+        Returns:
+            (allowed, requests remaining, seconds until the oldest request expires)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.window:
+                self._sweep(now)
+            hits = self._hits[client]
+            while hits and now - hits[0] >= self.window:
+                hits.popleft()
+            if len(hits) >= self.limit:
+                return False, 0, int(self.window - (now - hits[0])) + 1
+            hits.append(now)
+            return True, self.limit - len(hits), 0
+
+    def _sweep(self, now: float) -> None:
+        """Forget clients with no request inside the window (called with the lock held)"""
+        for client in [c for c, hits in self._hits.items() if not hits or now - hits[-1] >= self.window]:
+            del self._hits[client]
+        self._last_sweep = now
+
+
+def _param(params: Dict[str, list], name: str, default=None):
+    values = params.get(name)
+    return values[-1] if values else default
+
+
+def _int_param(params: Dict[str, list], name: str, default: int,
+               minimum: int = 0, maximum: Optional[int] = None) -> int:
+    raw = _param(params, name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(400, f"'{name}' must be an integer")
+    if value < minimum:
+        raise ApiError(400, f"'{name}' must be at least {minimum}")
+    if maximum is not None and value > maximum:
+        raise ApiError(400, f"'{name}' must be at most {maximum}")
+    return value
+
+
+def _list_param(params: Dict[str, list], name: str) -> list:
+    """Values from repeated and/or comma-separated parameters (?skill=A&skill=B or ?skills=A,B)"""
+    values = []
+    for raw in params.get(name, []):
+        values.extend(v.strip() for v in raw.split(',') if v.strip())
+    return values
+
+
+def paginate(items, params: Dict[str, list]) -> Dict[str, Any]:
+    """Slice a list or DataFrame by ?page (1-based) and ?page_size"""
+    page = _int_param(params, 'page', 1, minimum=1)
+    page_size = _int_param(params, 'page_size', API_DEFAULT_PAGE_SIZE, minimum=1, maximum=API_MAX_PAGE_SIZE)
+    total = len(items)
+    start = (page - 1) * page_size
+    chunk = items[start:start + page_size]
+    if isinstance(chunk, pd.DataFrame):
+        chunk = json.loads(chunk.to_json(orient='records'))
+    return {
+        'page': page,
+        'page_size': page_size,
+        'total': total,
+        'pages': -(-total // page_size),
+        'results': chunk
+    }
+
+
+class QueryService:
+    """Endpoint implementations with an LRU cache of serialized responses"""
+
+    def __init__(self, store: DataStore, cache_size: int = API_CACHE_SIZE):
+        self.store = store
+        self.cached_response = functools.lru_cache(maxsize=cache_size)(self._response)
+        # Keyed on normalized inputs, so reordered or duplicated skills share a result
+        self.recommendation_cache = RecommendationCache(
+            RECOMMENDATION_CACHE_SIZE, RECOMMENDATION_CACHE_TTL, RECOMMENDATION_CACHE_MAX_MB * 1024 * 1024
+        )
+
+    def _analytics(self) -> Dict[str, Any]:
+        if self.store.analytics is None:
+            raise ApiError(503, "Analytics not generated yet; run 03_role_stats.py")
+        return self.store.analytics
+
+    def _jobs(self) -> pd.DataFrame:
+        if self.store.jobs is None:
+            raise ApiError(503, "Jobs not processed yet; run 02_extract_skills.py")
+        return self.store.jobs
+
+    def skills(self, params):
+        """Most demanded skills, optionally within one SKILL_CATEGORIES group"""
+        skills = self._analytics()['skills']
+        top = skills['top_skills']
+        category = _param(params, 'category')
+        if category is not None:
+            if category not in SKILL_CATEGORIES:
+                raise ApiError(400, f"Unknown category '{category}'")
+            members = set(SKILL_CATEGORIES[category])
+            top = [s for s in top if s['skill'] in members]
+        response = {k: v for k, v in skills.items() if k != 'top_skills'}
+        response.update(paginate(top, params))
+        return response
+
+    def roles(self, params):
+        """Most common job titles"""
+        roles = self._analytics()['roles']
+        response = {k: v for k, v in roles.items() if k != 'top_roles'}
+        response.update(paginate(roles['top_roles'], params))
+        return response
+
+    def companies(self, params):
+        """Top hiring companies"""
+        companies = self._analytics()['companies']
+        response = {'total_companies': companies['total_companies']}
+        response.update(paginate(companies['top_companies'], params))
+        return response
+
+    def jobs(self, params):
+        """Job postings filtered by exact fields, required skills, posting age and title text"""
+        df = self._jobs()
+        mask = pd.Series(True, index=df.index)
+
+        # Same roles /roles counts: canonical roles when the data has them
+        role = _param(params, 'role')
+        if role is not None:
+            mask &= df[role_column(df)] == role
+
+        for name, column in JOB_FILTERS.items():
+            value = _param(params, name)
+            if value is not None and column in df.columns:
+                mask &= df[column] == value
+
+        required = set(_list_param(params, 'skill'))
+        if required:
+            mask &= df['skills'].map(required.issubset)
+
+        max_days = _param(params, 'max_days')
+        if max_days is not None:
+            mask &= df['days_since_posted'] <= _int_param(params, 'max_days', 0)
+
+        query = _param(params, 'q')
+        if query:
+            mask &= df['job'].str.contains(query, case=False, regex=False, na=False)
+
+        return paginate(df[mask], params)
+
+    def recommendations(self, params):
+        """Career recommendations for ?skills=A,B with the dashboard's preference options"""
+        user_skills = _list_param(params, 'skills')
+        if not user_skills:
+            raise ApiError(400, "'skills' is required, e.g. ?skills=Python,SQL")
+
+        return cached_recommendations(
+            self.recommendation_cache, self.store.versions.get('jobs_with_skills.csv'),
+            self._jobs(), user_skills,
+            _int_param(params, 'experience', 2, maximum=50),
+            _param(params, 'work_type', 'Any'),
+            _param(params, 'location', 'Any'),
+            _param(params, 'goal', 'Current Level'),
+            top_k=_int_param(params, 'limit', 10, minimum=1, maximum=100),
+            bitsets=self.store.bitsets
+        )
+
+    def _response(self, endpoint: str, version: str, query: Tuple) -> bytes:
+        # version is only part of the cache key: new data never hits stale entries
+        params = {name: list(values) for name, values in query}
+        body = getattr(self, endpoint)(params)
+        return json.dumps(body, default=str).encode('utf-8')
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """Routes GET /api/v1/<endpoint> to the QueryService"""
+
+    server_version = f"JobTrendsAPI/{API_VERSION}"
+    service: QueryService = None
+    limiter: RateLimiter = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        allowed, remaining, retry_after = self.limiter.check(self.client_address[0])
+        headers = {
+            'X-RateLimit-Limit': str(self.limiter.limit),
+            'X-RateLimit-Remaining': str(remaining)
+        }
+        if not allowed:
+            headers['Retry-After'] = str(retry_after)
+            return self._send_error(429, "Rate limit exceeded", headers)
+
+        versions = self.service.store.refresh()
+        endpoint = url.path.rstrip('/')[len(API_PREFIX) + 1:] if url.path.startswith(API_PREFIX) else None
+
+        if endpoint == '':
+            return self._send_json(200, {
+                'version': API_VERSION,
+                'endpoints': [f"{API_PREFIX}/{name}" for name in ['health'] + list(ENDPOINT_SOURCES)]
+            }, headers)
+        if endpoint == 'health':
+            return self._send_json(200, {
+                'status': 'ok',
+                'data_versions': versions,
+                'recommendation_cache': self.service.recommendation_cache.stats()
+            }, headers)
+        if endpoint not in ENDPOINT_SOURCES:
+            return self._send_error(404, f"Unknown endpoint '{url.path}'", headers)
+
+        version = versions.get(ENDPOINT_SOURCES[endpoint], 'none')
+        etag = f'"{version}"'
+        headers['ETag'] = etag
+        headers['Cache-Control'] = 'no-cache'
+        if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            return self._send(304, b'', headers)
+
+        query = tuple(sorted((k, tuple(v)) for k, v in parse_qs(url.query).items()))
+        try:
+            body = self.service.cached_response(endpoint, version, query)
+        except ApiError as e:
+            return self._send_error(e.status, e.message, headers)
+        self._send(200, body, headers)
+
+    def _send(self, status: int, body: bytes, headers: Dict[str, str]):
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str]):
+        self._send(status, json.dumps(payload, default=str).encode('utf-8'), headers)
+
+    def _send_error(self, status: int, message: str, headers: Dict[str, str]):
+        self._send_json(status, {'error': message, 'status': status}, headers)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.client_address[0]} {format % args}")
+
+
+def create_server(host: str = API_HOST, port: int = API_PORT,
+                  rate_limit: int = API_RATE_LIMIT) -> ThreadingHTTPServer:
+    """Build the HTTP server with its data store, response cache and rate limiter"""
+    store = DataStore()
+    store.refresh()
+    handler = type('BoundApiHandler', (ApiHandler,), {
+        'service': QueryService(store),
+        'limiter': RateLimiter(rate_limit)
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Serve the processed job data as a JSON API")
+    parser.add_argument('--host', default=API_HOST)
+    parser.add_argument('--port', type=int, default=API_PORT)
+    parser.add_argument('--rate-limit', type=int, default=API_RATE_LIMIT, help="Requests per minute per client")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.rate_limit)
+    print(f"🌐 Serving {API_PREFIX} on http://{args.host}:{args.port}{API_PREFIX}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping API server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Company Name Resolver
+Maps raw company names ("Tata Consultancy Services Ltd", "TCS",
+"Tata Consultancy Services") to one canonical company
+
+Names are reduced to keys: lowercased, punctuation, bracketed asides, taglines
+and trailing legal suffixes (Pvt Ltd, Inc, LLC...) dropped. Keys are then
+clustered with a trigram index of their first words: a key only probes the
+postings of its first word's rarest trigrams (any word within the edit bound
+must share one of them), candidates must pass the trigram count and length
+filters, and a bounded Levenshtein check per word confirms each match, so a typo merges
+("Deloite") but a different short brand word does not ("Nityo" / "Nitor").
+Keys equal up to spaces ("HCL Tech" / "HCLTech") merge, and initialisms
+("TCS") join the one company they abbreviate.
+
+Resolved names are kept in a JSON cache, so a run only resolves names it has
+not seen before; companies already in the cache keep their canonical names.
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Bump when key or matching rules change; caches from other versions are rebuilt
+CACHE_VERSION = 1
+
+# Trailing words dropped from keys ('Infosys Limited' -> 'infosys')
+LEGAL_SUFFIXES = frozenset("""
+    pvt private ltd limited llp llc inc incorporated corp corporation co company
+    plc gmbh ag sa bv nv pte pty sdn bhd srl spa kk com
+""".split())
+
+# Trailing region words dropped after the suffixes ('Lowe's India' -> 'lowes')
+REGION_SUFFIXES = frozenset("india global worldwide international".split())
+
+# Words skipped when forming initialisms ('Bank of America' -> 'boa')
+INITIALISM_SKIP = frozenset("and of the for".split())
+
+BRACKETS = re.compile(r"[\(\[\{].*?[\)\]\}]")
+TAGLINE = re.compile(r"\s+[-–|:]\s+.*$")  # 'WUElev8 - Where yoU Elevate' -> 'WUElev8'
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+MAX_EDIT_RATIO = 0.15  # Edits allowed per character of the longer word; words up to 6 letters match exactly
+MIN_INITIALISM = 3  # Two-letter initialisms are too ambiguous to expand
+MAX_INITIALISM = 5
+
+
+def company_key(name: str) -> str:
+    """Matching key of one company name ('' for missing names)"""
+    if not isinstance(name, str):
+        return ''
+    text = TAGLINE.sub('', BRACKETS.sub(' ', name)).lower()
+    text = text.replace('&', ' and ').replace("'", '')
+    tokens = NON_WORD.sub(' ', text).split()
+    if tokens[:1] == ['the'] and len(tokens) > 1:
+        tokens = tokens[1:]
+    # Suffixes are only trimmed while something else is left ('Company' stays 'company')
+    for suffixes in (LEGAL_SUFFIXES, REGION_SUFFIXES):
+        while len(tokens) > 1 and tokens[-1] in suffixes:
+            tokens.pop()
+    return ' '.join(tokens) or name.strip().lower()
+
+
+def _trigrams(key: str) -> set:
+    padded = f"##{key}##"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _max_edits(a: str, b: str) -> int:
+    return int(max(len(a), len(b)) * MAX_EDIT_RATIO)
+
+
+def _word_budgets(a: str, b: str) -> Optional[List[int]]:
+    """Edits allowed per word position (None when the word counts differ)"""
+    words_a, words_b = a.split(), b.split()
+    if len(words_a) != len(words_b):
+        return None
+    return [_max_edits(x, y) for x, y in zip(words_a, words_b)]
+
+
+def within_distance(a: str, b: str, max_distance: int) -> bool:
+    """Whether the Levenshtein distance of a and b is at most max_distance"""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        # Distances never shrink from one row to the next
+        if min(current) > max_distance:
+            return False
+        previous = current
+    return previous[-1] <= max_distance
+
+
+def _initialism(key: str) -> Optional[str]:
+    words = [w for w in key.split() if w not in INITIALISM_SKIP]
+    if len(words) < MIN_INITIALISM:
+        return None
+    return ''.join(w[0] for w in words)
+
+
+class CompanyResolver:
+    """
+    Raw company name -> canonical company name, resolved incrementally
+
+    Args:
+        names: Raw name -> canonical name of names already resolved
+        keys: Matching key -> canonical name of companies already known
+    """
+
+    def __init__(self, names: Optional[Dict[str, str]] = None, keys: Optional[Dict[str, str]] = None):
+        self.names = dict(names or {})
+        self.keys = dict(keys or {})
+
+    @classmethod
+    def load(cls, path: Path) -> 'CompanyResolver':
+        """Resolver from a cache file (empty when missing, unreadable or from another version)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if cache.get('version') != CACHE_VERSION:
+            return cls()
+        return cls(cache.get('names'), cache.get('keys'))
+
+    def save(self, path: Path) -> None:
+        """Write the cache atomically (temp file swapped into place)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'names': self.names, 'keys': self.keys}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def unseen(self, names: Iterable[str]) -> List[str]:
+        """Names the cache cannot answer yet"""
+        return [name for name in dict.fromkeys(names) if isinstance(name, str) and name not in self.names]
+
+    def resolve(self, name_counts: Dict[str, int]) -> Dict[str, str]:
+        """
+        Canonical name for every raw name, resolving the unseen ones
+
+        Args:
+            name_counts: Raw name -> postings; counts pick the display name of new companies
+
+        Returns:
+            Raw name -> canonical name
+        """
+        new_names = self.unseen(name_counts)
+        if new_names:
+            self._resolve_new(new_names, name_counts)
+        return {name: self.names.get(name, name) for name in name_counts}
+
+    def _resolve_new(self, new_names: List[str], name_counts: Dict[str, int]) -> None:
+        new_keys = defaultdict(list)
+        for name in new_names:
+            new_keys[company_key(name)].append(name)
+
+        # Union-find over keys; a cluster holds at most one known company
+        keys = list(self.keys) + [k for k in new_keys if k not in self.keys]
+        parent = {key: key for key in keys}
+        known = {key: self.keys[key] for key in self.keys}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        def union(a, b):
+            a, b = find(a), find(b)
+            if a == b or (a in known and b in known and known[a] != known[b]):
+                return
+            if b in known:
+                a, b = b, a
+            parent[b] = a
+
+        # Known companies already cluster by canonical name
+        first_key = {}
+        for key, canonical in self.keys.items():
+            union(first_key.setdefault(canonical, key), key)
+
+        compact = {}
+        for key in keys:
+            union(compact.setdefault(key.replace(' ', ''), key), key)
+        for key, other in self._fuzzy_pairs(keys, new_keys):
+            union(key, other)
+        abbreviations = set()
+        key_counts = {key: sum(name_counts.get(name, 0) for name in names) for key, names in new_keys.items()}
+        for key, expansion in self._initialism_pairs(keys, new_keys, key_counts):
+            abbreviations.add(key)
+            union(key, expansion)
+
+        # New clusters are named after their most posted spelled-out variant
+        clusters = defaultdict(list)
+        for key in new_keys:
+            clusters[find(key)].append(key)
+        for root, members in clusters.items():
+            canonical = known.get(root)
+            if canonical is None:
+                canonical = min(
+                    (key in abbreviations, -name_counts.get(name, 0), len(name), name)
+                    for key in members for name in new_keys[key]
+                )[3]
+            for key in members:
+                self.keys[key] = canonical
+                for name in new_keys[key]:
+                    self.names[name] = canonical
+
+    def _fuzzy_pairs(self, keys: List[str], new_keys: Dict[str, List[str]]):
+        """(new key, key) pairs whose words are each within their edit budget"""
+        # Matches have the same word count, so candidates come from an index of first words
+        first_words = defaultdict(list)
+        for key in keys:
+            first_words[key.split()[0] if key else ''].append(key)
+        grams = {word: _trigrams(word) for word in first_words}
+        postings = defaultdict(list)
+        for word, word_grams in grams.items():
+            for gram in word_grams:
+                postings[gram].append(word)
+
+        def similar_words(word):
+            # Most edits the word's match can need (it may be longer by those edits)
+            edits = int(len(word) * MAX_EDIT_RATIO / (1 - MAX_EDIT_RATIO))
+            if edits < 1:
+                return [word]
+            # One edit destroys at most 3 trigrams, so a match shares one of the rarest 3 * edits + 1
+            word_grams = grams[word]
+            probe = sorted(word_grams, key=lambda g: (len(postings[g]), g))[:3 * edits + 1]
+            candidates = {other for gram in probe for other in postings[gram] if abs(len(other) - len(word)) <= edits}
+            return [other for other in candidates
+                    if len(word_grams & grams[other]) >= max(len(word_grams), len(grams[other])) - 3 * edits]
+
+        similar = {}
+        for key in new_keys:
+            words = key.split() or ['']
+            if max(len(w) for w in words) * MAX_EDIT_RATIO < 1 - MAX_EDIT_RATIO:
+                continue  # Every word is too short to differ from its match (a longer word allows more edits)
+            if words[0] not in similar:
+                similar[words[0]] = similar_words(words[0])
+
+            for word in similar[words[0]]:
+                for other in first_words[word]:
+                    if other == key or (other in new_keys and other < key):
+                        continue
+                    budgets = _word_budgets(key, other)
+                    if not budgets or sum(budgets) < 1 or abs(len(key) - len(other)) > sum(budgets):
+                        continue
+                    if all(x == y or within_distance(x, y, budget)
+                           for x, y, budget in zip(key.split(), other.split(), budgets)):
+                        yield key, other
+
+    def _initialism_pairs(self, keys: List[str], new_keys: Dict[str, List[str]], key_counts: Dict[str, int]):
+        """
+        (initialism key, company key) pairs
+
+        The initialism must name one company only, counting expansions given
+        in brackets ('ISG (Information Services Group)'), and a new company
+        must be posted more often than its initialism, so a rare
+        lookalike ('Fruges IT Services') does not absorb a well-known
+        acronym ('FIS').
+        """
+        expansions = defaultdict(set)
+        for key in keys:
+            initialism = _initialism(key)
+            if initialism and MIN_INITIALISM <= len(initialism) <= MAX_INITIALISM:
+                expansions[initialism].add(key)
+        for key, names in new_keys.items():
+            for name in names:
+                for aside in BRACKETS.findall(name):
+                    aside_key = company_key(aside[1:-1])
+                    if _initialism(aside_key) == key:
+                        expansions[key].add(aside_key)
+
+        posted = set(keys)
+        for key in keys:
+            if ' ' in key or key not in expansions or len(expansions[key]) != 1:
+                continue
+            (expansion,) = expansions[key]
+            # A bracketed expansion nobody posts under has no company to join
+            if expansion not in posted or (key not in new_keys and expansion not in new_keys):
+                continue
+            if expansion in new_keys and key_counts[expansion] <= key_counts.get(key, 0):
+                continue
+            yield key, expansion
@@ -13,13 +13,15 @@ from pathlib import Path
 # Root directory (project base)
 ROOT_DIR = Path(__file__).parent.parent.absolute()
 
-# Data directories
-DATA_DIR = ROOT_DIR / "data"
+# Data directories (JOB_ANALYZER_DATA_DIR redirects a run, e.g. for benchmarks)
+DATA_DIR = Path(os.environ.get("JOB_ANALYZER_DATA_DIR", ROOT_DIR / "data"))
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
+HISTORY_DIR = DATA_DIR / "history"
+CACHE_DIR = DATA_DIR / "cache"  # Lookups kept between runs (not pipeline outputs)
 
-# Output directories
-OUTPUT_DIR = ROOT_DIR / "outputs"
+# Output directories (JOB_ANALYZER_OUTPUT_DIR redirects a run)
+OUTPUT_DIR = Path(os.environ.get("JOB_ANALYZER_OUTPUT_DIR", ROOT_DIR / "outputs"))
 CHARTS_DIR = OUTPUT_DIR / "charts"
 REPORTS_DIR = OUTPUT_DIR / "reports"
 API_DIR = OUTPUT_DIR / "api"
@@ -38,11 +40,31 @@ APP_DIR = ROOT_DIR / "app"
 # Raw data
 RAW_CSV_FILE = RAW_DATA_DIR / "linkdin_Job_data.csv"
 
+# Bundled reference data (ships with the code, so not moved by JOB_ANALYZER_DATA_DIR)
+GAZETTEER_FILE = ROOT_DIR / "data" / "reference" / "gazetteer.json"  # Cities, states, countries, metro areas
+
 # Processed data
 CLEANED_CSV_FILE = PROCESSED_DATA_DIR / "cleaned_jobs.csv"
+TITLE_MAPPING_FILE = PROCESSED_DATA_DIR / "title_mapping.csv"  # Raw title -> canonical role
+JOBS_PARQUET_FILE = PROCESSED_DATA_DIR / "jobs_with_skills.parquet"  # Written when pyarrow is installed
 SKILLS_CSV_FILE = PROCESSED_DATA_DIR / "skills_extracted.csv"
+SKILL_BITSETS_FILE = PROCESSED_DATA_DIR / "skill_bitsets.npz"  # Per-job skill sets packed as uint64 words
 ROLE_CATEGORIES_FILE = PROCESSED_DATA_DIR / "role_categories.csv"
 ANALYTICS_JSON_FILE = PROCESSED_DATA_DIR / "analytics_summary.json"
+SKILL_TRENDS_JSON_FILE = PROCESSED_DATA_DIR / "skill_trends.json"
+SIMILARITY_INDEX_FILE = PROCESSED_DATA_DIR / "similarity_index.npz"  # Written by 05_build_indexes
+SEARCH_INDEX_FILE = PROCESSED_DATA_DIR / "search_index.db"  # SQLite FTS5, written by 05_build_indexes
+DATA_VERSION_FILE = PROCESSED_DATA_DIR / "data_version.json"  # Bumped whenever outputs change
+
+# History (append-only snapshot per pipeline run)
+SNAPSHOT_DB_FILE = HISTORY_DIR / "snapshots.db"
+
+# Resolved company names (raw name -> canonical company), reused by later runs
+COMPANY_CACHE_FILE = CACHE_DIR / "company_names.json"
+# Resolved location strings (location -> city, state, country) for the current gazetteer
+LOCATION_CACHE_FILE = CACHE_DIR / "locations.json"
+# Scrape date of the raw data (YYYY-MM-DD); defaults to the run date
+SNAPSHOT_DATE = os.environ.get("JOB_ANALYZER_SNAPSHOT_DATE")
 
 # ============================================================================
 # ANALYSIS PARAMETERS
@@ -52,6 +74,16 @@ ANALYTICS_JSON_FILE = PROCESSED_DATA_DIR / "analytics_summary.json"
 MIN_JOB_TITLE_LENGTH = 3
 MAX_DESCRIPTION_LENGTH = 10000
 DUPLICATE_THRESHOLD = 0.95  # Similarity threshold for duplicate detection
+TITLE_CLUSTER_THRESHOLD = 0.9  # Similarity at which normalized job titles merge into one role
+
+# Company size buckets from employee-count ranges ("51-200 employees"), smallest
+# first: (largest head count in the bucket, label)
+COMPANY_SIZE_BUCKETS = [
+    (10, '1-10'), (50, '11-50'), (200, '51-200'), (500, '201-500'),
+    (1000, '501-1,000'), (5000, '1,001-5,000'), (10000, '5,001-10,000'),
+    (float('inf'), '10,001+')
+]
+COMPANY_SIZE_UNKNOWN = 'Not Specified'
 
 # Skill extraction
 MIN_SKILL_FREQUENCY = 2  # Minimum occurrences to be considered
@@ -61,6 +93,34 @@ SKILL_EXTRACTION_CONFIDENCE = 0.6
 # NLP settings
 NLP_MODEL = "en_core_web_sm"  # spaCy model
 MAX_TOKENS_PER_DOC = 1000000
+NLP_BATCH_SIZE = 256  # Docs per nlp.pipe batch
+NLP_N_PROCESS = 1  # Worker processes for nlp.pipe
+
+# Skill extraction backend: "regex" (default) or "spacy" (PhraseMatcher)
+SKILL_EXTRACTION_BACKEND = os.environ.get("SKILL_EXTRACTION_BACKEND", "regex").lower()
+
+# Skill trends: posting-age windows (days since posted), newest first
+TREND_WINDOW_DAYS = [0, 7, 14, 30, float("inf")]
+TREND_STABLE_PCT = 5.0  # |velocity| below this counts as stable
+TREND_MIN_JOBS = 10  # Skills in fewer postings are too noisy to trend
+TOP_N_SUPPLY_SKILLS = 15
+
+# Analytics backend for 03_role_stats: "pandas" (default) or "duckdb" (SQL over
+# Parquet/CSV views, parallel and spilling to TEMP_DIR past the memory limit).
+# DuckDB keeps descriptions out of memory, but skill co-occurrence, skill trends,
+# snapshots and the static API still run in pandas, so 03_role_stats loads its
+# LIGHT_COLUMNS (plus static_api.REQUIRED_COLUMNS when the export is on) either way
+ANALYTICS_BACKEND = os.environ.get("ANALYTICS_BACKEND", "pandas").lower()
+DUCKDB_THREADS = int(os.environ.get("DUCKDB_THREADS", "0"))  # 0 = all cores
+DUCKDB_MEMORY_LIMIT = os.environ.get("DUCKDB_MEMORY_LIMIT")  # e.g. "4GB"; DuckDB default if unset
+
+# Job similarity index (05_build_indexes): TF-IDF of title + description plus skill sets
+SIMILARITY_MIN_DF = 2  # Terms in fewer postings are dropped
+SIMILARITY_MAX_DF = 0.5  # Terms in more than this share of postings are dropped
+SIMILARITY_MAX_FEATURES = 50000
+SIMILARITY_SKILL_WEIGHT = 0.3  # Share of the score from skill-set cosine (rest is text)
+# Random-projection LSH bits for approximate search (8-bit bands, so 256 bits = 32 band buckets); 0 = exact search only
+SIMILARITY_LSH_BITS = int(os.environ.get("JOB_ANALYZER_SIMILARITY_LSH_BITS", "0"))
 
 # ============================================================================
 # VISUALIZATION SETTINGS
@@ -87,6 +147,8 @@ TOP_N_ROLES = 20
 TOP_N_SKILLS = 30
 TOP_N_COMPANIES = 10
 TOP_N_LOCATIONS = 10
+TOP_N_COOCCURRENCE_SKILLS = 25  # Skills whose pairwise co-occurrence is analyzed
+TOP_N_SKILL_PAIRS = 20
 
 # ============================================================================
 # STREAMLIT DASHBOARD SETTINGS
@@ -100,6 +162,11 @@ INITIAL_SIDEBAR_STATE = "expanded"
 # Cache TTL (in seconds)
 CACHE_TTL = 3600  # 1 hour
 
+# Career recommendation results shared across sessions (keyed on normalized inputs)
+RECOMMENDATION_CACHE_SIZE = 256  # entries
+RECOMMENDATION_CACHE_TTL = CACHE_TTL
+RECOMMENDATION_CACHE_MAX_MB = 64
+
 # ============================================================================
 # REPORT SETTINGS
 # ============================================================================
@@ -196,6 +263,15 @@ LOG_FILE = ROOT_DIR / "app.log"
 
 API_VERSION = "v1"
 API_RATE_LIMIT = 100  # requests per minute
+API_HOST = os.environ.get("JOB_ANALYZER_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("JOB_ANALYZER_API_PORT", "8000"))
+API_CACHE_SIZE = 256  # Query results kept in the in-process LRU cache
+API_DEFAULT_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+
+# Static API export (sharded JSON in API_DIR, written by 03_role_stats when enabled)
+STATIC_API_EXPORT = os.environ.get("JOB_ANALYZER_STATIC_API", "0") == "1"
+STATIC_API_TOP_N = 10  # Entries per breakdown in each shard
 
 # ============================================================================
 # Create directories if they don't exist
@@ -204,7 +280,7 @@ API_RATE_LIMIT = 100  # requests per minute
 def ensure_directories():
     """Create all required directories if they don't exist"""
     directories = [
-        DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR,
+        DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, HISTORY_DIR, CACHE_DIR,
         OUTPUT_DIR, CHARTS_DIR, REPORTS_DIR, API_DIR, TEMP_DIR
     ]
     for directory in directories:
@@ -0,0 +1,320 @@
+"""
+DuckDB Analytics Backend
+Runs the 03_role_stats aggregations as SQL over the processed jobs table,
+with parallel and out-of-core execution (ANALYTICS_BACKEND=duckdb)
+"""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from config import (
+    PROCESSED_DATA_DIR, JOBS_PARQUET_FILE, TEMP_DIR,
+    TOP_N_ROLES, TOP_N_SKILLS, TOP_N_COMPANIES, TOP_N_LOCATIONS,
+    SKILL_CATEGORIES, DUCKDB_THREADS, DUCKDB_MEMORY_LIMIT
+)
+from utils import ensure_company_size_bucket, company_size_order
+
+JOBS_CSV_FILE = PROCESSED_DATA_DIR / 'jobs_with_skills.csv'
+
+
+def is_available() -> bool:
+    """Check whether duckdb is installed"""
+    try:
+        import duckdb  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def connect(threads=DUCKDB_THREADS, memory_limit=DUCKDB_MEMORY_LIMIT):
+    """Open an in-memory DuckDB connection that spills to TEMP_DIR past memory_limit"""
+    import duckdb
+
+    con = duckdb.connect()
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    con.execute(f"SET temp_directory = '{TEMP_DIR.as_posix()}'")
+    if threads:
+        con.execute(f"SET threads = {int(threads)}")
+    if memory_limit:
+        con.execute(f"SET memory_limit = '{memory_limit}'")
+    return con
+
+
+def register_views(con) -> str:
+    """
+    Expose the processed jobs table as `jobs` and its skill mentions as `job_skills`
+
+    Parquet (written by 02_extract_skills when pyarrow is installed) is read in
+    place. A CSV is parsed once into a temporary table (spilled to disk when
+    large) without the description text, splitting the pipe-joined skills.
+
+    Returns:
+        The source format used ('parquet' or 'csv')
+    """
+    if JOBS_PARQUET_FILE.exists():
+        con.execute(f"CREATE OR REPLACE VIEW jobs AS SELECT * FROM read_parquet('{JOBS_PARQUET_FILE.as_posix()}')")
+        source = 'parquet'
+    elif JOBS_CSV_FILE.exists():
+        con.execute(f"""
+            CREATE OR REPLACE TEMP TABLE jobs AS
+            SELECT * EXCLUDE (job_details) REPLACE (
+                CASE WHEN skills IS NULL OR skills = '' THEN []::VARCHAR[]
+                     ELSE string_split(skills, '|') END AS skills
+            )
+            FROM read_csv_auto('{JOBS_CSV_FILE.as_posix()}', header = true)
+        """)
+        source = 'csv'
+    else:
+        raise FileNotFoundError(f"No processed jobs table in {PROCESSED_DATA_DIR}")
+
+    con.execute("""
+        CREATE OR REPLACE VIEW job_skills AS
+        SELECT unnest(skills) AS skill FROM jobs
+    """)
+    return source
+
+
+def _rows(con, sql: str, params=None) -> List[tuple]:
+    return con.execute(sql, params or []).fetchall()
+
+
+def _pct(count: int, total: int) -> float:
+    # Rounded in Python so values match the pandas backend exactly
+    return round((count / total) * 100, 2)
+
+
+def _mode_sql(key: str, column: str) -> str:
+    """Most frequent non-null `column` per `key`; ties go to the smallest value like pandas.mode()"""
+    return f"""
+        SELECT {key}, {column} AS mode_value FROM (
+            SELECT {key}, {column},
+                   row_number() OVER (PARTITION BY {key} ORDER BY count(*) DESC, {column}) AS rn
+            FROM jobs
+            WHERE {key} IS NOT NULL AND {column} IS NOT NULL
+            GROUP BY {key}, {column}
+        ) WHERE rn = 1
+    """
+
+
+def _value_counts(con, column: str, limit=None) -> List[tuple]:
+    # Count desc, then value, so ties come out in the same order on every run
+    sql = f"""
+        SELECT {column}, count(*) AS n FROM jobs
+        WHERE {column} IS NOT NULL
+        GROUP BY {column} ORDER BY n DESC, {column}
+    """
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return _rows(con, sql)
+
+
+def analyze_top_roles(con, total_jobs: int) -> Dict[str, Any]:
+    """Top job roles (canonical roles when the jobs table has them)"""
+    columns = {row[0] for row in _rows(con, "DESCRIBE jobs")}
+    role = 'canonical_role' if 'canonical_role' in columns else 'job'
+    return {
+        'total_unique_roles': _rows(con, f"SELECT count(DISTINCT {role}) FROM jobs")[0][0],
+        'total_unique_titles': _rows(con, "SELECT count(DISTINCT job) FROM jobs")[0][0],
+        'top_roles': [
+            {'role': name, 'count': int(count), 'percentage': _pct(count, total_jobs)}
+            for name, count in _value_counts(con, role, TOP_N_ROLES)
+        ]
+    }
+
+
+def analyze_top_skills(con, total_jobs: int) -> Dict[str, Any]:
+    """Most demanded skills"""
+    unique_skills, mentions = _rows(con, "SELECT count(DISTINCT skill), count(*) FROM job_skills")[0]
+    top_skills = _rows(con, f"""
+        SELECT skill, count(*) AS n FROM job_skills
+        GROUP BY skill ORDER BY n DESC, skill LIMIT {TOP_N_SKILLS}
+    """)
+    return {
+        'total_unique_skills': unique_skills,
+        'total_skill_mentions': mentions,
+        'avg_skills_per_job': round(mentions / total_jobs, 2),
+        'top_skills': [
+            {'skill': skill, 'count': int(count), 'percentage': _pct(count, total_jobs)}
+            for skill, count in top_skills
+        ]
+    }
+
+
+def analyze_skill_categories(con, total_jobs: int) -> Dict[str, Any]:
+    """Jobs needing at least one skill from each category, from the category bitmask"""
+    columns = {row[0] for row in _rows(con, "DESCRIBE jobs")}
+    if 'skill_category_mask' not in columns:
+        return {'distribution': []}
+
+    categories = list(SKILL_CATEGORIES.keys())
+    filters = ', '.join(
+        f"count(*) FILTER (WHERE (coalesce(skill_category_mask, 0)::BIGINT & {1 << i}) <> 0)"
+        for i in range(len(categories))
+    )
+    counts = _rows(con, f"SELECT {filters} FROM jobs")[0]
+    return {
+        'distribution': [
+            {'category': category, 'count': int(count), 'percentage': _pct(count, total_jobs)}
+            for category, count in sorted(zip(categories, counts), key=lambda x: x[1], reverse=True)
+        ]
+    }
+
+
+def analyze_companies(con) -> Dict[str, Any]:
+    """Top hiring companies with their most common work type and city"""
+    rows = _rows(con, f"""
+        WITH counts AS (
+            SELECT company_name, count(job_ID) AS job_count FROM jobs
+            WHERE company_name IS NOT NULL GROUP BY company_name
+        )
+        SELECT c.company_name, c.job_count,
+               coalesce(w.mode_value, 'Unknown'), coalesce(l.mode_value, 'Unknown')
+        FROM counts c
+        LEFT JOIN ({_mode_sql('company_name', 'work_type')}) w USING (company_name)
+        LEFT JOIN ({_mode_sql('company_name', 'city')}) l USING (company_name)
+        ORDER BY c.job_count DESC, c.company_name
+        LIMIT {TOP_N_COMPANIES}
+    """)
+    return {
+        'total_companies': _rows(con, "SELECT count(DISTINCT company_name) FROM jobs")[0][0],
+        'top_companies': [
+            {
+                'company': company,
+                'job_count': int(job_count),
+                'primary_work_type': work_type,
+                'primary_location': city
+            }
+            for company, job_count, work_type, city in rows
+        ]
+    }
+
+
+def analyze_locations(con) -> Dict[str, Any]:
+    """Top cities with job counts, hiring companies and most common work type"""
+    rows = _rows(con, f"""
+        WITH counts AS (
+            SELECT city, count(job_ID) AS job_count, count(DISTINCT company_name) AS companies
+            FROM jobs WHERE city IS NOT NULL GROUP BY city
+        )
+        SELECT c.city, c.job_count, c.companies, coalesce(w.mode_value, 'Unknown')
+        FROM counts c
+        LEFT JOIN ({_mode_sql('city', 'work_type')}) w USING (city)
+        ORDER BY c.job_count DESC, c.city
+        LIMIT {TOP_N_LOCATIONS}
+    """)
+    return {
+        'total_locations': _rows(con, "SELECT count(DISTINCT city) FROM jobs")[0][0],
+        'top_locations': [
+            {
+                'city': city,
+                'job_count': int(job_count),
+                'companies': int(companies),
+                'primary_work_type': work_type
+            }
+            for city, job_count, companies, work_type in rows
+        ]
+    }
+
+
+def analyze_work_types(con, total_jobs: int) -> Dict[str, Any]:
+    """Work type distribution"""
+    return {
+        'distribution': [
+            {'work_type': work_type, 'count': int(count), 'percentage': _pct(count, total_jobs)}
+            for work_type, count in _value_counts(con, 'work_type')
+        ]
+    }
+
+
+def analyze_company_sizes(con, total_jobs: int) -> Dict[str, Any]:
+    """Postings, companies and average applications per company size bucket"""
+    columns = {row[0] for row in _rows(con, "DESCRIBE jobs")}
+    order = company_size_order()
+    source = 'jobs'
+    if 'company_size_bucket' not in columns:
+        # Older cleaned data: bucket the few distinct ranges in Python and join them back
+        values = [row[0] for row in _rows(con, "SELECT DISTINCT no_of_employ FROM jobs")]
+        sizes = ensure_company_size_bucket(pd.DataFrame({'no_of_employ': pd.Series(values, dtype=object)}))
+        con.register('company_sizes', sizes)
+        source = 'jobs LEFT JOIN company_sizes USING (no_of_employ)'
+
+    rows = _rows(con, f"""
+        SELECT coalesce(company_size_bucket, '{order[-1]}') AS bucket, count(*),
+               count(DISTINCT company_name), avg(no_of_application)
+        FROM {source} GROUP BY bucket
+    """)
+    rank = {label: i for i, label in enumerate(order)}
+    return {
+        'distribution': [
+            {
+                'bucket': name,
+                'count': int(count),
+                'percentage': _pct(count, total_jobs),
+                'companies': int(companies),
+                'avg_applications': round(float(average), 1) if average is not None else None
+            }
+            for name, count, companies, average in sorted(rows, key=lambda r: (rank.get(r[0], len(order)), r[0]))
+        ]
+    }
+
+def analyze_job_categories(con, total_jobs: int) -> Dict[str, Any]:
+    """Job category distribution"""
+    return {
+        'total_categories': _rows(con, "SELECT count(DISTINCT job_category) FROM jobs")[0][0],
+        'distribution': [
+            {'category': category, 'count': int(count), 'percentage': _pct(count, total_jobs)}
+            for category, count in _value_counts(con, 'job_category')
+        ]
+    }
+
+
+def analyze_experience_levels(con, total_jobs: int) -> Dict[str, Any]:
+    """Experience level distribution and required-years statistics"""
+    n, average, median, low, high = _rows(con, """
+        SELECT count(required_experience_years), avg(required_experience_years),
+               quantile_cont(required_experience_years, 0.5),
+               min(required_experience_years), max(required_experience_years)
+        FROM jobs
+    """)[0]
+    return {
+        'level_distribution': [
+            {'level': level, 'count': int(count), 'percentage': _pct(count, total_jobs)}
+            for level, count in _value_counts(con, 'experience_level')
+        ],
+        'years_statistics': {
+            'average': round(float(average), 1),
+            'median': round(float(median), 1),
+            'min': round(float(low), 1),
+            'max': round(float(high), 1)
+        } if n > 0 else {}
+    }
+
+
+def create_summary_analytics() -> Dict[str, Any]:
+    """Build the analytics_summary.json document with every aggregation run in DuckDB"""
+    con = connect()
+    try:
+        source = register_views(con)
+        threads = _rows(con, "SELECT current_setting('threads')")[0][0]
+        print(f"🦆 DuckDB analytics over {source} ({threads} threads)")
+
+        total_jobs = _rows(con, "SELECT count(*) FROM jobs")[0][0]
+        return {
+            'metadata': {
+                'total_jobs': total_jobs,
+                'generation_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'data_source': 'LinkedIn Job Postings'
+            },
+            'roles': analyze_top_roles(con, total_jobs),
+            'skills': analyze_top_skills(con, total_jobs),
+            'skill_categories': analyze_skill_categories(con, total_jobs),
+            'companies': analyze_companies(con),
+            'locations': analyze_locations(con),
+            'work_types': analyze_work_types(con, total_jobs),
+            'company_sizes': analyze_company_sizes(con, total_jobs),
+            'job_categories': analyze_job_categories(con, total_jobs),
+            'experience': analyze_experience_levels(con, total_jobs)
+        }
+    finally:
+        con.close()
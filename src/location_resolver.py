@@ -0,0 +1,194 @@
+"""
+Location Resolver
+Resolves posting locations ("Bengaluru, Karnataka, India", "Greater Bengaluru
+Area", "Delhi, India") to city, state and country with a bundled gazetteer
+
+Every city, state, country and metro-area name and alias is stored in a word
+trie. Each comma-separated part of a location is scanned for its longest
+known place names, so "Greater Bengaluru Area" finds "bengaluru" and "Navi
+Mumbai" is not read as "Mumbai". Missing levels are filled from the
+gazetteer (a city's state, a state's country).
+
+Distinct location strings are resolved once and cached, together with a hash
+of the gazetteer, so cost follows the number of distinct strings rather than
+rows and a gazetteer edit invalidates the cache.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+UNKNOWN = 'Unknown'
+
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Trie node key holding the places a complete name resolves to
+END = None
+
+Place = Tuple[str, str]  # (kind, canonical name); kind is 'city', 'state' or 'country'
+
+
+def _words(text: str) -> List[str]:
+    return NON_WORD.sub(' ', text.lower().replace('&', ' and ')).split()
+
+
+class Gazetteer:
+    """
+    Place names from a gazetteer JSON file, indexed in a word trie
+
+    Args:
+        data: Parsed gazetteer with countries, states, cities and metro_areas
+    """
+
+    def __init__(self, data: dict):
+        self.states = {name: info['country'] for name, info in data.get('states', {}).items()}
+        self.cities = {
+            name: (info.get('state'), info.get('country') or self.states.get(info.get('state')))
+            for name, info in data.get('cities', {}).items()
+        }
+        self.trie = {}
+        self.names = set()  # Every place name and alias as written
+
+        for name, aliases in data.get('countries', {}).items():
+            self._add(('country', name), [name] + aliases)
+        for name, info in data.get('states', {}).items():
+            self._add(('state', name), [name] + info.get('aliases', []))
+        for name, info in data.get('cities', {}).items():
+            self._add(('city', name), [name] + info.get('aliases', []))
+        # Metro areas resolve to their core city
+        for name, info in data.get('metro_areas', {}).items():
+            self._add(('city', info['city']), [name] + info.get('aliases', []))
+
+    @classmethod
+    def load(cls, path: Path) -> 'Gazetteer':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _add(self, place: Place, names: Iterable[str]) -> None:
+        for name in names:
+            self.names.add(name)
+            node = self.trie
+            for word in _words(name):
+                node = node.setdefault(word, {})
+            places = node.setdefault(END, [])
+            if place not in places:
+                places.append(place)
+
+    def scan(self, text: str) -> List[Place]:
+        """Places named in text, longest name first at each position"""
+        words = _words(text)
+        places = []
+        i = 0
+        while i < len(words):
+            node, match = self.trie, None
+            for j in range(i, len(words)):
+                node = node.get(words[j])
+                if node is None:
+                    break
+                if END in node:
+                    match = (j + 1, node[END])
+            if match is None:
+                i += 1
+            else:
+                i, found = match
+                places.extend(found)
+        return places
+
+    def resolve(self, location: str) -> Tuple[str, str, str]:
+        """
+        (city, state, country) of one location string
+
+        The first part of a location names a city when it can, later parts a
+        state or country ("Delhi, Delhi, India"). A first part the gazetteer
+        does not know is kept as the city name ("Alipur, Delhi, India").
+        """
+        if not isinstance(location, str) or not location.strip() or location.strip() == UNKNOWN:
+            return UNKNOWN, UNKNOWN, UNKNOWN
+
+        found = {}
+        for i, part in enumerate(p.strip() for p in location.split(',')):
+            if not part:
+                continue
+            places = self.scan(part)
+            kinds = ('city', 'state', 'country') if i == 0 else ('state', 'country', 'city')
+            for kind in kinds:
+                names = [name for place_kind, name in places if place_kind == kind]
+                if names and kind not in found:
+                    found[kind] = names[0]
+                    break
+            else:
+                if i == 0 and not places:
+                    found['city'] = part
+
+        city = found.get('city')
+        state = found.get('state')
+        country = found.get('country')
+        if city in self.cities:
+            city_state, city_country = self.cities[city]
+            state = state or city_state
+            country = country or city_country
+        if state in self.states:
+            country = country or self.states[state]
+        return city or UNKNOWN, state or UNKNOWN, country or UNKNOWN
+
+
+class LocationResolver:
+    """
+    Gazetteer lookups with a persistent cache of resolved location strings
+
+    Args:
+        gazetteer_path: Gazetteer JSON file
+        cache_path: Cache file (None keeps results in memory only)
+    """
+
+    def __init__(self, gazetteer_path: Path, cache_path: Optional[Path] = None):
+        raw = Path(gazetteer_path).read_bytes()
+        self.gazetteer = Gazetteer(json.loads(raw))
+        self.gazetteer_hash = hashlib.sha256(raw).hexdigest()
+        self.cache_path = cache_path
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, List[str]]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Results from another gazetteer are stale
+        if cache.get('gazetteer_sha256') != self.gazetteer_hash:
+            return {}
+        return cache.get('locations', {})
+
+    def save(self) -> None:
+        """Write the cache atomically (temp file swapped into place)"""
+        if self.cache_path is None:
+            return
+        path = Path(self.cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'gazetteer_sha256': self.gazetteer_hash, 'locations': self.cache}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def resolve_all(self, locations: Iterable[str]) -> Tuple[Dict[str, Tuple[str, str, str]], int]:
+        """
+        (city, state, country) of every distinct location
+
+        Returns:
+            Location -> (city, state, country), and how many were not cached
+        """
+        resolved, new = {}, 0
+        for location in dict.fromkeys(locations):
+            if not isinstance(location, str):
+                resolved[location] = (UNKNOWN, UNKNOWN, UNKNOWN)
+                continue
+            if location not in self.cache:
+                self.cache[location] = list(self.gazetteer.resolve(location))
+                new += 1
+            resolved[location] = tuple(self.cache[location])
+        return resolved, new
@@ -3,7 +3,10 @@ Logging Configuration
 Centralized logging setup for the entire project
 """
 
+import functools
+import json
 import logging
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -61,26 +64,131 @@ def setup_logger(name: str = 'job_analyzer', level: int = logging.INFO):
     
     return logger
 
+# Structured trace file shared by every stage of one pipeline run
+RUN_ID = os.environ.get('JOB_ANALYZER_RUN_ID') or datetime.now().strftime('%Y%m%d_%H%M%S')
+TRACE_FILE = LOG_DIR / f"trace_{RUN_ID}.jsonl"
+
+# Set to "cprofile" or "pyinstrument" to dump a profile per top-level call
+PROFILE_MODE = os.environ.get('JOB_ANALYZER_PROFILE', '').lower()
+
+# Stack of decorated calls currently running (for parent/depth in traces)
+_call_stack = []
+
+def current_rss_mb():
+    """Return current resident memory in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024**2
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        return None
+
+def count_rows(value):
+    """Row count of a DataFrame/Series (or the first one in a tuple), else None"""
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    if hasattr(value, 'shape') and hasattr(value, 'index'):
+        return int(value.shape[0])
+    return None
+
+def write_trace(record, run_id=None):
+    """Append one JSON record to a run's trace file (this run by default)"""
+    run_id = run_id or RUN_ID
+    record = {'run_id': run_id, 'ts': datetime.now().isoformat(timespec='milliseconds'), **record}
+    with open(LOG_DIR / f"trace_{run_id}.jsonl", 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, default=str) + '\n')
+
+def _profiled_call(func, args, kwargs, stage):
+    """Run func under cProfile or pyinstrument and dump the profile to LOG_DIR"""
+    profile_base = LOG_DIR / f"profile_{RUN_ID}_{stage}_{func.__name__}"
+    
+    if PROFILE_MODE == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.stop()
+                profile_base.with_suffix('.html').write_text(profiler.output_html(), encoding='utf-8')
+        except ImportError:
+            logging.getLogger('job_analyzer').warning("pyinstrument not installed, using cProfile")
+    
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(str(profile_base.with_suffix('.prof')))
+
 def log_execution_time(func):
-    """Decorator to log function execution time"""
+    """
+    Decorator to log function execution time
+    
+    Records wall/CPU time, rows in/out (first DataFrame argument and result)
+    and memory delta to the run's JSONL trace file. When JOB_ANALYZER_PROFILE
+    is set, the outermost decorated call is also profiled.
+    """
     import time
     
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logger = logging.getLogger('job_analyzer')
+        stage = Path(sys.argv[0]).stem or 'interactive'
+        rows_in = next((n for n in map(count_rows, args) if n is not None), None)
+        parent = _call_stack[-1] if _call_stack else None
+        rss_before = current_rss_mb()
         start_time = time.time()
+        start_cpu = time.process_time()
         
         logger.info(f"Starting {func.__name__}...")
         
+        record = {
+            'kind': 'function',
+            'stage': stage,
+            'function': func.__name__,
+            'parent': parent,
+            'parent_path': '/'.join(_call_stack) or None,  # Full chain of decorated callers
+            'depth': len(_call_stack),
+            'rows_in': rows_in
+        }
+        
+        _call_stack.append(func.__name__)
         try:
-            result = func(*args, **kwargs)
+            if PROFILE_MODE and parent is None:
+                result = _profiled_call(func, args, kwargs, stage)
+            else:
+                result = func(*args, **kwargs)
             elapsed_time = time.time() - start_time
             logger.info(f"Completed {func.__name__} in {elapsed_time:.2f} seconds")
+            record.update(status='ok', rows_out=count_rows(result))
             return result
             
         except Exception as e:
             elapsed_time = time.time() - start_time
             logger.error(f"Failed {func.__name__} after {elapsed_time:.2f} seconds: {str(e)}")
+            record.update(status='error', error=str(e), rows_out=None)
             raise
+        
+        finally:
+            _call_stack.pop()
+            rss_after = current_rss_mb()
+            record.update(
+                wall_seconds=round(time.time() - start_time, 4),
+                cpu_seconds=round(time.process_time() - start_cpu, 4),
+                rss_mb=round(rss_after, 1) if rss_after is not None else None,
+                mem_delta_mb=round(rss_after - rss_before, 1)
+                if rss_after is not None and rss_before is not None else None
+            )
+            write_trace(record)
     
     return wrapper
 
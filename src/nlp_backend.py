@@ -0,0 +1,137 @@
+"""
+spaCy Skill Extraction Backend
+Token-aware skill matching with PhraseMatcher and batched nlp.pipe
+"""
+
+import time
+from typing import Iterable, List, Tuple
+
+import pandas as pd
+
+from config import NLP_MODEL, MAX_TOKENS_PER_DOC, NLP_BATCH_SIZE, NLP_N_PROCESS
+
+_NLP = None
+_MATCHERS = {}
+
+
+def is_available() -> bool:
+    """Check whether spaCy is installed"""
+    try:
+        import spacy  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def load_nlp():
+    """Load the configured spaCy model once, keeping only the tokenizer"""
+    global _NLP
+    if _NLP is None:
+        import spacy
+
+        try:
+            nlp = spacy.load(NLP_MODEL)
+        except OSError:
+            # Model not downloaded; PhraseMatcher only needs the tokenizer
+            print(f"   ⚠️ spaCy model '{NLP_MODEL}' not found, using blank English tokenizer")
+            nlp = spacy.blank("en")
+
+        # Matching on LOWER needs no tagger/parser/NER, so switch them all off
+        nlp.select_pipes(disable=nlp.pipe_names)
+        nlp.max_length = MAX_TOKENS_PER_DOC
+        _NLP = nlp
+    return _NLP
+
+
+def build_phrase_matcher(skill_model):
+    """Build a case-insensitive PhraseMatcher with one pattern per alias"""
+    key = id(skill_model)
+    if key not in _MATCHERS:
+        from spacy.matcher import PhraseMatcher
+
+        nlp = load_nlp()
+        matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        for alias, skill_id in skill_model.alias_to_id.items():
+            matcher.add(str(skill_id), [nlp.make_doc(alias)])
+        _MATCHERS[key] = matcher
+    return _MATCHERS[key]
+
+
+def extract_skills_batch(texts: Iterable, skill_model,
+                         batch_size: int = NLP_BATCH_SIZE,
+                         n_process: int = NLP_N_PROCESS) -> List[Tuple[List[int], int]]:
+    """
+    Extract skills from many descriptions with nlp.pipe
+
+    Args:
+        texts: Job descriptions (NaN-safe)
+        skill_model: SkillModel providing aliases and category masks
+        batch_size: Docs per nlp.pipe batch
+        n_process: Worker processes for tokenization
+
+    Returns:
+        One (sorted skill IDs, category bitmask) tuple per text, the same
+        schema as SkillModel.match
+    """
+    nlp = load_nlp()
+    matcher = build_phrase_matcher(skill_model)
+    vocab_strings = nlp.vocab.strings
+
+    cleaned = (
+        '' if pd.isna(text) else str(text)[:MAX_TOKENS_PER_DOC]
+        for text in texts
+    )
+
+    results = []
+    for doc in nlp.pipe(cleaned, batch_size=batch_size, n_process=n_process):
+        found = {int(vocab_strings[match_id]) for match_id, _, _ in matcher(doc)}
+        mask = 0
+        for skill_id in found:
+            mask |= skill_model.skill_masks[skill_id]
+        results.append((sorted(found), mask))
+
+    return results
+
+
+def compare_backends(texts: List, skill_model) -> dict:
+    """Time the regex and spaCy backends on the same texts (docs/sec)"""
+    results = {'docs': len(texts)}
+
+    start = time.perf_counter()
+    for text in texts:
+        skill_model.match(text)
+    elapsed = time.perf_counter() - start
+    results['regex'] = {
+        'seconds': round(elapsed, 4),
+        'docs_per_sec': round(len(texts) / elapsed, 1) if elapsed > 0 else None
+    }
+
+    if is_available():
+        load_nlp()
+        build_phrase_matcher(skill_model)
+        start = time.perf_counter()
+        extract_skills_batch(texts, skill_model)
+        elapsed = time.perf_counter() - start
+        results['spacy'] = {
+            'seconds': round(elapsed, 4),
+            'docs_per_sec': round(len(texts) / elapsed, 1) if elapsed > 0 else None
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    from config import SKILL_CATEGORIES, CLEANED_CSV_FILE
+    from skill_model import SkillModel
+
+    if not is_available():
+        print("❌ spaCy is not installed (pip install spacy)")
+    elif not CLEANED_CSV_FILE.exists():
+        print("❌ Cleaned data not found, run 01_ingest_clean.py first")
+    else:
+        texts = pd.read_csv(CLEANED_CSV_FILE)['job_details'].tolist()
+        stats = compare_backends(texts, SkillModel(SKILL_CATEGORIES))
+        print(f"📊 Skill extraction throughput on {stats['docs']:,} docs:")
+        for backend in ('regex', 'spacy'):
+            if backend in stats:
+                print(f"   {backend:.<10} {stats[backend]['docs_per_sec']:>10,.1f} docs/sec")
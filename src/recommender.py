@@ -0,0 +1,416 @@
+"""
+Career Recommender
+Scores processed job postings against a candidate's skills and preferences
+
+calculate_career_recommendations does the scoring as array operations over
+packed skill bitsets; calculate_career_recommendations_loop is the original
+per-job implementation, kept as the reference the fast path must match.
+"""
+
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+
+import numpy as np
+import pandas as pd
+
+from skill_bitset import SkillBitsets, dense
+from utils import role_column
+
+
+def experience_level(years):
+    """Bucket years of experience the way the recommender reads them"""
+    if years <= 2:
+        return "Junior"
+    elif years <= 5:
+        return "Mid-Level"
+    return "Senior"
+
+
+def _most_common(counter, n):
+    """Counter.most_common with ties broken by name, so results do not depend on set order"""
+    return sorted(counter.items(), key=lambda x: (-x[1], x[0]))[:n]
+
+
+def calculate_career_recommendations_loop(df, user_skills, experience, work_type, location, goal):
+    """Reference implementation: score every job in a Python loop"""
+    
+    # Filter jobs based on preferences
+    filtered_df = df.copy()
+    
+    if work_type != "Any":
+        filtered_df = filtered_df[filtered_df['work_type'] == work_type]
+    
+    if location != "Any":
+        filtered_df = filtered_df[filtered_df['city'] == location]
+    
+    # Roles are aggregated by canonical role when titles were normalized
+    role = role_column(filtered_df)
+    
+    # Calculate match scores for each job
+    job_scores = []
+    
+    for idx, job in filtered_df.iterrows():
+        job_skills = job.get('skills', [])
+        if isinstance(job_skills, str):
+            job_skills = job_skills.split('|') if job_skills else []
+        
+        # Calculate match score
+        if not job_skills:
+            match_score = 0
+        else:
+            matching_skills = set(user_skills) & set(job_skills)
+            match_score = (len(matching_skills) / len(job_skills)) * 100
+        
+        skills_you_have = list(set(user_skills) & set(job_skills))
+        skills_to_learn = list(set(job_skills) - set(user_skills))
+        
+        job_scores.append({
+            'job_id': job.get('job_ID', idx),
+            'title': job.get(role, 'Unknown'),
+            'company': job.get('company_name', 'Unknown'),
+            'location': job.get('city', 'Unknown'),
+            'work_type': job.get('work_type', 'Unknown'),
+            'match_score': match_score,
+            'skills_you_have': skills_you_have,
+            'skills_to_learn': skills_to_learn,
+            'job_skills': job_skills
+        })
+    
+    # Group by job title
+    role_aggregation = defaultdict(lambda: {
+        'job_count': 0,
+        'total_match_score': 0,
+        'companies': set(),
+        'locations': set(),
+        'work_types': set(),
+        'all_skills_you_have': [],
+        'all_skills_to_learn': []
+    })
+    
+    for job in job_scores:
+        title = job['title']
+        role_aggregation[title]['job_count'] += 1
+        role_aggregation[title]['total_match_score'] += job['match_score']
+        role_aggregation[title]['companies'].add(job['company'])
+        role_aggregation[title]['locations'].add(job['location'])
+        role_aggregation[title]['work_types'].add(job['work_type'])
+        role_aggregation[title]['all_skills_you_have'].extend(job['skills_you_have'])
+        role_aggregation[title]['all_skills_to_learn'].extend(job['skills_to_learn'])
+    
+    # Calculate top recommended roles
+    top_roles = []
+    for title, data in role_aggregation.items():
+        avg_match = data['total_match_score'] / data['job_count'] if data['job_count'] > 0 else 0
+        
+        # Get most common skills
+        skills_you_have_counter = Counter(data['all_skills_you_have'])
+        skills_to_learn_counter = Counter(data['all_skills_to_learn'])
+        
+        top_roles.append({
+            'title': title,
+            'match_score': avg_match,
+            'job_count': data['job_count'],
+            'top_companies': sorted(list(data['companies']), key=lambda x: x)[:5],
+            'locations': sorted(list(data['locations']), key=lambda x: x)[:5],
+            'work_types': sorted(list(data['work_types'])),
+            'skills_you_have': [s for s, _ in _most_common(skills_you_have_counter, 10)],
+            'skills_to_learn': [s for s, _ in _most_common(skills_to_learn_counter, 10)]
+        })
+    
+    # Sort by match score
+    top_roles.sort(key=lambda x: (x['match_score'], x['job_count']), reverse=True)
+    
+    # Calculate missing skills across all jobs
+    all_missing_skills = []
+    for job in job_scores:
+        all_missing_skills.extend(job['skills_to_learn'])
+    
+    missing_skills_counter = Counter(all_missing_skills)
+    missing_skills = [{'skill': s, 'demand': c} for s, c in _most_common(missing_skills_counter, 20)]
+    
+    # Calculate value of user's current skills
+    user_skill_value = []
+    for skill in user_skills:
+        count = sum(1 for job in job_scores if skill in job['job_skills'])
+        if count > 0:
+            user_skill_value.append({'skill': skill, 'value': count})
+    user_skill_value.sort(key=lambda x: x['value'], reverse=True)
+    
+    # Create learning path (prioritize by demand)
+    learning_path = []
+    for item in missing_skills[:15]:
+        # Estimate learning time based on skill complexity (simplified)
+        learning_time = "2-4 weeks" if item['demand'] > 100 else "1-2 weeks"
+        learning_path.append({
+            'skill': item['skill'],
+            'demand': item['demand'],
+            'learning_time': learning_time
+        })
+    
+    matching_jobs = sum(1 for job in job_scores if job['match_score'] > 0)
+    avg_match = sum(job['match_score'] for job in job_scores) / len(job_scores) if job_scores else 0
+    
+    return {
+        'total_jobs': len(filtered_df),
+        'matching_jobs': matching_jobs,
+        'avg_match_score': avg_match,
+        'skills_gap': len(missing_skills),
+        'top_roles': top_roles,
+        'missing_skills': missing_skills,
+        'your_skill_value': user_skill_value,
+        'learning_path': learning_path
+    }
+
+
+def _as_list(value):
+    """Skills cell as a list (pipe-joined strings are split, missing values are empty)"""
+    if isinstance(value, str):
+        return value.split('|') if value else []
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return []
+
+
+def _column(df, name):
+    """Column values as an object array ('Unknown' when the column is missing)"""
+    if name in df.columns:
+        return df[name].to_numpy(dtype=object)
+    return np.full(len(df), 'Unknown', dtype=object)
+
+
+def _top_k(values, k=None, secondary=None):
+    """
+    Indices of the k largest values (then largest secondary), ties by index
+
+    values and secondary must be signed or float arrays (they are negated).
+
+    np.argpartition first narrows the candidates to values tied with or above
+    the k-th largest, so only those are fully sorted.
+    """
+    candidates = np.arange(len(values))
+    if k is not None and 0 < k < len(values):
+        kth = values[np.argpartition(-values, k - 1)[k - 1]]
+        candidates = np.flatnonzero(values >= kth)
+
+    keys = [candidates]
+    if secondary is not None:
+        keys.append(-secondary[candidates])
+    keys.append(-values[candidates])
+    return candidates[np.lexsort(keys)][:k]
+
+
+def _top_skills(counts, mask, vocab, k):
+    """Names of up to k skills in mask with the highest nonzero counts, ties by name"""
+    values = np.where(mask, counts, 0)
+    return [(vocab[i], int(values[i])) for i in _top_k(values, k) if values[i] > 0]
+
+
+def calculate_career_recommendations(df, user_skills, experience, work_type, location, goal,
+                                     top_k=None, bitsets=None):
+    """
+    Calculate personalized career recommendations with array operations
+
+    Same result as calculate_career_recommendations_loop. Each job's skill set
+    is a packed bitset, so overlap with the user's skills is AND + popcount;
+    per-title totals come from np.bincount over factorized titles.
+
+    Args:
+        top_k: Only build the top_k recommended roles (all roles if None)
+        bitsets: SkillBitsets row-aligned with df (e.g. the persisted
+            skill_bitsets.npz); packed from df['skills'] if not given
+    """
+    # Filter jobs based on preferences (as a row mask, so bitsets stay aligned)
+    keep = np.ones(len(df), dtype=bool)
+    if work_type != "Any":
+        keep &= (df['work_type'] == work_type).to_numpy()
+    if location != "Any":
+        keep &= (df['city'] == location).to_numpy()
+    filtered_df = df[keep]
+
+    if bitsets is None:
+        skills = filtered_df['skills'] if 'skills' in filtered_df.columns else [[]] * len(filtered_df)
+        lists = [_as_list(value) for value in skills]
+        job_sets = SkillBitsets.from_lists(lists)
+        lengths = np.fromiter((len(items) for items in lists), dtype=np.int64, count=len(lists))
+    else:
+        job_sets = bitsets.take(keep)
+        lengths = job_sets.sizes()
+
+    # Per-job match: distinct user skills in the job / skills the job lists
+    overlap = job_sets.intersection_sizes(job_sets.mask(user_skills))
+    match_scores = np.zeros(len(lengths))
+    np.divide(overlap, lengths, out=match_scores, where=lengths > 0)
+    match_scores *= 100
+
+    # Job x skill 0/1 matrix with columns in name order, so count ties break by name
+    order = np.argsort(job_sets.vocab.to_numpy(dtype=str), kind='stable')
+    vocab = job_sets.vocab[order]
+    matrix = dense(job_sets.bits, len(job_sets.vocab))[:, order]
+    user_mask = vocab.isin(set(user_skills))
+
+    # Per-title aggregates; codes follow first appearance like the dict in the loop version
+    title_codes, titles = pd.factorize(_column(filtered_df, role_column(filtered_df)), use_na_sentinel=False)
+    job_counts = np.bincount(title_codes, minlength=len(titles))
+    avg_match = np.bincount(title_codes, weights=match_scores, minlength=len(titles)) / np.maximum(job_counts, 1)
+
+    rows_by_title = np.argsort(title_codes, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(job_counts)])
+    companies = _column(filtered_df, 'company_name')
+    cities = _column(filtered_df, 'city')
+    work_types = _column(filtered_df, 'work_type')
+
+    top_roles = []
+    for t in _top_k(avg_match, top_k, secondary=job_counts):
+        rows = rows_by_title[bounds[t]:bounds[t + 1]]
+        title_skill_counts = matrix[rows].sum(axis=0, dtype=np.int64)
+        top_roles.append({
+            'title': titles[t],
+            'match_score': float(avg_match[t]),
+            'job_count': int(job_counts[t]),
+            'top_companies': sorted(set(companies[rows].tolist()))[:5],
+            'locations': sorted(set(cities[rows].tolist()))[:5],
+            'work_types': sorted(set(work_types[rows].tolist())),
+            'skills_you_have': [s for s, _ in _top_skills(title_skill_counts, user_mask, vocab, 10)],
+            'skills_to_learn': [s for s, _ in _top_skills(title_skill_counts, ~user_mask, vocab, 10)]
+        })
+
+    # Jobs listing each skill
+    skill_demand = matrix.sum(axis=0, dtype=np.int64)
+    missing_skills = [
+        {'skill': s, 'demand': c} for s, c in _top_skills(skill_demand, ~user_mask, vocab, 20)
+    ]
+
+    # Value of user's current skills, in the order given (stable sort by value)
+    # Skills not in any filtered job map to -1, i.e. the appended 0
+    values = np.append(skill_demand, 0)[vocab.get_indexer(list(user_skills))]
+    user_skill_value = [
+        {'skill': user_skills[i], 'value': int(values[i])}
+        for i in np.argsort(-values, kind='stable') if values[i] > 0
+    ]
+
+    learning_path = [
+        {
+            'skill': item['skill'],
+            'demand': item['demand'],
+            'learning_time': "2-4 weeks" if item['demand'] > 100 else "1-2 weeks"
+        }
+        for item in missing_skills[:15]
+    ]
+
+    return {
+        'total_jobs': len(filtered_df),
+        'matching_jobs': int((match_scores > 0).sum()),
+        # Python's sum keeps the loop version's summation order exactly
+        'avg_match_score': sum(match_scores.tolist()) / len(match_scores) if len(match_scores) else 0,
+        'skills_gap': len(missing_skills),
+        'top_roles': top_roles,
+        'missing_skills': missing_skills,
+        'your_skill_value': user_skill_value,
+        'learning_path': learning_path
+    }
+
+
+class RecommendationCache:
+    """
+    Thread-safe LRU + TTL cache of recommendation results
+
+    Keys are normalized request inputs (see make_key), so the same skill
+    combination in any order and any experience within one bucket share an
+    entry. Entries expire after ttl_seconds; the least recently used are
+    evicted past max_entries or max_bytes (measured as pickled size).
+    Cached results are shared: treat them as read-only.
+    """
+
+    def __init__(self, max_entries=256, ttl_seconds=3600, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (expires_at, size, result)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(user_skills, experience, work_type, location, goal, data_version, top_k=None):
+        """Normalized cache key: sorted unique skills and the experience bucket"""
+        return (
+            tuple(sorted(set(user_skills))), experience_level(experience),
+            work_type, location, goal, data_version, top_k
+        )
+
+    def get(self, key):
+        """Cached result for key, or None (counts a hit or a miss)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, result):
+        """Store a result, evicting least recently used entries to stay within the caps"""
+        size = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, result)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+def cached_recommendations(cache, data_version, df, user_skills, experience, work_type, location, goal,
+                           top_k=None, bitsets=None):
+    """
+    calculate_career_recommendations through a RecommendationCache
+
+    Skills are deduplicated and sorted before scoring so every request that
+    maps to one key gets the same result; data_version (the jobs artifact
+    hash) keeps results from older data from being served.
+    """
+    key = cache.make_key(user_skills, experience, work_type, location, goal, data_version, top_k)
+    result = cache.get(key)
+    if result is None:
+        result = calculate_career_recommendations(
+            df, list(key[0]), experience, work_type, location, goal, top_k=top_k, bitsets=bitsets
+        )
+        cache.put(key, result)
+    return result
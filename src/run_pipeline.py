@@ -1,59 +1,296 @@
 """
 Master Script - Run Complete Pipeline
 Executes all processing scripts in sequence
+
+Usage:
+    python src/run_pipeline.py                                # normal run
+    python src/run_pipeline.py --benchmark --sizes 1k,10k,100k  # scaling benchmark
 """
 
+import argparse
+import math
+import os
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
+SRC_DIR = Path(__file__).parent
+ROOT_DIR = SRC_DIR.parent
+
+sys.path.append(str(SRC_DIR))
+from logger import RUN_ID, TRACE_FILE, write_trace
+
+# Pipeline scripts in execution order
+PIPELINE_SCRIPTS = [
+    ('01_ingest_clean.py', 'Data Ingestion & Cleaning'),
+    ('02_extract_skills.py', 'Skill Extraction'),
+    ('03_role_stats.py', 'Analytics Generation'),
+    ('04_generate_charts.py', 'Chart Generation'),
+    ('05_build_indexes.py', 'Index Building')
+]
+
+# Files each stage reads, relative to the data directory (for bytes-read accounting)
+STAGE_INPUTS = {
+    '01_ingest_clean.py': ['raw/linkdin_Job_data.csv'],
+    '02_extract_skills.py': ['processed/cleaned_jobs.csv'],
+    '03_role_stats.py': ['processed/jobs_with_skills.csv', 'processed/skills_extracted.csv', 'processed/skill_bitsets.npz'],
+    '04_generate_charts.py': ['processed/analytics_summary.json', 'processed/jobs_with_skills.csv'],
+    '05_build_indexes.py': ['processed/jobs_with_skills.csv', 'processed/skill_bitsets.npz']
+}
+
+# Scaling exponent above which a stage is flagged as growing faster than linear
+SUPERLINEAR_EXPONENT = 1.2
+
 def print_header(text):
     """Print formatted header"""
     print("\n" + "="*70)
     print(f"  {text}")
     print("="*70 + "\n")
 
-def run_script(script_path, script_name):
+def run_script(script_path, script_name, env=None):
     """Run a Python script and handle errors"""
     print(f"🚀 Running: {script_name}...")
     print(f"   Script: {script_path}")
     print("-" * 70)
     
-    start_time = datetime.now()
+    stats = measure_script(script_path, env)
+    write_trace({
+        'kind': 'stage',
+        'stage': script_path.stem,
+        'name': script_name,
+        'status': 'ok' if stats['exit_code'] == 0 else 'error',
+        **stats
+    }, run_id=(env or os.environ).get('JOB_ANALYZER_RUN_ID'))
+    
+    elapsed = stats['wall_seconds']
+    if stats['exit_code'] == 0:
+        print(f"\n✅ {script_name} completed successfully in {elapsed:.1f}s")
+        return True
+    
+    print(f"\n❌ {script_name} failed after {elapsed:.1f}s")
+    print(f"   Error code: {stats['exit_code']}")
+    return False
+
+def snapshot_files(directory):
+    """Map every file under directory to (size, mtime_ns)"""
+    files = {}
+    for path in Path(directory).rglob('*'):
+        if path.is_file():
+            stat = path.stat()
+            files[path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+def measure_script(script_path, env=None, log_file=None):
+    """
+    Run one stage as a child process and collect resource usage
+    
+    Output goes to log_file when given, otherwise to the console.
+    
+    Returns:
+        Dict with exit code, wall/CPU seconds, peak RSS and block I/O.
+        CPU, RSS and block I/O are None where os.wait4 is unavailable (Windows).
+    """
+    start = time.perf_counter()
+    log = open(log_file, 'w', encoding='utf-8') if log_file else None
     
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             [sys.executable, str(script_path)],
-            capture_output=False,
-            text=True,
-            check=True
+            stdout=log,
+            stderr=subprocess.STDOUT if log else None,
+            env=env
         )
         
-        elapsed = (datetime.now() - start_time).total_seconds()
-        print(f"\n✅ {script_name} completed successfully in {elapsed:.1f}s")
-        return True
+        if hasattr(os, 'wait4'):
+            # wait4 returns the rusage of this child only, not all children
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is KB on Linux and bytes on macOS
+            rss_scale = 1 if sys.platform == 'darwin' else 1024
+            stats = {
+                'cpu_seconds': round(usage.ru_utime + usage.ru_stime, 3),
+                'peak_rss_mb': round(usage.ru_maxrss * rss_scale / 1024**2, 1),
+                'block_reads': usage.ru_inblock,
+                'block_writes': usage.ru_oublock
+            }
+        else:
+            process.wait()
+            stats = {'cpu_seconds': None, 'peak_rss_mb': None,
+                     'block_reads': None, 'block_writes': None}
+    finally:
+        if log:
+            log.close()
+    
+    stats['wall_seconds'] = round(time.perf_counter() - start, 3)
+    stats['exit_code'] = process.returncode
+    return stats
+
+def benchmark_size(n, workspace, seed):
+    """Generate n synthetic postings and run every stage on them"""
+    data_dir = workspace / 'data'
+    output_dir = workspace / 'outputs'
+    raw_file = data_dir / 'raw' / 'linkdin_Job_data.csv'
+    
+    # Generate in a child process: Linux copies the parent's peak RSS into
+    # forked children, so a large parent would inflate every stage's number
+    print(f"\n🧪 Generating {n:,} synthetic postings...")
+    subprocess.run(
+        [sys.executable, str(ROOT_DIR / 'benchmarks' / 'synthetic_corpus.py'),
+         '--rows', str(n), '--seed', str(seed), '--output', str(raw_file)],
+        check=True, capture_output=True
+    )
+    
+    env = dict(os.environ,
+               JOB_ANALYZER_RUN_ID=f"bench_n{n}_{RUN_ID}",
+               JOB_ANALYZER_DATA_DIR=str(data_dir),
+               JOB_ANALYZER_OUTPUT_DIR=str(output_dir),
+               PYTHONIOENCODING='utf-8')
+               
+    stages = {}
+    for script_file, script_name in PIPELINE_SCRIPTS:
+        bytes_read = sum(
+            (data_dir / rel).stat().st_size
+            for rel in STAGE_INPUTS.get(script_file, [])
+            if (data_dir / rel).exists()
+        )
+        before = snapshot_files(workspace)
         
-    except subprocess.CalledProcessError as e:
-        elapsed = (datetime.now() - start_time).total_seconds()
-        print(f"\n❌ {script_name} failed after {elapsed:.1f}s")
-        print(f"   Error code: {e.returncode}")
-        return False
+        stats = measure_script(SRC_DIR / script_file, env,
+                               workspace / f"{Path(script_file).stem}.log")
+                               
+        after = snapshot_files(workspace)
+        stats['bytes_read'] = bytes_read
+        stats['bytes_written'] = sum(
+            size for path, (size, mtime) in after.items()
+            if path.suffix != '.log' and before.get(path) != (size, mtime)
+        )
+        stats['rows_per_sec'] = round(n / stats['wall_seconds'], 1) if stats['wall_seconds'] else None
+        stages[script_name] = stats
+        write_trace({
+            'kind': 'stage',
+            'stage': Path(script_file).stem,
+            'name': script_name,
+            'status': 'ok' if stats['exit_code'] == 0 else 'error',
+            'rows_in': n,
+            **stats
+        }, run_id=env['JOB_ANALYZER_RUN_ID'])
+        
+        status = "✅" if stats['exit_code'] == 0 else "❌"
+        rss = f"{stats['peak_rss_mb']:>8.1f} MB" if stats['peak_rss_mb'] is not None else "     n/a"
+        print(f"   {status} {script_name:.<30} {stats['wall_seconds']:>8.2f}s wall, {rss} peak")
+        
+        if stats['exit_code'] != 0:
+            print(f"      See log: {workspace / (Path(script_file).stem + '.log')}")
+            break
+            
+    return {'docs': n, 'stages': stages}
+
+def scaling_exponents(runs):
+    """Estimate how each stage's wall time grows with input size (log-log slope)"""
+    exponents = {}
+    for prev, cur in zip(runs, runs[1:]):
+        for name, stats in cur['stages'].items():
+            old = prev['stages'].get(name)
+            if not old or old['exit_code'] != 0 or stats['exit_code'] != 0:
+                continue
+            if old['wall_seconds'] > 0 and stats['wall_seconds'] > 0:
+                slope = math.log(stats['wall_seconds'] / old['wall_seconds']) / math.log(cur['docs'] / prev['docs'])
+                exponents.setdefault(name, []).append(round(slope, 2))
+    return exponents
+
+def print_scaling_table(runs, exponents):
+    """Print wall time, peak RSS and growth per stage across sizes"""
+    print_header("📈 SCALING TABLE")
+    
+    sizes = [run['docs'] for run in runs]
+    header = f"{'Stage':<28}" + ''.join(f"{n:>14,}" for n in sizes) + f"{'growth':>10}"
+    
+    for metric, label, fmt in [('wall_seconds', 'Wall time (s)', '{:>14.2f}'),
+                               ('cpu_seconds', 'CPU time (s)', '{:>14.2f}'),
+                               ('peak_rss_mb', 'Peak RSS (MB)', '{:>14.1f}')]:
+        print(f"{label}")
+        print(header)
+        for script_file, script_name in PIPELINE_SCRIPTS:
+            row = f"{script_name:<28}"
+            for run in runs:
+                value = run['stages'].get(script_name, {}).get(metric)
+                failed = run['stages'].get(script_name, {}).get('exit_code', 0) != 0
+                row += f"{'FAILED':>14}" if failed else (fmt.format(value) if value is not None else f"{'-':>14}")
+            growth = max(exponents.get(script_name, [0.0]))
+            flag = " ⚠️" if growth > SUPERLINEAR_EXPONENT else ""
+            row += f"{'n^' + format(growth, '.2f'):>10}{flag}" if metric == 'wall_seconds' else ''
+            print(row)
+        print()
+        
+    print(f"growth = worst log-log slope of wall time between consecutive sizes "
+          f"(⚠️ above n^{SUPERLINEAR_EXPONENT})")
+
+def run_benchmark(sizes, seed=42, keep=False):
+    """Run the full pipeline on synthetic inputs of increasing size"""
+    sys.path.append(str(ROOT_DIR / 'benchmarks'))
+    from bench_utils import write_results, RESULTS_DIR
+    
+    print_header("⏱️ JOB TRENDS ANALYZER - PIPELINE BENCHMARK")
+    
+    # Growth is measured between consecutive sizes, so they must differ and increase
+    sizes = sorted(set(sizes))
+    bench_root = RESULTS_DIR / f"pipeline_workspace_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    runs = []
+    
+    for n in sizes:
+        workspace = bench_root / f"n{n}"
+        run = benchmark_size(n, workspace, seed)
+        runs.append(run)
+        
+        if not keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+            
+        if any(stats['exit_code'] != 0 for stats in run['stages'].values()):
+            print(f"\n⚠️  A stage failed at {n:,} rows, skipping larger sizes")
+            break
+            
+    if not keep:
+        shutil.rmtree(bench_root, ignore_errors=True)
+        
+    exponents = scaling_exponents(runs)
+    print_scaling_table(runs, exponents)
+    
+    return write_results('pipeline', {
+        'seed': seed,
+        'sizes': sizes,
+        'runs': runs,
+        'scaling_exponents': exponents
+    })
 
 def main():
     """Main pipeline execution"""
+    parser = argparse.ArgumentParser(description="Run the job trends data pipeline")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Run the pipeline on synthetic inputs and report per-stage resource usage")
+    parser.add_argument('--sizes', default='1k,10k,50k',
+                        help="Benchmark input sizes, e.g. 1k,10k,100k")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic corpus seed")
+    parser.add_argument('--keep', action='store_true',
+                        help="Keep benchmark workspaces (data, charts, stage logs)")
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        sys.path.append(str(ROOT_DIR / 'benchmarks'))
+        from bench_utils import parse_scales
+        run_benchmark(parse_scales(args.sizes), seed=args.seed, keep=args.keep)
+        return
+        
     print_header("🎯 JOB TRENDS ANALYZER - FULL PIPELINE")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
-    # Define pipeline scripts
-    src_dir = Path(__file__).parent
+    # Every stage appends to the same trace file
+    os.environ['JOB_ANALYZER_RUN_ID'] = RUN_ID
     
-    scripts = [
-        (src_dir / '01_ingest_clean.py', 'Data Ingestion & Cleaning'),
-        (src_dir / '02_extract_skills.py', 'Skill Extraction'),
-        (src_dir / '03_role_stats.py', 'Analytics Generation'),
-        (src_dir / '04_generate_charts.py', 'Chart Generation')
-    ]
+    # Define pipeline scripts
+    scripts = [(SRC_DIR / script_file, script_name) for script_file, script_name in PIPELINE_SCRIPTS]
     
     # Track results
     results = []
@@ -84,6 +321,7 @@ def main():
     
     print(f"\nTotal execution time: {total_elapsed:.1f}s")
     print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Run trace: {TRACE_FILE}")
     
     # Final status
     all_success = all(success for _, success in results)
@@ -0,0 +1,221 @@
+"""
+Job Search Index
+SQLite FTS5 full-text index over job titles and descriptions with BM25
+ranking, title prefix search and exact-match filters on the job fields
+
+Text queries join the FTS5 matches to the jobs table with CROSS JOIN, which
+keeps the match as the outer loop; otherwise SQLite may walk a filter index
+and probe the full-text index once per job.
+
+BM25 scoring dominates query time, so ranked queries score a bounded set of
+candidates: the first RANK_CANDIDATES matches (in job_ID order) that pass the
+filters. Queries matching fewer jobs are ranked exactly; broader ones ("data",
+"experience") return the best of those candidates rather than of every match,
+and their scoring cost no longer grows with the corpus. Not bounded, so not
+within a fixed budget (such as 50 ms on 1M postings): last-word prefixes longer
+than the 2- and 3-character prefix indexes ("experien*"; FTS5 merges the
+posting list of every word with that prefix first), filters that few of a
+common word's matches pass (the scan runs until RANK_CANDIDATES pass), and
+count().
+"""
+
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Filter name -> jobs column (exact match)
+FILTER_COLUMNS = {
+    'work_type': 'work_type',
+    'city': 'city',
+    'company': 'company_name',
+    'category': 'job_category',
+    'experience_level': 'experience_level',
+    'company_size': 'company_size_bucket'
+}
+
+INDEX_COLUMNS = ['job_ID', 'job', 'job_details'] + list(FILTER_COLUMNS.values())
+
+# BM25 column weights: a term in the title counts as much as ten in the description
+TITLE_WEIGHT = 10.0
+DETAILS_WEIGHT = 1.0
+
+# Matches scored per ranked query (see the module docstring); None ranks every match
+RANK_CANDIDATES = 2000
+
+SCHEMA = """
+CREATE TABLE jobs (
+    job_ID              INTEGER PRIMARY KEY,
+    job                 TEXT,
+    company_name        TEXT,
+    city                TEXT,
+    work_type           TEXT,
+    job_category        TEXT,
+    experience_level    TEXT,
+    company_size_bucket TEXT
+);
+-- Contentless: the text lives in jobs_with_skills.csv, only the index is stored
+CREATE VIRTUAL TABLE jobs_fts USING fts5(
+    job, job_details,
+    content = '',
+    tokenize = 'porter unicode61',
+    prefix = '2 3'
+);
+"""
+
+FILTER_INDEXES = "\n".join(
+    f"CREATE INDEX idx_jobs_{column} ON jobs ({column});" for column in FILTER_COLUMNS.values()
+)
+
+TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_index(db_path: Path, df: pd.DataFrame) -> int:
+    """
+    Write a fresh search index for df to db_path
+
+    The index is built next to db_path and moved into place when complete,
+    so readers never see a half-written file.
+
+    Returns:
+        Number of jobs indexed
+    """
+    tmp_path = db_path.with_name(db_path.name + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        columns = ['job_ID', 'job'] + list(FILTER_COLUMNS.values())
+        rows = df[columns].astype(object).where(df[columns].notna(), None)
+        with conn:
+            conn.executemany(
+                f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows.itertuples(index=False, name=None)
+            )
+            conn.executemany(
+                "INSERT INTO jobs_fts (rowid, job, job_details) VALUES (?, ?, ?)",
+                zip(df['job_ID'].tolist(), df['job'].fillna('').tolist(), df['job_details'].fillna('').tolist())
+            )
+            conn.executescript(FILTER_INDEXES)
+        # Merge the b-tree segments written during the bulk insert
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('optimize')")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    return len(df)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open an index read-only"""
+    return sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+
+
+def available_filters(conn: sqlite3.Connection) -> set:
+    """FILTER_COLUMNS names the index has columns for (indexes built by older versions lack some)"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+    return {name for name, column in FILTER_COLUMNS.items() if column in columns}
+
+
+def match_expression(text: str, prefix: bool = True, title_only: bool = False) -> Optional[str]:
+    """
+    FTS5 query for free text: every word must match, the last one as a prefix
+
+    Words are quoted, so FTS5 operators and punctuation in user input are
+    searched for literally instead of being parsed. None if text has no words.
+    """
+    terms = [f'"{term}"' for term in TERM_PATTERN.findall(text.lower())]
+    if not terms:
+        return None
+    if prefix:
+        terms[-1] += '*'
+    expression = ' '.join(terms)
+    return f"job : ({expression})" if title_only else expression
+
+
+def _filter_clause(filters: Optional[Dict[str, str]]):
+    clauses, params = [], []
+    for name, value in (filters or {}).items():
+        if name not in FILTER_COLUMNS:
+            raise ValueError(f"Unknown filter '{name}'")
+        if value is not None:
+            clauses.append(f"j.{FILTER_COLUMNS[name]} = ?")
+            params.append(value)
+    return clauses, params
+
+
+def search(conn: sqlite3.Connection, text: str, filters: Optional[Dict[str, str]] = None,
+           limit: int = 20, offset: int = 0, prefix: bool = True,
+           title_only: bool = False, candidates: Optional[int] = RANK_CANDIDATES) -> pd.DataFrame:
+    """
+    Jobs matching text and filters, best BM25 match first
+
+    Args:
+        text: Free text; empty text returns the filtered jobs in job_ID order
+        filters: FILTER_COLUMNS name -> exact value
+        prefix: Treat the last word as a prefix (search as you type)
+        title_only: Match job titles only
+        candidates: Matches scored before ranking (at least limit + offset);
+            None scores every match, which is exact but slow for broad queries
+
+    Returns:
+        DataFrame with job_ID, job, company_name, city, work_type, score
+        (score is negated BM25: higher is better)
+    """
+    clauses, params = _filter_clause(filters)
+    expression = match_expression(text or '', prefix=prefix, title_only=title_only)
+
+    if expression is None:
+        where = " AND ".join(clauses) or "1=1"
+        sql = (f"SELECT j.job_ID, j.job, j.company_name, j.city, j.work_type, 0.0 AS score "
+               f"FROM jobs j WHERE {where} ORDER BY j.job_ID LIMIT ? OFFSET ?")
+    else:
+        where = " AND ".join(["jobs_fts MATCH ?"] + clauses)
+        params = [expression] + params
+        # LIMIT inside the subquery stops the match scan, so bm25 runs on the candidates only
+        bound = "" if candidates is None else f" LIMIT {max(int(candidates), int(limit) + int(offset))}"
+        sql = (f"SELECT job_ID, job, company_name, city, work_type, -rank AS score FROM ("
+               f"SELECT j.job_ID, j.job, j.company_name, j.city, j.work_type, "
+               f"bm25(jobs_fts, {TITLE_WEIGHT}, {DETAILS_WEIGHT}) AS rank "
+               f"FROM jobs_fts CROSS JOIN jobs j ON j.job_ID = jobs_fts.rowid "
+               f"WHERE {where}{bound}) ORDER BY rank, job_ID LIMIT ? OFFSET ?")
+    return pd.read_sql_query(sql, conn, params=params + [int(limit), int(offset)])
+
+
+def count(conn: sqlite3.Connection, text: str, filters: Optional[Dict[str, str]] = None,
+          prefix: bool = True, title_only: bool = False) -> int:
+    """Number of jobs search() would page through"""
+    clauses, params = _filter_clause(filters)
+    expression = match_expression(text or '', prefix=prefix, title_only=title_only)
+    if expression is None:
+        sql = f"SELECT count(*) FROM jobs j WHERE {' AND '.join(clauses) or '1=1'}"
+    elif not clauses:
+        # Every indexed job has a jobs row, so the join only matters for filters
+        params = [expression]
+        sql = "SELECT count(*) FROM jobs_fts WHERE jobs_fts MATCH ?"
+    else:
+        params = [expression] + params
+        sql = (f"SELECT count(*) FROM jobs_fts CROSS JOIN jobs j ON j.job_ID = jobs_fts.rowid "
+               f"WHERE {' AND '.join(['jobs_fts MATCH ?'] + clauses)}")
+    return conn.execute(sql, params).fetchone()[0]
+
+
+def suggest_titles(conn: sqlite3.Connection, text: str, limit: int = 10) -> List[str]:
+    """Distinct job titles matching text as you type (title prefix search)"""
+    expression = match_expression(text or '', prefix=True, title_only=True)
+    if expression is None:
+        return []
+    rows = conn.execute(
+        "SELECT j.job, count(*) AS n FROM jobs_fts CROSS JOIN jobs j ON j.job_ID = jobs_fts.rowid "
+        "WHERE jobs_fts MATCH ? GROUP BY j.job ORDER BY n DESC, j.job LIMIT ?",
+        [expression, int(limit)]
+    ).fetchall()
+    return [title for title, _ in rows]
@@ -0,0 +1,291 @@
+"""
+Job Similarity Index
+Nearest-neighbour search over postings: TF-IDF vectors of titles and
+descriptions plus skill-set vectors, scored as cosine similarities
+
+Exact search walks an inverted index (term -> postings), so a query only
+touches the jobs sharing a term with it. Optional random-projection LSH
+signatures narrow very large corpora to a candidate set first, which is
+then rescored exactly: each signature byte is one band, and the jobs whose
+band values equal the query's in the most bands are the candidates, found by
+bucket lookups rather than by comparing every signature.
+"""
+
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from skill_bitset import WORD_BITS, SkillBitsets, cardinality
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#]+")
+
+STOP_WORDS = frozenset("""
+    about above after all also and any are as at be been being both but by can
+    could did do does for from had has have having he her here his how if in
+    into is it its may more most must no not of on or our out over own per
+    shall she should so some such than that the their them then there these
+    they this those through to too under until up very was we were what when
+    where which while who whom why will with within would you your
+""".split())
+
+
+def tokenize(text) -> list:
+    """Lowercase word tokens without stop words"""
+    if not isinstance(text, str):
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def _segments(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Positions of the concatenated ranges [start, start + length)"""
+    total = int(lengths.sum())
+    offsets = np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+def _top(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first, ties by position"""
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        part = np.argpartition(-scores, k - 1)[:k]
+        # Keep every score tied with the k-th so ties resolve by position, not partition order
+        part = np.flatnonzero(scores >= scores[part].min())
+    else:
+        part = np.arange(len(scores))
+    return part[np.lexsort((part, -scores[part]))][:k]
+
+
+class SimilarityIndex:
+    """
+    Row-normalized TF-IDF matrix (CSR) with its term-major transpose, the jobs'
+    skill sets and optional LSH signatures
+
+    Row r stands for job ``job_ids[r]``. Similarity is
+    ``(1 - skill_weight) * text cosine + skill_weight * skill-set cosine``.
+    """
+
+    def __init__(self, job_ids, vocab, idf, indptr, indices, data, skills: SkillBitsets,
+                 skill_weight: float = 0.3, planes=None, signatures=None,
+                 post_indptr=None, post_docs=None, post_data=None):
+        self.job_ids = np.asarray(job_ids)
+        self.vocab = pd.Index(vocab)
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.float32)
+        self.skills = skills
+        self.skill_weight = float(skill_weight)
+        self.planes = planes
+        self.signatures = signatures
+        self.buckets = self._lsh_buckets() if signatures is not None else None
+        self._positions = pd.Index(self.job_ids)
+
+        if post_indptr is None:
+            post_indptr, post_docs, post_data = self._transpose()
+        self.post_indptr = np.asarray(post_indptr, dtype=np.int64)
+        self.post_docs = np.asarray(post_docs, dtype=np.int32)
+        self.post_data = np.asarray(post_data, dtype=np.float32)
+        self._skill_sizes = skills.sizes()
+
+    @classmethod
+    def build(cls, texts: Iterable[str], skills: SkillBitsets, min_df: int = 2, max_df: float = 0.5,
+              max_features: int = 50000, skill_weight: float = 0.3, lsh_bits: int = 0,
+              seed: int = 42) -> 'SimilarityIndex':
+        """
+        Build the index for the jobs in ``skills`` (same order as ``texts``)
+
+        Terms in fewer than min_df jobs or more than max_df of them are
+        dropped; the max_features most frequent remain. lsh_bits > 0 (rounded
+        up to a multiple of 64) adds random-projection signatures.
+        """
+        token_lists = [tokenize(text) for text in texts]
+        n_docs = len(token_lists)
+
+        doc_freq = Counter(token for tokens in token_lists for token in set(tokens))
+        kept = [(term, count) for term, count in doc_freq.items() if min_df <= count <= max_df * n_docs]
+        kept = sorted(kept, key=lambda x: (-x[1], x[0]))[:max_features]
+        vocab = pd.Index(sorted(term for term, _ in kept))
+        term_df = np.array([doc_freq[term] for term in vocab], dtype=np.float64)
+        idf = np.log((1 + n_docs) / (1 + term_df)) + 1
+
+        # One (job, term) pair per token, collapsed to counts in a single pass
+        term_index = {term: i for i, term in enumerate(vocab)}
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=n_docs)
+        term_ids = np.fromiter(
+            (term_index.get(token, -1) for tokens in token_lists for token in tokens),
+            dtype=np.int64, count=int(lengths.sum())
+        )
+        rows = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        known = term_ids >= 0
+        keys, counts = np.unique(rows[known] * max(len(vocab), 1) + term_ids[known], return_counts=True)
+        rows, indices = np.divmod(keys, max(len(vocab), 1))
+
+        # Sublinear term frequency, then L2-normalize each job
+        data = (1 + np.log(counts)) * idf[indices]
+        norms = np.sqrt(np.bincount(rows, weights=data ** 2, minlength=n_docs))
+        data = data / norms[rows]
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n_docs))])
+
+        index = cls(skills.job_ids, vocab, idf, indptr, indices, data, skills, skill_weight)
+        if lsh_bits > 0:
+            index.add_lsh(lsh_bits, seed=seed)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def _transpose(self):
+        """Term-major copy of the matrix: for each term, the jobs using it and their weights"""
+        rows = np.repeat(np.arange(len(self.job_ids), dtype=np.int32), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind='stable')
+        post_indptr = np.concatenate([[0], np.cumsum(np.bincount(self.indices, minlength=len(self.vocab)))])
+        return post_indptr, rows[order], self.data[order]
+
+    def add_lsh(self, n_bits: int = 128, seed: int = 42, chunk_size: int = 2000) -> None:
+        """Random-projection signatures: bit b of a job is set when its vector is on the + side of plane b"""
+        n_bits = -(-n_bits // WORD_BITS) * WORD_BITS
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((len(self.vocab), n_bits)).astype(np.float32)
+
+        n_docs = len(self.job_ids)
+        signatures = np.zeros((n_docs, n_bits // WORD_BITS), dtype=np.uint64)
+        for start in range(0, n_docs, chunk_size):
+            stop = min(start + chunk_size, n_docs)
+            lo, hi = self.indptr[start], self.indptr[stop]
+            projected = np.zeros((stop - start, n_bits), dtype=np.float32)
+            nonempty = np.diff(self.indptr[start:stop + 1]) > 0
+            if hi > lo:
+                contributions = self.data[lo:hi, None] * self.planes[self.indices[lo:hi]]
+                projected[nonempty] = np.add.reduceat(contributions, self.indptr[start:stop][nonempty] - lo, axis=0)
+            signatures[start:stop] = np.packbits(projected > 0, axis=1, bitorder='little').view(np.uint64)
+        self.signatures = signatures
+        self.buckets = self._lsh_buckets()
+
+    def _lsh_buckets(self):
+        """
+        Band buckets of the signatures (rebuilt on load rather than stored)
+
+        Returns:
+            (rows, starts): rows[b, starts[b, v]:starts[b, v + 1]] are the jobs
+            whose band b has value v
+        """
+        # One band per signature byte, so 256 buckets per band
+        bands = self.signatures.view(np.uint8)
+        rows = np.ascontiguousarray(np.argsort(bands, axis=0, kind='stable').T.astype(np.int32))
+        counts = np.stack([np.bincount(band, minlength=256) for band in bands.T])
+        starts = np.concatenate([np.zeros((len(counts), 1), dtype=np.int64), np.cumsum(counts, axis=1)], axis=1)
+        return rows, starts
+
+    def position(self, job_id) -> int:
+        """Row of a job, or KeyError"""
+        return self._positions.get_loc(job_id)
+
+    def text_scores(self, row: int, candidates: Optional[np.ndarray] = None) -> np.ndarray:
+        """TF-IDF cosine of job `row` with every job, or with the candidate rows only"""
+        q_terms = self.indices[self.indptr[row]:self.indptr[row + 1]]
+        q_weights = self.data[self.indptr[row]:self.indptr[row + 1]]
+
+        if candidates is None:
+            # Inverted index: only postings of the query's terms are touched
+            starts = self.post_indptr[q_terms]
+            lengths = self.post_indptr[q_terms + 1] - starts
+            hits = _segments(starts, lengths)
+            weights = self.post_data[hits] * np.repeat(q_weights, lengths)
+            return np.bincount(self.post_docs[hits], weights=weights, minlength=len(self.job_ids))
+
+        query = np.zeros(len(self.vocab), dtype=np.float32)
+        query[q_terms] = q_weights
+        starts = self.indptr[candidates]
+        lengths = self.indptr[candidates + 1] - starts
+        hits = _segments(starts, lengths)
+        labels = np.repeat(np.arange(len(candidates)), lengths)
+        return np.bincount(labels, weights=self.data[hits] * query[self.indices[hits]], minlength=len(candidates))
+
+    def skill_scores(self, row: int, candidates: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine of job `row`'s skill set with every job's (|A ∩ B| / sqrt(|A| |B|))"""
+        bits = self.skills.bits if candidates is None else self.skills.bits[candidates]
+        sizes = self._skill_sizes if candidates is None else self._skill_sizes[candidates]
+        shared = cardinality(bits & self.skills.bits[row])
+        denominator = np.sqrt(sizes * self._skill_sizes[row], dtype=np.float64)
+        return np.divide(shared, denominator, out=np.zeros(len(shared)), where=denominator > 0)
+
+    def lsh_candidates(self, row: int, n_candidates: int) -> np.ndarray:
+        """
+        Rows sharing an LSH band bucket with job `row`, nearest n_candidates
+        in Hamming distance when there are more (row included)
+        """
+        rows, starts = self.buckets
+        bands = np.arange(rows.shape[0])
+        keys = self.signatures[row].view(np.uint8).astype(np.int64)
+        lo, hi = starts[bands, keys], starts[bands, keys + 1]
+        found = np.unique(rows.ravel()[_segments(bands * rows.shape[1] + lo, hi - lo)])
+        if len(found) > n_candidates:
+            distances = cardinality(self.signatures[found] ^ self.signatures[row])
+            found = np.sort(found[_top(-distances.astype(np.float64), n_candidates)])
+        return found
+
+    def similar(self, job_id, k: int = 10, approximate: bool = False,
+                n_candidates: int = 500) -> pd.DataFrame:
+        """
+        The k jobs most similar to job_id (itself excluded)
+
+        approximate=True rescores only the n_candidates jobs sharing the most
+        LSH band buckets with job_id; it falls back to exact search when the
+        index has no signatures or the buckets hold fewer than k other jobs.
+
+        Returns:
+            DataFrame with job_ID, similarity, text_similarity, skill_similarity
+        """
+        row = self.position(job_id)
+        candidates = None
+        if approximate and self.signatures is not None and n_candidates < len(self.job_ids):
+            candidates = self.lsh_candidates(row, n_candidates + 1)
+            if len(candidates) <= k:
+                candidates = None
+
+        text = self.text_scores(row, candidates).astype(np.float64)
+        skill = self.skill_scores(row, candidates)
+        scores = (1 - self.skill_weight) * text + self.skill_weight * skill
+        rows = np.arange(len(self.job_ids)) if candidates is None else candidates
+        scores[rows == row] = -np.inf
+
+        best = _top(scores, min(k, len(scores) - 1))
+        return pd.DataFrame({
+            'job_ID': self.job_ids[rows[best]],
+            'similarity': np.round(scores[best], 4),
+            'text_similarity': np.round(text[best], 4),
+            'skill_similarity': np.round(skill[best], 4)
+        })
+
+    def save(self, path: Path) -> None:
+        """Write the index to an uncompressed .npz (loads without decompression)"""
+        arrays = {
+            'job_ids': self.job_ids, 'vocab': np.asarray(self.vocab, dtype=str), 'idf': self.idf,
+            'indptr': self.indptr, 'indices': self.indices, 'data': self.data,
+            'post_indptr': self.post_indptr, 'post_docs': self.post_docs, 'post_data': self.post_data,
+            'skill_bits': self.skills.bits, 'skill_vocab': np.asarray(self.skills.vocab, dtype=str),
+            'skill_weight': np.float64(self.skill_weight)
+        }
+        if self.signatures is not None:
+            arrays.update(planes=self.planes, signatures=self.signatures)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> 'SimilarityIndex':
+        """Read a file written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            skills = SkillBitsets(data['skill_bits'], data['skill_vocab'].tolist(), data['job_ids'])
+            has_lsh = 'signatures' in data.files
+            return cls(
+                data['job_ids'], data['vocab'].tolist(), data['idf'],
+                data['indptr'], data['indices'], data['data'], skills,
+                skill_weight=float(data['skill_weight']),
+                planes=data['planes'] if has_lsh else None,
+                signatures=data['signatures'] if has_lsh else None,
+                post_indptr=data['post_indptr'], post_docs=data['post_docs'], post_data=data['post_data']
+            )
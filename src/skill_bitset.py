@@ -0,0 +1,186 @@
+"""
+Skill Bitsets
+Per-job skill sets packed into uint64 words over a fixed skill vocabulary, so
+intersections, differences and set sizes become bitwise ops plus popcount
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+WORD_BITS = 64
+
+# Set bits per byte value, for NumPy builds without np.bitwise_count (< 2.0)
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def n_words(n_skills: int) -> int:
+    """uint64 words needed for one set over n_skills skills"""
+    return max(1, -(-n_skills // WORD_BITS))
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits in each uint64 word"""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    counts = _BYTE_POPCOUNT[words.view(np.uint8)]
+    return counts.reshape(words.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+def cardinality(bits: np.ndarray) -> np.ndarray:
+    """Size of each packed set (sums popcount over the last axis)"""
+    return popcount(bits).sum(axis=-1, dtype=np.int64)
+
+
+def _pack(rows: np.ndarray, ids: np.ndarray, n_rows: int, n_skills: int) -> np.ndarray:
+    """Set bit ids[k] in row rows[k] of an all-zero [n_rows, words] array"""
+    bits = np.zeros((n_rows, n_words(n_skills)), dtype=np.uint64)
+    shifts = (ids % WORD_BITS).astype(np.uint64)
+    np.bitwise_or.at(bits, (rows, ids // WORD_BITS), np.left_shift(np.uint64(1), shifts))
+    return bits
+
+
+def pack_ids(id_lists: Sequence[Iterable[int]], n_skills: int) -> np.ndarray:
+    """
+    Pack per-job skill ID lists into a [jobs, words] uint64 array
+
+    Bit `id % 64` of word `id // 64` is set for every ID in a job's list.
+    """
+    id_lists = [list(ids) for ids in id_lists]
+    lengths = np.fromiter((len(ids) for ids in id_lists), dtype=np.int64, count=len(id_lists))
+    ids = np.fromiter((i for ids in id_lists for i in ids), dtype=np.int64, count=int(lengths.sum()))
+    rows = np.repeat(np.arange(len(id_lists)), lengths)
+    return _pack(rows, ids, len(id_lists), n_skills)
+
+
+def transpose(bits: np.ndarray, skill_ids: Sequence[int]) -> np.ndarray:
+    """
+    Skill-major bitsets: for each skill in skill_ids, the set of jobs listing it
+
+    Returns:
+        [len(skill_ids), ceil(jobs / 64)] uint64 array
+    """
+    columns = dense(bits, bits.shape[-1] * WORD_BITS)[:, list(skill_ids)].T
+    padded = np.zeros((columns.shape[0], n_words(columns.shape[1]) * WORD_BITS), dtype=np.uint8)
+    padded[:, :columns.shape[1]] = columns
+    return np.packbits(padded, axis=1, bitorder='little').view(np.uint64)
+
+
+def dense(bits: np.ndarray, n_skills: int) -> np.ndarray:
+    """Unpack to a [jobs, n_skills] uint8 0/1 matrix"""
+    unpacked = np.unpackbits(np.ascontiguousarray(bits, dtype=np.uint64).view(np.uint8), axis=-1, bitorder='little')
+    return unpacked[..., :n_skills]
+
+
+def pairwise_intersections(sets: np.ndarray) -> np.ndarray:
+    """|A ∩ B| for every pair of packed sets (rows of `sets`), as a symmetric matrix"""
+    counts = np.zeros((len(sets), len(sets)), dtype=np.int64)
+    for i in range(len(sets)):
+        counts[i, i:] = cardinality(sets[i] & sets[i:])
+        counts[i:, i] = counts[i, i:]
+    return counts
+
+
+class SkillBitsets:
+    """
+    Skill sets of many jobs over one vocabulary
+
+    Row r of ``bits`` is the skill set of job ``job_ids[r]``; bit i stands for
+    ``vocab[i]`` (the SkillModel skill ID when written by 02_extract_skills).
+    """
+
+    def __init__(self, bits: np.ndarray, vocab: Sequence[str], job_ids: Optional[Sequence] = None):
+        self.bits = np.asarray(bits, dtype=np.uint64)
+        self.vocab = pd.Index(vocab)
+        self.job_ids = np.asarray(job_ids) if job_ids is not None else np.arange(len(self.bits))
+
+    @classmethod
+    def from_lists(cls, skill_lists: Iterable[Sequence[str]], vocab: Optional[Sequence[str]] = None,
+                   job_ids: Optional[Sequence] = None) -> 'SkillBitsets':
+        """Pack skill-name lists; the vocabulary defaults to the sorted skills seen"""
+        skill_lists = list(skill_lists)
+        if vocab is None:
+            vocab = sorted({skill for skills in skill_lists for skill in skills})
+        index = pd.Index(vocab)
+
+        # One vocabulary lookup for all jobs; names outside the vocabulary are dropped
+        lengths = np.fromiter((len(skills) for skills in skill_lists), dtype=np.int64, count=len(skill_lists))
+        flat = [skill for skills in skill_lists for skill in skills]
+        ids = index.get_indexer(flat) if flat else np.zeros(0, dtype=np.int64)
+        rows = np.repeat(np.arange(len(skill_lists)), lengths)
+        known = ids >= 0
+        return cls(_pack(rows[known], ids[known], len(skill_lists), len(index)), index, job_ids)
+
+    def __len__(self) -> int:
+        return len(self.bits)
+
+    def mask(self, skills: Iterable[str]) -> np.ndarray:
+        """One packed set (uint64 words) for a list of skill names"""
+        ids = [i for i in self.vocab.get_indexer(list(skills)) if i >= 0]
+        return pack_ids([ids], len(self.vocab))[0]
+
+    def take(self, rows) -> 'SkillBitsets':
+        """Subset of jobs by position or boolean mask"""
+        return SkillBitsets(self.bits[rows], self.vocab, self.job_ids[rows])
+
+    def align(self, job_ids: Sequence) -> Optional['SkillBitsets']:
+        """Reorder rows to job_ids, or None if any job is missing"""
+        job_ids = np.asarray(job_ids)
+        if np.array_equal(self.job_ids, job_ids):
+            return self
+        index = pd.Index(self.job_ids)
+        if not index.is_unique:
+            return None
+        positions = index.get_indexer(job_ids)
+        if (positions < 0).any():
+            return None
+        return self.take(positions)
+
+    def sizes(self) -> np.ndarray:
+        """Skills per job"""
+        return cardinality(self.bits)
+
+    def intersection_sizes(self, mask: np.ndarray) -> np.ndarray:
+        """|job ∩ mask| per job"""
+        return cardinality(self.bits & mask)
+
+    def difference_sizes(self, mask: np.ndarray) -> np.ndarray:
+        """|job - mask| per job"""
+        return cardinality(self.bits & ~mask)
+
+    def skill_counts(self) -> np.ndarray:
+        """Jobs listing each vocabulary skill"""
+        return dense(self.bits, len(self.vocab)).sum(axis=0, dtype=np.int64)
+
+    def to_lists(self) -> List[List[str]]:
+        """Unpack to skill-name lists (vocabulary order)"""
+        names = self.vocab.to_numpy()
+        return [names[np.flatnonzero(row)].tolist() for row in dense(self.bits, len(self.vocab))]
+
+    def save(self, path: Path) -> None:
+        """Write bits, vocabulary and job IDs to a compressed .npz"""
+        np.savez_compressed(path, bits=self.bits, vocab=np.asarray(self.vocab, dtype=str), job_ids=self.job_ids)
+
+    @classmethod
+    def load(cls, path: Path) -> 'SkillBitsets':
+        """Read a file written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['bits'], data['vocab'].tolist(), data['job_ids'])
+
+    @classmethod
+    def load_aligned(cls, path: Path, df: pd.DataFrame) -> 'SkillBitsets':
+        """
+        Skill sets of df's jobs (job_ID and skills columns) in df's row order
+
+        Read from path when it covers every job, packed from df['skills'] when
+        the file is missing or stale.
+        """
+        if Path(path).exists():
+            bitsets = cls.load(path).align(df['job_ID'])
+            if bitsets is not None:
+                return bitsets
+            print(f"   ⚠️ {Path(path).name} does not match the jobs table, packing skills again")
+        return cls.from_lists(df['skills'], job_ids=df['job_ID'])
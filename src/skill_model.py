@@ -0,0 +1,133 @@
+"""
+Skill Model
+Canonical skills with aliases and category memberships, stored as compact integer IDs
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def skill_aliases(skill: str) -> List[str]:
+    """Return the lowercase spellings that should match a canonical skill"""
+    base = skill.lower()
+    variations = [
+        base,
+        base.replace('.', ''),
+        base.replace(' ', ''),
+        base.replace('-', '')
+    ]
+    # Preserve order, drop empties and duplicates
+    return list(dict.fromkeys(v for v in variations if v))
+
+
+class SkillModel:
+    """
+    Skill vocabulary built from SKILL_CATEGORIES
+
+    Every canonical skill gets one integer ID (its position in ``skills``) and
+    every category one bit in a category bitmask. A skill listed under several
+    categories (e.g. Tableau, Power BI) is a single ID whose mask has several
+    bits set, so it is scanned once and counted once per category.
+    """
+
+    def __init__(self, skill_categories: Dict[str, List[str]]):
+        self.categories: List[str] = list(skill_categories.keys())
+        self.skills: List[str] = []
+        self.skill_ids: Dict[str, int] = {}
+        self.skill_masks: List[int] = []
+        self.alias_to_id: Dict[str, int] = {}
+
+        for cat_idx, (category, skills) in enumerate(skill_categories.items()):
+            for skill in skills:
+                skill_id = self.skill_ids.get(skill)
+                if skill_id is None:
+                    skill_id = len(self.skills)
+                    self.skill_ids[skill] = skill_id
+                    self.skills.append(skill)
+                    self.skill_masks.append(0)
+                self.skill_masks[skill_id] |= 1 << cat_idx
+
+                for alias in skill_aliases(skill):
+                    # First canonical skill to claim an alias keeps it
+                    self.alias_to_id.setdefault(alias, skill_id)
+
+        self._pattern = self._compile_pattern()
+        self._implied = self._implied_aliases()
+
+    def _compile_pattern(self):
+        """Compile all aliases into a single overlapping-match regex"""
+        # Longest first so 'oracle cloud' is tried before 'oracle'; the
+        # lookahead lets matches start at every position without consuming text
+        aliases = sorted(self.alias_to_id, key=len, reverse=True)
+        alternation = '|'.join(re.escape(a) for a in aliases)
+        return re.compile(r'(?=\b(' + alternation + r')\b)')
+
+    def _implied_aliases(self) -> Dict[str, Tuple[int, ...]]:
+        """Map each alias to the skill IDs of shorter aliases it contains"""
+        implied = {}
+        for alias in self.alias_to_id:
+            ids = set()
+            for other, other_id in self.alias_to_id.items():
+                if other != alias and len(other) < len(alias):
+                    if re.search(r'\b' + re.escape(other) + r'\b', alias):
+                        ids.add(other_id)
+            if ids:
+                implied[alias] = tuple(sorted(ids))
+        return implied
+
+    @property
+    def num_skills(self) -> int:
+        return len(self.skills)
+
+    def match(self, text) -> Tuple[List[int], int]:
+        """
+        Scan text once and return (sorted skill IDs, category bitmask)
+
+        Args:
+            text: Job description (NaN-safe)
+
+        Returns:
+            Tuple of matched skill IDs and the OR of their category masks
+        """
+        if pd.isna(text):
+            return [], 0
+
+        found = set()
+        for m in self._pattern.finditer(str(text).lower()):
+            alias = m.group(1)
+            found.add(self.alias_to_id[alias])
+            found.update(self._implied.get(alias, ()))
+
+        mask = 0
+        for skill_id in found:
+            mask |= self.skill_masks[skill_id]
+
+        return sorted(found), mask
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        """Convert skill IDs to canonical skill names"""
+        return [self.skills[i] for i in skill_ids]
+
+    def categories_for_mask(self, mask: int) -> List[str]:
+        """Expand a category bitmask into category names"""
+        return [cat for i, cat in enumerate(self.categories) if mask >> i & 1]
+
+    def category_counts(self, masks: Iterable[int]) -> Dict[str, int]:
+        """Count how many masks include each category"""
+        masks = np.asarray(list(masks), dtype=np.int64)
+        return {
+            cat: int(((masks >> i) & 1).sum())
+            for i, cat in enumerate(self.categories)
+        }
+
+
+if __name__ == "__main__":
+    from config import SKILL_CATEGORIES
+    model = SkillModel(SKILL_CATEGORIES)
+    print(f"✅ Skill model: {model.num_skills} skills, {len(model.categories)} categories")
+    ids, mask = model.match("Experience with Python, Power BI and Oracle Cloud required")
+    print(f"   Skills: {model.names(ids)}")
+    print(f"   Categories: {model.categories_for_mask(mask)}")
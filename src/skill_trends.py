@@ -0,0 +1,128 @@
+"""
+Skill Trends
+Per-skill demand velocity and acceleration from posting age windows
+"""
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def window_labels(edges: Sequence[float]) -> List[str]:
+    """Human-readable labels for posting-age windows, newest first"""
+    labels = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        labels.append(f"{lo:g}+ days" if np.isinf(hi) else f"{lo:g}-{hi:g} days")
+    return labels
+
+
+def assign_windows(days: pd.Series, edges: Sequence[float]) -> np.ndarray:
+    """
+    Map days_since_posted to window indices (0 = newest)
+
+    Postings without a parsed age, or older than the last edge, get -1.
+    """
+    values = days.to_numpy(dtype=float)
+    idx = np.searchsorted(np.asarray(edges, dtype=float), values, side='right') - 1
+    idx[np.isnan(values) | (idx >= len(edges) - 1)] = -1
+    return idx
+
+
+def _pct_change(new: np.ndarray, old: np.ndarray) -> np.ndarray:
+    return (new - old) / old * 100
+
+
+def compute_skill_trends(df: pd.DataFrame, edges: Sequence[float],
+                         min_count: int = 2, stable_pct: float = 5.0) -> Dict[str, Any]:
+    """
+    Compute per-skill share of postings in each age window and its rate of change
+
+    Args:
+        df: Jobs with 'skills' (list) and 'days_since_posted' columns
+        edges: Window edges in days, ascending (last may be inf)
+        min_count: Skills mentioned in fewer postings are skipped
+        stable_pct: |velocity| below this is reported as 'stable'
+
+    Returns:
+        Dict with the windows (job counts) and one record per skill:
+        share per window, velocity (% change of share, newest vs previous window)
+        and acceleration (change of velocity, in percentage points)
+    """
+    window = assign_windows(df['days_since_posted'], edges)
+    n_windows = len(edges) - 1
+    jobs_per_window = np.bincount(window[window >= 0], minlength=n_windows)
+
+    # job x skill pairs, one row per mention
+    pairs = pd.DataFrame({'window': window, 'skills': df['skills'].to_numpy()})
+    pairs = pairs[pairs['window'] >= 0].explode('skills').dropna(subset=['skills'])
+
+    counts = pairs.groupby(['skills', 'window']).size().unstack(fill_value=0)
+    counts = counts.reindex(columns=range(n_windows), fill_value=0)
+    counts = counts[counts.sum(axis=1) >= min_count]
+
+    # One pseudo-count per window keeps rare skills from swinging to +/-inf
+    matrix = counts.to_numpy(dtype=float)
+    shares = (matrix + 1) / (jobs_per_window + 1) * 100
+
+    velocity = np.zeros(len(counts))
+    acceleration = np.zeros(len(counts))
+    if n_windows >= 2:
+        velocity = _pct_change(shares[:, 0], shares[:, 1])
+    if n_windows >= 3:
+        acceleration = velocity - _pct_change(shares[:, 1], shares[:, 2])
+
+    trend = np.where(velocity >= stable_pct, 'up',
+                     np.where(velocity <= -stable_pct, 'down', 'stable'))
+
+    skills = [
+        {
+            'skill': skill,
+            'demand': int(matrix[i].sum()),
+            'window_counts': [int(c) for c in matrix[i]],
+            'window_shares': [round(float(s), 2) for s in shares[i]],
+            'velocity': round(float(velocity[i]), 1),
+            'acceleration': round(float(acceleration[i]), 1),
+            'trend': str(trend[i])
+        }
+        for i, skill in enumerate(counts.index)
+    ]
+    # Fastest movers first; ties broken by demand then name for stable output
+    skills.sort(key=lambda s: (-abs(s['velocity']), -s['demand'], s['skill']))
+
+    return {
+        'windows': [
+            {'label': label, 'min_days': float(lo), 'max_days': None if np.isinf(hi) else float(hi),
+             'jobs': int(jobs)}
+            for label, lo, hi, jobs in zip(window_labels(edges), edges[:-1], edges[1:], jobs_per_window)
+        ],
+        'skills': skills
+    }
+
+
+def compute_skill_supply(df: pd.DataFrame, top_n: int = 15) -> List[Dict[str, Any]]:
+    """
+    Demand vs candidate supply for the most demanded skills
+
+    Supply is proxied by applicants (no_of_application) on postings that require
+    the skill. Ratio compares the market-wide applicants per posting with the
+    skill's: above 1 means fewer applicants than usual competing per opening.
+    """
+    pairs = df[['skills', 'no_of_application']].explode('skills').dropna(subset=['skills'])
+    if pairs.empty:
+        return []
+
+    market_avg = float(df['no_of_application'].mean())
+    stats = pairs.groupby('skills')['no_of_application'].agg(['size', 'sum', 'mean'])
+    stats = stats.sort_values(['size', 'sum'], ascending=[False, True]).head(top_n)
+
+    return [
+        {
+            'skill': skill,
+            'demand': int(row['size']),
+            'supply': int(row['sum']),
+            'applicants_per_job': round(float(row['mean']), 1),
+            'ratio': round(market_avg / row['mean'], 2) if row['mean'] > 0 else 0.0
+        }
+        for skill, row in stats.iterrows()
+    ]
@@ -0,0 +1,178 @@
+"""
+Snapshot Store
+Append-only SQLite history of per-run aggregates and per-skill/per-role counts
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_date    TEXT NOT NULL,
+    created_at       TEXT NOT NULL,
+    source_hash      TEXT UNIQUE,
+    total_jobs       INTEGER NOT NULL,
+    total_companies  INTEGER,
+    total_locations  INTEGER,
+    unique_skills    INTEGER,
+    remote_jobs      INTEGER,
+    avg_applications REAL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_date ON snapshots (snapshot_date);
+
+CREATE TABLE IF NOT EXISTS skill_counts (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (snapshot_id),
+    skill       TEXT NOT NULL,
+    job_count   INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, skill)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_skill_counts_skill ON skill_counts (skill, snapshot_id);
+
+CREATE TABLE IF NOT EXISTS role_counts (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (snapshot_id),
+    role        TEXT NOT NULL,
+    job_count   INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, role)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_role_counts_role ON role_counts (role, snapshot_id);
+"""
+
+METRIC_COLUMNS = [
+    'total_jobs', 'total_companies', 'total_locations',
+    'unique_skills', 'remote_jobs', 'avg_applications'
+]
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open the snapshot database, creating it and its schema if needed"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def append_snapshot(conn: sqlite3.Connection, snapshot_date: str, metrics: Dict[str, Any],
+                    skill_counts: Dict[str, int], role_counts: Dict[str, int],
+                    source_hash: Optional[str] = None) -> Optional[int]:
+    """
+    Append one pipeline run to the store
+
+    Args:
+        snapshot_date: Scrape date of the data (YYYY-MM-DD)
+        metrics: Values for METRIC_COLUMNS
+        skill_counts: Skill -> number of postings
+        role_counts: Job title -> number of postings
+        source_hash: Content hash of the input the counts came from; an input
+            already stored is skipped, so re-running a stage adds nothing
+
+    Returns:
+        New snapshot_id, or None if this input was already recorded
+    """
+    with conn:
+        try:
+            cursor = conn.execute(
+                f"INSERT INTO snapshots (snapshot_date, created_at, source_hash, {', '.join(METRIC_COLUMNS)}) "
+                f"VALUES (?, ?, ?, {', '.join('?' * len(METRIC_COLUMNS))})",
+                [snapshot_date, datetime.now().isoformat(timespec='seconds'), source_hash]
+                + [metrics.get(col) for col in METRIC_COLUMNS]
+            )
+        except sqlite3.IntegrityError:
+            return None
+
+        snapshot_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO skill_counts (snapshot_id, skill, job_count) VALUES (?, ?, ?)",
+            ((snapshot_id, skill, int(count)) for skill, count in skill_counts.items())
+        )
+        conn.executemany(
+            "INSERT INTO role_counts (snapshot_id, role, job_count) VALUES (?, ?, ?)",
+            ((snapshot_id, role, int(count)) for role, count in role_counts.items())
+        )
+    return snapshot_id
+
+
+def _date_filter(start: Optional[str], end: Optional[str]):
+    clauses, params = [], []
+    if start:
+        clauses.append("s.snapshot_date >= ?")
+        params.append(start)
+    if end:
+        clauses.append("s.snapshot_date <= ?")
+        params.append(end)
+    return (" AND ".join(clauses) or "1=1"), params
+
+
+def load_snapshots(conn: sqlite3.Connection, start: Optional[str] = None,
+                   end: Optional[str] = None) -> pd.DataFrame:
+    """Per-run aggregates in a date range, oldest first"""
+    where, params = _date_filter(start, end)
+    return pd.read_sql_query(
+        f"SELECT s.* FROM snapshots s WHERE {where} ORDER BY s.snapshot_date, s.snapshot_id",
+        conn, params=params
+    )
+
+
+def _count_history(conn, table: str, key: str, values: Optional[Iterable[str]],
+                   start: Optional[str], end: Optional[str]) -> pd.DataFrame:
+    where, params = _date_filter(start, end)
+    if values is not None:
+        values = list(values)
+        if not values:
+            return pd.DataFrame(columns=['snapshot_date', key, 'job_count', 'share'])
+        where += f" AND c.{key} IN ({', '.join('?' * len(values))})"
+        params += values
+
+    return pd.read_sql_query(
+        f"SELECT s.snapshot_date, c.{key}, c.job_count, "
+        f"ROUND(100.0 * c.job_count / s.total_jobs, 2) AS share "
+        f"FROM {table} c JOIN snapshots s ON s.snapshot_id = c.snapshot_id "
+        f"WHERE {where} ORDER BY s.snapshot_date, s.snapshot_id, c.{key}",
+        conn, params=params
+    )
+
+
+def skill_history(conn: sqlite3.Connection, skills: Optional[Iterable[str]] = None,
+                  start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+    """Postings (and % of postings) per skill for each snapshot in a date range"""
+    return _count_history(conn, 'skill_counts', 'skill', skills, start, end)
+
+
+def role_history(conn: sqlite3.Connection, roles: Optional[Iterable[str]] = None,
+                 start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+    """Postings (and % of postings) per role for each snapshot in a date range"""
+    return _count_history(conn, 'role_counts', 'role', roles, start, end)
+
+
+def metric_deltas(snapshots: pd.DataFrame, days: int = 30) -> Dict[str, Any]:
+    """
+    Compare the latest snapshot with the latest one at least `days` older
+
+    Falls back to the previous snapshot when history is shorter than `days`.
+
+    Returns:
+        {'baseline_date', 'label', 'deltas': {metric: % change}} or {} with < 2 snapshots
+    """
+    if len(snapshots) < 2:
+        return {}
+
+    latest = snapshots.iloc[-1]
+    dates = pd.to_datetime(snapshots['snapshot_date'])
+    cutoff = dates.iloc[-1] - pd.Timedelta(days=days)
+    older = snapshots[dates <= cutoff]
+    if len(older):
+        baseline, label = older.iloc[-1], f"vs {days} days earlier"
+    else:
+        baseline, label = snapshots.iloc[-2], "vs previous snapshot"
+
+    deltas = {}
+    for col in METRIC_COLUMNS:
+        old, new = baseline[col], latest[col]
+        if pd.notna(old) and pd.notna(new) and old:
+            deltas[col] = round(float((new - old) / old * 100), 1)
+
+    return {'baseline_date': baseline['snapshot_date'], 'label': label, 'deltas': deltas}
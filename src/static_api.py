@@ -0,0 +1,260 @@
+"""
+Static API Export
+Writes precomputed per-skill, per-city, per-company and per-category JSON
+documents (with .gz and, when brotli is installed, .br copies) to API_DIR,
+so a plain static file server can answer the common dashboard queries
+
+Shards are rewritten only when their content changes: manifest.json keeps
+the hash of every shard from the previous export.
+
+Usage:
+    python src/static_api.py        # export from the current processed data
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+from config import (
+    API_DIR, API_VERSION, ANALYTICS_JSON_FILE, PROCESSED_DATA_DIR,
+    SKILL_CATEGORIES, STATIC_API_TOP_N
+)
+from utils import read_data_manifest, role_column
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Columns the shards are built from, besides the role column
+REQUIRED_COLUMNS = ['company_name', 'city', 'work_type', 'job_category', 'skills']
+
+# Role columns, preferred first: canonical roles from 01_ingest_clean, else raw titles
+ROLE_COLUMNS = ['canonical_role', 'job']
+
+# Breakdown column standing for whichever role column the data has (resolved by role_column)
+ROLE = 'role'
+
+# Shard directory -> jobs column it is keyed on
+SHARD_KEYS = {
+    'skills': 'skills',
+    'cities': 'city',
+    'companies': 'company_name',
+    'categories': 'job_category'
+}
+
+# Shard directory -> per-shard breakdowns: output field -> (jobs column, item label)
+BREAKDOWNS = {
+    'skills': {
+        'top_roles': (ROLE, 'role'),
+        'top_companies': ('company_name', 'company'),
+        'top_cities': ('city', 'city'),
+        'work_types': ('work_type', 'work_type')
+    },
+    'cities': {
+        'top_roles': (ROLE, 'role'),
+        'top_companies': ('company_name', 'company'),
+        'top_skills': ('skills', 'skill'),
+        'work_types': ('work_type', 'work_type')
+    },
+    'companies': {
+        'top_roles': (ROLE, 'role'),
+        'top_cities': ('city', 'city'),
+        'top_skills': ('skills', 'skill'),
+        'work_types': ('work_type', 'work_type')
+    },
+    'categories': {
+        'top_roles': (ROLE, 'role'),
+        'top_companies': ('company_name', 'company'),
+        'top_skills': ('skills', 'skill'),
+        'work_types': ('work_type', 'work_type')
+    }
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def slugify(name: str) -> str:
+    """File-name-safe form of a shard key ('C++' -> 'c', 'Node.js' -> 'node-js')"""
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-') or 'x'
+
+
+def assign_slugs(names: Iterable[str]) -> Dict[str, str]:
+    """Unique slug per name; names that collide ('C' / 'C++') get a short hash suffix"""
+    slugs, taken = {}, set()
+    for name in sorted(names):
+        slug = slugify(name)
+        if slug in taken:
+            slug = f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:6]}"
+        taken.add(slug)
+        slugs[name] = slug
+    return slugs
+
+
+def build_shards(df: pd.DataFrame, top_n: int = STATIC_API_TOP_N) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Build every shard document
+
+    Returns:
+        {shard directory: {key name: document}}
+    """
+    total_jobs = len(df)
+    role = role_column(df)
+    # One row per job x skill; a skill appears once per job, so rows still count jobs
+    pairs = df[[role] + REQUIRED_COLUMNS].explode('skills').dropna(subset=['skills'])
+    skill_category = {skill: category for category, skills in SKILL_CATEGORIES.items() for skill in skills}
+
+    shards = {}
+    for shard, key in SHARD_KEYS.items():
+        breakdowns = BREAKDOWNS[shard]
+        job_counts = (pairs if key == 'skills' else df)[key].value_counts()
+        docs = {
+            name: {
+                'name': name,
+                'job_count': int(count),
+                'percentage': round(count / total_jobs * 100, 2) if total_jobs else 0.0,
+                **{field: [] for field in breakdowns}
+            }
+            for name, count in job_counts.items()
+        }
+        if shard == 'skills':
+            for name, doc in docs.items():
+                doc['category'] = skill_category.get(name)
+
+        for field, (column, label) in breakdowns.items():
+            column = role if column == ROLE else column
+            source = pairs if 'skills' in (key, column) else df
+            counts = source.groupby([key, column]).size().reset_index(name='count')
+            # Top N per key in one pass; ties broken by value for stable output
+            counts = counts.sort_values([key, 'count', column], ascending=[True, False, True])
+            for name, value, count in counts.groupby(key, sort=False).head(top_n).itertuples(index=False):
+                docs[name][field].append({label: value, 'count': int(count)})
+
+        shards[shard] = docs
+    return shards
+
+
+def _serialize(doc: Any) -> bytes:
+    # Sorted keys and no timestamps: identical data gives identical bytes
+    return json.dumps(doc, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_variants(path: Path, data: bytes) -> None:
+    """Write a document with its pre-compressed copies"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    # mtime=0 keeps the gzip bytes reproducible
+    Path(f"{path}.gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        Path(f"{path}.br").write_bytes(brotli.compress(data))
+    else:
+        Path(f"{path}.br").unlink(missing_ok=True)
+
+
+def _remove_variants(path: Path) -> None:
+    for variant in (path, Path(f"{path}.gz"), Path(f"{path}.br")):
+        variant.unlink(missing_ok=True)
+
+
+def _compression() -> list:
+    return ['gzip'] + (['br'] if brotli is not None else [])
+
+
+def _load_manifest(api_dir: Path) -> Dict[str, str]:
+    """Shard hashes from the previous export (empty if its compression set differs)"""
+    try:
+        with open(api_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('files', {}) if manifest.get('compression') == _compression() else {}
+
+
+def export_static_api(df: pd.DataFrame, analytics: Dict[str, Any],
+                      api_dir: Path = API_DIR, top_n: int = STATIC_API_TOP_N,
+                      data_version: Optional[str] = None) -> Dict[str, int]:
+    """
+    Write the static API to api_dir/<API_VERSION>, touching only changed shards
+
+    Layout:
+        index.json               shard names -> paths, with job counts
+        summary.json             analytics_summary.json
+        skills/<slug>.json       and cities/, companies/, categories/
+
+    Returns:
+        {'written', 'unchanged', 'removed'} file counts
+    """
+    root = api_dir / API_VERSION
+    previous = _load_manifest(root)
+    shards = build_shards(df, top_n)
+
+    documents = {'summary.json': analytics}
+    index = {
+        'api_version': API_VERSION,
+        'data_version': data_version,
+        'compression': _compression(),
+        'shards': {}
+    }
+    for shard, docs in shards.items():
+        slugs = assign_slugs(docs)
+        index['shards'][shard] = {
+            name: {'path': f"{shard}/{slugs[name]}.json", 'job_count': docs[name]['job_count']}
+            for name in sorted(docs)
+        }
+        for name, doc in docs.items():
+            documents[f"{shard}/{slugs[name]}.json"] = doc
+    documents['index.json'] = index
+
+    files, written, unchanged = {}, 0, 0
+    for rel_path, doc in documents.items():
+        data = _serialize(doc)
+        digest = hashlib.sha256(data).hexdigest()
+        files[rel_path] = digest
+        path = root / rel_path
+        if previous.get(rel_path) == digest and path.exists():
+            unchanged += 1
+            continue
+        _write_variants(path, data)
+        written += 1
+
+    stale = set(previous) - set(files)
+    for rel_path in stale:
+        _remove_variants(root / rel_path)
+
+    with open(root / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump({'compression': _compression(), 'files': files}, f, indent=2, sort_keys=True)
+
+    return {'written': written, 'unchanged': unchanged, 'removed': len(stale)}
+
+
+def main():
+    """Export the static API from the processed data already on disk"""
+    print("\n🗂️ Exporting static API...")
+    jobs_file = PROCESSED_DATA_DIR / 'jobs_with_skills.csv'
+    if not jobs_file.exists() or not ANALYTICS_JSON_FILE.exists():
+        print("❌ Error: Processed data not found!")
+        print(f"   Please run 02_extract_skills.py and 03_role_stats.py first")
+        sys.exit(1)
+
+    header = pd.read_csv(jobs_file, nrows=0).columns
+    role = next(c for c in ROLE_COLUMNS if c in header)
+    df = pd.read_csv(jobs_file, usecols=[role] + REQUIRED_COLUMNS)
+    df['skills'] = df['skills'].apply(lambda x: x.split('|') if pd.notna(x) and x else [])
+    with open(ANALYTICS_JSON_FILE, 'r', encoding='utf-8') as f:
+        analytics = json.load(f)
+
+    stats = export_static_api(df, analytics, data_version=read_data_manifest().get('version'))
+    print(f"✅ Static API in {API_DIR / API_VERSION}: {stats['written']} written, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed")
+
+
+if __name__ == "__main__":
+    main()
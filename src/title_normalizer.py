@@ -0,0 +1,326 @@
+"""
+Job Title Normalizer
+Maps raw posting titles ("Sr. Data Engineer - WFH", "Data Engineer (Pune)")
+to canonical roles ("Data Engineer") for role analytics
+
+Each distinct title is reduced to its role segment, aliases are expanded and
+noise (seniority, work mode, locations, experience, hiring filler) is
+dropped. Distinct normalized forms are then clustered with fuzzy matching
+inside blocks (word count + leading letters), so near-duplicates and typos
+merge without comparing every pair.
+
+Normalized forms are only matching keys. Each cluster is displayed as its
+most posted title, trimmed to the role segment without seniority and noise
+("Senior Head of Engineering - Remote" -> "Head of Engineering").
+"""
+
+import re
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+# Words that name the role itself
+ROLE_WORDS = frozenset("""
+    administrator analyst architect associate consultant coordinator designer
+    developer director engineer executive expert fellow head intern lead manager
+    officer owner president programmer recruiter researcher scientist
+    specialist strategist tester trainee writer master
+""".split())
+
+SENIORITY_WORDS = frozenset("""
+    senior junior lead principal staff trainee intern entry fresher
+    graduate mid intermediate experienced
+""".split())
+
+NOISE_WORDS = frozenset("""
+    remote wfh onsite hybrid anywhere
+    urgent urgently hiring immediate immediately joiner joiners opening
+    openings required requirement vacancy position role job opportunity
+    contract contractual permanent temporary fulltime parttime freelance
+    years year yrs yr exp experience plus level
+    for of the and or in at with to a an
+    india usa us uk canada australia germany singapore dubai uae europe emea apac
+""".split())
+
+# Noise words a display title keeps between other words ('Head of Engineering')
+CONNECTOR_WORDS = frozenset("for of the and or in at with to a an".split())
+
+# Whole-token aliases, applied before noise removal
+ALIASES = {
+    'sr': 'senior', 'snr': 'senior', 'jr': 'junior', 'jnr': 'junior',
+    'dev': 'developer', 'devs': 'developer', 'developers': 'developer',
+    'engineers': 'engineer', 'engg': 'engineer', 'engr': 'engineer',
+    'mgr': 'manager', 'managers': 'manager', 'analysts': 'analyst',
+    'consultants': 'consultant', 'testers': 'tester', 'sw': 'software',
+    'dotnet': '.net', 'asp.net': '.net', 'servicenow': 'servicenow',
+    'programmers': 'programmer', 'architects': 'architect',
+    'qa': 'qa', 'ml': 'ml', 'ai': 'ai', 'fullstack': 'full stack',
+    'frontend': 'front end', 'backend': 'back end', 'front-end': 'front end',
+    'back-end': 'back end', 'full-stack': 'full stack'
+}
+
+# Multi-word aliases on the lowercased title
+PHRASE_ALIASES = [
+    (re.compile(r"\bdot\s*net\b"), '.net'),
+    (re.compile(r"\bservice\s+now\b"), 'servicenow'),
+    (re.compile(r"\bs/w\b"), 'software'),
+    (re.compile(r"\bwork\s+from\s+(?:home|office)\b"), ' '),
+    (re.compile(r"\bon[\s-]*site\b"), ' '),
+    (re.compile(r"\b(?:full|part)[\s-]+time\b"), ' '),
+    (re.compile(r"\b\d+\s*\+?\s*(?:-\s*\d+\s*)?(?:years?|yrs?)\b(?:\s+(?:of\s+)?exp(?:erience)?)?"), ' ')
+]
+
+# Casing of tokens the display form cannot take from the titles themselves
+FIXED_CASING = {'.net': '.NET', 'qa': 'QA', 'ai': 'AI', 'ml': 'ML', 'ui': 'UI', 'ux': 'UX', 'bi': 'BI'}
+
+# ' - ', ' | ', ':', ',', ';' and spaced slashes; 'Java/Golang' stays one segment
+SEGMENT_SPLIT = re.compile(r"\s+[-–|:]\s+|\s*[|,;:]\s*|\s*/\s+|\s+/\s*|\s+-|-\s+")
+BRACKETS = re.compile(r"[\(\[\{].*?[\)\]\}]")
+EDGE_PUNCTUATION = re.compile(r"^[^\w.+#]+|[^\w+#]+$")  # 'Engineer–' -> 'Engineer', 'C++' and '.NET' stay
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*|\.net")
+
+CLUSTER_THRESHOLD = 0.9  # SequenceMatcher ratio at which two normalized titles merge
+TYPO_THRESHOLD = 0.85  # Ratio at which two differing words count as spellings of one word
+MIN_TYPO_LENGTH = 4  # Shorter words ('c' / 'c++', 'sql' / 'sap') never merge as typos
+
+
+def _tokens(text: str) -> List[str]:
+    tokens = []
+    for token in TOKEN.findall(text):
+        token = token.rstrip('.')
+        token = ALIASES.get(token, token)
+        tokens.extend(token.split())
+    return tokens
+
+
+def _segments(title: str) -> List[str]:
+    """Parts of a multi-part title, bracketed asides removed"""
+    return [s for s in SEGMENT_SPLIT.split(BRACKETS.sub(' ', title)) if s.strip()] or [title]
+
+
+def _role_segment(segments: List[str]) -> int:
+    """Index of the part that names the role ('Data Engineer - Pune' -> 0)"""
+    for i, segment in enumerate(segments):
+        if any(token in ROLE_WORDS for token in _tokens(segment)):
+            return i
+    return 0
+
+
+class TitleNormalizer:
+    """
+    Normalizes job titles to role keys
+
+    Args:
+        locations: Place names (cities, states) stripped from titles
+    """
+
+    def __init__(self, locations: Optional[Iterable[str]] = None):
+        names = {str(name).lower().strip() for name in (locations or []) if isinstance(name, str)}
+        names = sorted((n for n in names if len(n) > 2 and n != 'unknown'), key=len, reverse=True)
+        self.location_pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(n) for n in names) + r")\b"
+        ) if names else None
+
+    def normalize(self, title: str) -> str:
+        """
+        Lowercase role key of one title ('' when nothing meaningful is left)
+
+        Seniority words are dropped only when a role word remains, so
+        'Team Lead' stays 'team lead' while 'Lead Java Developer' becomes
+        'java developer'.
+        """
+        if not isinstance(title, str):
+            return ''
+        segments = _segments(title.lower())
+        index = _role_segment(segments)
+        tokens = self._clean(segments[index])
+
+        # A bare role word takes the next part as its field ('Manager - Finance' -> 'finance manager')
+        if len(tokens) == 1 and index + 1 < len(segments):
+            field = self._clean(segments[index + 1])
+            if field and not any(t in ROLE_WORDS for t in field):
+                tokens = field + tokens
+        # Drop repeats ('developer developer' after aliasing)
+        return ' '.join(dict.fromkeys(tokens))
+
+    def _clean(self, text: str) -> List[str]:
+        """Role tokens of one title segment: aliases expanded, noise and seniority dropped"""
+        for pattern, replacement in PHRASE_ALIASES:
+            text = pattern.sub(replacement, text)
+        if self.location_pattern is not None:
+            text = self.location_pattern.sub(' ', text)
+
+        tokens = [t for t in _tokens(text) if t not in NOISE_WORDS and not t.isdigit()]
+        without_seniority = [t for t in tokens if t not in SENIORITY_WORDS]
+        if any(t in ROLE_WORDS for t in without_seniority):
+            return without_seniority
+        return tokens
+
+    def display_title(self, title: str) -> str:
+        """
+        Role segment of a raw title as written, without seniority and noise
+
+        Connector words stay between other words, so 'Sr. Head of
+        Engineering (Remote)' becomes 'Head of Engineering' where normalize()
+        gives 'head engineering'. Returns '' when nothing is left.
+        """
+        if not isinstance(title, str):
+            return ''
+        segments = _segments(title)
+        segment = segments[_role_segment([s.lower() for s in segments])]
+        text = segment.lower()
+        if len(text) != len(segment):
+            return ''
+
+        # Blank out the phrases normalize() drops (experience, work mode, place names)
+        chars = list(segment)
+        patterns = [pattern for pattern, replacement in PHRASE_ALIASES if not replacement.strip()]
+        if self.location_pattern is not None:
+            patterns.append(self.location_pattern)
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                chars[match.start():match.end()] = ' ' * (match.end() - match.start())
+
+        words = []
+        for word in ''.join(chars).split():
+            word = EDGE_PUNCTUATION.sub('', word)
+            tokens = _tokens(word.lower())
+            if not tokens or all((t in NOISE_WORDS and t not in CONNECTOR_WORDS) or t.isdigit() for t in tokens):
+                continue
+            words.append((word, tokens))
+
+        # Seniority goes only when a role word remains, as in normalize()
+        without_seniority = [(w, t) for w, t in words if not all(x in SENIORITY_WORDS for x in t)]
+        if any(x in ROLE_WORDS for _, t in without_seniority for x in t):
+            words = without_seniority
+
+        words = [word for word, _ in words]
+        while words and words[0].lower() in CONNECTOR_WORDS:
+            words.pop(0)
+        while words and words[-1].lower() in CONNECTOR_WORDS:
+            words.pop()
+        return ' '.join(words)
+
+
+def _spelling_variants(x: str, y: str) -> bool:
+    """Whether two words are spellings of one word ('develper' / 'developer', not 'c' / 'c++')"""
+    return min(len(x), len(y)) >= MIN_TYPO_LENGTH and SequenceMatcher(None, x, y).ratio() >= TYPO_THRESHOLD
+
+
+def cluster_keys(key_counts: Dict[str, int], threshold: float = CLUSTER_THRESHOLD) -> Dict[str, str]:
+    """
+    Merge near-duplicate role keys
+
+    Keys with the same words in any order merge. Otherwise two keys merge
+    when they differ in a single misspelled word ('develper'), never a short
+    technology name ('c' / 'c++'), and their SequenceMatcher ratio reaches
+    threshold. Each key is blocked once per word, under the other words plus
+    that word's first letter, so only keys that can differ in that one word
+    are compared.
+
+    Returns:
+        key -> representative key
+    """
+    parent = {key: key for key in key_counts}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(a, b):
+        a, b = find(a), find(b)
+        if a != b:
+            # Most postings wins, then the shorter and alphabetically first key
+            keep, drop = sorted([a, b], key=lambda k: (-key_counts[k], len(k), k))
+            parent[drop] = keep
+
+    by_word_set = defaultdict(list)
+    blocks = defaultdict(list)
+    for key in key_counts:
+        words = key.split()
+        by_word_set[frozenset(words)].append(key)
+        for i, word in enumerate(words):
+            blocks[(tuple(words[:i]), word[0], tuple(words[i + 1:]))].append((word, key))
+
+    for keys in by_word_set.values():
+        for other in keys[1:]:
+            union(keys[0], other)
+
+    for entries in blocks.values():
+        for i, (x, a) in enumerate(entries):
+            for y, b in entries[i + 1:]:
+                if _spelling_variants(x, y) and SequenceMatcher(None, a, b).ratio() >= threshold:
+                    union(a, b)
+
+    return {key: find(key) for key in key_counts}
+
+
+def _display_names(mapping: pd.DataFrame, normalizer: TitleNormalizer, titles: pd.Series) -> Dict[str, str]:
+    """
+    Display name of each cluster: its most posted title's role segment
+
+    The trimmed title must normalize to that title's own key, or it does not
+    name the role the cluster counts ('Manager - Finance' trims to 'Manager'
+    but is keyed 'finance manager'). Such clusters fall back to their key,
+    each word cased the way the raw titles most often write it.
+    """
+    casing = defaultdict(Counter)
+    for title, count in titles.value_counts().items():
+        for word in re.findall(r"[A-Za-z0-9][A-Za-z0-9+#.]*", str(title)):
+            casing[word.lower().rstrip('.')][word.rstrip('.')] += count
+
+    def display(token):
+        if token in FIXED_CASING:
+            return FIXED_CASING[token]
+        if token in casing:
+            return sorted(casing[token].items(), key=lambda x: (-x[1], x[0]))[0][0]
+        return token.capitalize()
+
+    # Most posted title per cluster, then the shorter and alphabetically first
+    ranked = mapping.assign(length=mapping['job'].str.len()).sort_values(
+        ['job_count', 'length', 'job'], ascending=[False, True, True]
+    )
+    top_titles = ranked.drop_duplicates('cluster')[['cluster', 'job', 'normalized_title']]
+    names = {}
+    for cluster, job, key in top_titles.itertuples(index=False):
+        name = normalizer.display_title(job)
+        if not name or normalizer.normalize(name) != key:
+            name = ' '.join(display(t) for t in cluster.split())
+        names[cluster] = name
+    return names
+
+
+def build_title_mapping(titles: pd.Series, locations: Optional[Iterable[str]] = None,
+                        threshold: float = CLUSTER_THRESHOLD) -> pd.DataFrame:
+    """
+    Canonical role for every distinct title
+
+    Args:
+        titles: Raw job titles (one per posting, so frequencies weigh clusters)
+        locations: Place names to strip from titles
+
+    Returns:
+        DataFrame with job, normalized_title, canonical_role, job_count
+        (one row per distinct title, most common first)
+    """
+    normalizer = TitleNormalizer(locations)
+    counts = titles.dropna().value_counts()
+    mapping = pd.DataFrame({'job': counts.index, 'job_count': counts.to_numpy()})
+    mapping['normalized_title'] = [normalizer.normalize(title) for title in mapping['job']]
+
+    # Titles with nothing left after normalization keep their own (trimmed) text
+    empty = mapping['normalized_title'] == ''
+    mapping.loc[empty, 'normalized_title'] = mapping.loc[empty, 'job'].str.lower().str.strip()
+
+    key_counts = mapping.groupby('normalized_title')['job_count'].sum().to_dict()
+    mapping['cluster'] = mapping['normalized_title'].map(cluster_keys(key_counts, threshold))
+    names = _display_names(mapping[~empty], normalizer, titles.dropna())
+    mapping['canonical_role'] = mapping['cluster'].map(names)
+
+    # Raw text for titles that were not normalized (kept as written)
+    mapping.loc[empty, 'canonical_role'] = mapping.loc[empty, 'job'].str.strip()
+    return mapping[['job', 'normalized_title', 'canonical_role', 'job_count']]
@@ -6,8 +6,14 @@ Common helper functions used across the project
 import pandas as pd
 from pathlib import Path
 import re
+import json
+import hashlib
+import os
+from datetime import datetime
 from typing import List, Dict, Any
 
+from config import DATA_VERSION_FILE, COMPANY_SIZE_BUCKETS, COMPANY_SIZE_UNKNOWN
+
 def ensure_dir(path: Path) -> None:
     """Ensure directory exists, create if it doesn't"""
     path.mkdir(parents=True, exist_ok=True)
@@ -42,34 +48,75 @@ def extract_numbers(text: str) -> List[int]:
     
     return [int(n) for n in re.findall(r'\d+', str(text))]
 
-def parse_employee_count(text: str) -> int:
-    """Parse employee count ranges to approximate number"""
+def _employee_range(text: str) -> tuple:
+    """(low, high) head count of an employee-count range; high is None for open ranges ("10,001+")"""
     if pd.isna(text):
+        return None, None
+    
+    text = str(text)
+    nums = [int(n.replace(',', '')) for n in re.findall(r'\d[\d,]*', text)]
+    
+    if len(nums) >= 2:
+        return nums[0], nums[1]
+    elif nums and '+' in text:
+        return nums[0], None
+    elif nums:
+        return nums[0], nums[0]
+    return None, None
+
+def parse_employee_count(text: str) -> int:
+    """Parse employee count ranges to approximate number (range midpoint, or the floor of "10,001+")"""
+    low, high = _employee_range(text)
+    if low is None:
         return 0
+    return low if high is None else (low + high) // 2
+
+def company_size_bucket(text: str) -> str:
+    """Size bucket label of an employee-count range ("51-200 employees" -> "51-200")"""
+    low, high = _employee_range(text)
+    if low is None:
+        return COMPANY_SIZE_UNKNOWN
     
-    text = str(text).lower()
-    
-    # Common patterns
-    if '10,000+' in text or '10000+' in text:
-        return 10000
-    elif '5,001-10,000' in text or '5001-10000' in text:
-        return 7500
-    elif '1,001-5,000' in text or '1001-5000' in text:
-        return 3000
-    elif '501-1,000' in text or '501-1000' in text:
-        return 750
-    elif '201-500' in text:
-        return 350
-    elif '51-200' in text:
-        return 125
-    elif '11-50' in text:
-        return 30
-    elif '1-10' in text:
-        return 5
-    else:
-        # Try to extract numbers
-        nums = extract_numbers(text)
-        return nums[0] if nums else 0
+    # Open ranges fall in the bucket their floor opens, closed ones in the bucket of their midpoint
+    size = low + 1 if high is None else (low + high) / 2
+    for limit, label in COMPANY_SIZE_BUCKETS:
+        if size <= limit:
+            return label
+    return COMPANY_SIZE_BUCKETS[-1][1]
+
+def company_size_table(values) -> pd.DataFrame:
+    """
+    Numeric size and bucket of each distinct employee-count value
+    
+    Parsed once per distinct string, so callers map it onto postings instead
+    of parsing every row.
+    
+    Returns:
+        DataFrame indexed by value with company_size and company_size_bucket
+    """
+    distinct = pd.Index(pd.unique(pd.Series(values, dtype=object))).dropna()
+    return pd.DataFrame({
+        'company_size': [parse_employee_count(v) for v in distinct],
+        'company_size_bucket': [company_size_bucket(v) for v in distinct]
+    }, index=distinct)
+
+def ensure_company_size_bucket(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add company_size_bucket from no_of_employ when df does not have it
+    
+    Data cleaned before company sizes were parsed only has the raw ranges.
+    
+    Returns:
+        df, with the column added in place
+    """
+    if 'company_size_bucket' not in df.columns:
+        sizes = company_size_table(df['no_of_employ'].unique())
+        df['company_size_bucket'] = df['no_of_employ'].map(sizes['company_size_bucket'])
+    return df
+
+def company_size_order() -> List[str]:
+    """Bucket labels smallest first, unknown sizes last"""
+    return [label for _, label in COMPANY_SIZE_BUCKETS] + [COMPANY_SIZE_UNKNOWN]
 
 def format_large_number(num: int) -> str:
     """Format large numbers with K, M suffixes"""
@@ -127,6 +174,10 @@ def create_summary_dict(df: pd.DataFrame, column: str, top_n: int = 10) -> List[
         for val, count in value_counts.items()
     ]
 
+def role_column(df: pd.DataFrame) -> str:
+    """Column to count roles by: canonical roles when 01_ingest_clean mapped them, raw titles otherwise"""
+    return 'canonical_role' if 'canonical_role' in df.columns else 'job'
+
 def filter_dataframe(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
     """Apply multiple filters to dataframe"""
     filtered = df.copy()
@@ -161,6 +212,65 @@ def export_to_excel(df: pd.DataFrame, file_path: Path, sheet_name: str = 'Data')
             )
             worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
 
+def file_sha256(file_path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def read_data_manifest() -> Dict[str, Any]:
+    """Load the data version manifest, or an empty one if missing"""
+    try:
+        with open(DATA_VERSION_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'artifacts': {}}
+
+def write_data_version(stage: str, artifacts: Dict[Path, int]) -> str:
+    """
+    Record the artifacts a stage wrote in the data version manifest
+    
+    Args:
+        stage: Pipeline stage that produced the artifacts
+        artifacts: Output file -> row count
+    
+    Returns:
+        New data version (hash over every artifact's content hash)
+    """
+    generated_at = datetime.now().isoformat(timespec='seconds')
+    manifest = read_data_manifest()
+    entries = manifest.get('artifacts', {})
+    
+    for file_path, rows in artifacts.items():
+        entries[file_path.name] = {
+            'sha256': file_sha256(file_path),
+            'rows': int(rows),
+            'bytes': file_path.stat().st_size,
+            'stage': stage,
+            'generated_at': generated_at
+        }
+    
+    # Same content, same version: a re-run with identical outputs keeps caches warm
+    combined = hashlib.sha256()
+    for name in sorted(entries):
+        combined.update(f"{name}:{entries[name]['sha256']}\n".encode('utf-8'))
+    version = combined.hexdigest()[:16]
+    
+    # Written to a temp file and swapped in: the dashboard and API never read a partial manifest
+    tmp_path = DATA_VERSION_FILE.with_name(DATA_VERSION_FILE.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': version,
+            'generated_at': generated_at,
+            'stage': stage,
+            'artifacts': entries
+        }, f, indent=2)
+    os.replace(tmp_path, DATA_VERSION_FILE)
+    
+    return version
+
 if __name__ == "__main__":
     # Test utilities
     print("✅ Utility functions loaded successfully")
@@ -73,6 +73,7 @@ def check_project_structure():
         'app',
         'data/raw',
         'data/processed',
+        'data/reference',
         'outputs/charts',
         'outputs/reports',
         'docs'
@@ -119,6 +120,7 @@ def check_scripts():
         '02_extract_skills.py',
         '03_role_stats.py',
         '04_generate_charts.py',
+        '05_build_indexes.py',
         'run_pipeline.py',
         'utils.py',
         'logger.py'
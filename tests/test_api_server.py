@@ -0,0 +1,122 @@
+"""
+API Server Tests
+Rate limiting and conditional requests (ETag / If-None-Match)
+Run with: python -m pytest tests
+"""
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+import api_server
+from api_server import API_PREFIX, ApiHandler, DataStore, QueryService, RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(api_server.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_rate_limiter_blocks_after_limit(clock):
+    limiter = RateLimiter(limit=3, window=60)
+    assert [limiter.check('a') for _ in range(3)] == [(True, 2, 0), (True, 1, 0), (True, 0, 0)]
+    clock[0] += 20
+    assert limiter.check('a') == (False, 0, 41)
+    # Other clients have their own window
+    assert limiter.check('b') == (True, 2, 0)
+
+
+def test_rate_limiter_window_slides(clock):
+    limiter = RateLimiter(limit=2, window=60)
+    limiter.check('a')
+    clock[0] += 30
+    limiter.check('a')
+    assert limiter.check('a')[0] is False
+    # The first request expires; the second is still inside the window
+    clock[0] += 30
+    assert limiter.check('a') == (True, 0, 0)
+    assert limiter.check('a')[0] is False
+
+
+def test_rate_limiter_forgets_idle_clients(clock):
+    limiter = RateLimiter(limit=5, window=60)
+    for client in ['a', 'b', 'c']:
+        limiter.check(client)
+    clock[0] += 61
+    limiter.check('d')
+    assert list(limiter._hits) == ['d']
+
+
+class FixedStore(DataStore):
+    """In-memory analytics whose version the test sets directly"""
+
+    def __init__(self, version):
+        super().__init__()
+        self.analytics = {'roles': {'total_roles': 1, 'top_roles': [{'role': 'Data Engineer', 'count': 3}]}}
+        self.versions = {'analytics_summary.json': version}
+
+    def refresh(self):
+        return self.versions
+
+
+@pytest.fixture
+def server():
+    store = FixedStore('v1')
+    handler = type('TestApiHandler', (ApiHandler,), {
+        'service': QueryService(store),
+        'limiter': RateLimiter(limit=4)
+    })
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, store
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(httpd, path, headers=None):
+    """(status, headers, body) of a GET; HTTP errors are returned, not raised"""
+    url = f"http://127.0.0.1:{httpd.server_address[1]}{API_PREFIX}/{path}"
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {})) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_etag_and_not_modified(server):
+    httpd, store = server
+    status, headers, body = get(httpd, 'roles')
+    assert status == 200
+    assert headers['ETag'] == '"v1"'
+    assert json.loads(body)['results'][0]['role'] == 'Data Engineer'
+
+    status, headers, body = get(httpd, 'roles', {'If-None-Match': '"v0", "v1"'})
+    assert (status, body) == (304, b'')
+    assert headers['ETag'] == '"v1"'
+
+    # New data: the old tag no longer matches
+    store.versions = {'analytics_summary.json': 'v2'}
+    status, headers, _ = get(httpd, 'roles', {'If-None-Match': '"v1"'})
+    assert status == 200
+    assert headers['ETag'] == '"v2"'
+
+
+def test_rate_limit_headers(server):
+    httpd, _ = server
+    remaining = [get(httpd, 'roles')[1]['X-RateLimit-Remaining'] for _ in range(4)]
+    assert remaining == ['3', '2', '1', '0']
+
+    status, headers, body = get(httpd, 'roles')
+    assert status == 429
+    assert int(headers['Retry-After']) > 0
+    assert json.loads(body)['status'] == 429
@@ -0,0 +1,26 @@
+"""
+Company Resolver Tests
+Run with: python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from company_resolver import CompanyResolver
+
+
+def test_bracketed_expansion_without_postings():
+    """An initialism whose bracketed expansion is never posted on its own keeps its name"""
+    resolved = CompanyResolver().resolve({'ISG (Information Services Group)': 5, 'Infosys': 3})
+    assert resolved == {'ISG (Information Services Group)': 'ISG (Information Services Group)', 'Infosys': 'Infosys'}
+
+
+def test_bracketed_expansion_joins_posted_company():
+    """An initialism joins the company its bracketed expansion names when that company is posted"""
+    resolved = CompanyResolver().resolve({
+        'ISG (Information Services Group)': 5,
+        'Information Services Group': 9,
+        'ISG': 2
+    })
+    assert set(resolved.values()) == {'Information Services Group'}
@@ -0,0 +1,80 @@
+"""
+Location Resolver Tests
+Run with: python -m pytest tests
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from config import GAZETTEER_FILE
+from location_resolver import Gazetteer, LocationResolver
+
+
+@pytest.fixture(scope='module')
+def gazetteer():
+    return Gazetteer.load(GAZETTEER_FILE)
+
+
+@pytest.mark.parametrize('location, resolved', [
+    ("Bengaluru, Karnataka, India", ('Bengaluru', 'Karnataka', 'India')),
+    ("Greater Bengaluru Area", ('Bengaluru', 'Karnataka', 'India')),
+    ("Bangalore Urban, Karnataka, India", ('Bengaluru', 'Karnataka', 'India')),
+    # The longest name wins: Navi Mumbai is its own city, not Mumbai
+    ("Navi Mumbai, Maharashtra, India", ('Navi Mumbai', 'Maharashtra', 'India')),
+    ("Mumbai", ('Mumbai', 'Maharashtra', 'India')),
+    ("Mumbai Metropolitan Region", ('Mumbai', 'Maharashtra', 'India')),
+    # The same name as city, then state
+    ("Delhi, Delhi, India", ('Delhi', 'Delhi', 'India')),
+    ("Delhi, India", ('Delhi', 'Delhi', 'India')),
+    ("New Delhi, Delhi, India", ('Delhi', 'Delhi', 'India')),
+    # A first part the gazetteer does not know is kept as the city
+    ("Alipur, Delhi, India", ('Alipur', 'Delhi', 'India')),
+    ("Karnataka, India", ('Unknown', 'Karnataka', 'India')),
+    ("India", ('Unknown', 'Unknown', 'India')),
+    ("Unknown", ('Unknown', 'Unknown', 'Unknown')),
+    ("", ('Unknown', 'Unknown', 'Unknown')),
+    (None, ('Unknown', 'Unknown', 'Unknown'))
+])
+def test_resolve(gazetteer, location, resolved):
+    assert gazetteer.resolve(location) == resolved
+
+
+def write_gazetteer(path, cities):
+    path.write_text(json.dumps({
+        'countries': {'India': []},
+        'states': {'Karnataka': {'country': 'India'}},
+        'cities': cities
+    }), encoding='utf-8')
+
+
+def test_cache_is_reused_for_the_same_gazetteer(tmp_path):
+    gazetteer_path, cache_path = tmp_path / 'gazetteer.json', tmp_path / 'cache.json'
+    write_gazetteer(gazetteer_path, {'Bengaluru': {'state': 'Karnataka', 'aliases': ['bangalore']}})
+
+    resolver = LocationResolver(gazetteer_path, cache_path)
+    resolved, new = resolver.resolve_all(["Bangalore", "Bangalore", "Mysuru, Karnataka"])
+    assert new == 2
+    assert resolved["Bangalore"] == ('Bengaluru', 'Karnataka', 'India')
+    resolver.save()
+
+    resolved, new = LocationResolver(gazetteer_path, cache_path).resolve_all(["Bangalore", "Mysuru, Karnataka"])
+    assert new == 0
+    assert resolved["Mysuru, Karnataka"] == ('Mysuru', 'Karnataka', 'India')
+
+
+def test_gazetteer_edit_invalidates_the_cache(tmp_path):
+    gazetteer_path, cache_path = tmp_path / 'gazetteer.json', tmp_path / 'cache.json'
+    write_gazetteer(gazetteer_path, {'Bengaluru': {'state': 'Karnataka'}})
+    resolver = LocationResolver(gazetteer_path, cache_path)
+    assert resolver.resolve_all(["Bangalore"])[0]["Bangalore"] == ('Bangalore', 'Unknown', 'Unknown')
+    resolver.save()
+
+    # The alias is added: the cached answer from the old gazetteer must not be used
+    write_gazetteer(gazetteer_path, {'Bengaluru': {'state': 'Karnataka', 'aliases': ['bangalore']}})
+    resolved, new = LocationResolver(gazetteer_path, cache_path).resolve_all(["Bangalore"])
+    assert new == 1
+    assert resolved["Bangalore"] == ('Bengaluru', 'Karnataka', 'India')
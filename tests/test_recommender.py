@@ -0,0 +1,73 @@
+"""
+Career Recommender Tests
+The vectorized recommender must return exactly what the reference loop does
+Run with: python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from recommender import calculate_career_recommendations, calculate_career_recommendations_loop
+from skill_bitset import SkillBitsets
+
+
+@pytest.fixture
+def jobs():
+    return pd.DataFrame({
+        'job_ID': [11, 12, 13, 14, 15, 16, 17, 18],
+        'job': ['Sr Data Engineer', 'Data Engineer', 'Data Analyst', 'ML Engineer',
+                'Data Analyst II', 'Java Developer', 'Data Engineer', 'Tester'],
+        'canonical_role': ['Data Engineer', 'Data Engineer', 'Data Analyst', 'ML Engineer',
+                           'Data Analyst', 'Java Developer', 'Data Engineer', 'Tester'],
+        'company_name': ['Acme', 'Globex', 'Acme', 'Initech', 'Umbrella', 'Globex', 'Hooli', 'Acme'],
+        'city': ['Pune', 'Bengaluru', 'Pune', 'Bengaluru', 'Delhi', 'Pune', 'Pune', 'Delhi'],
+        'work_type': ['Remote', 'On-site', 'Remote', 'Hybrid', 'Remote', 'On-site', 'Remote', 'On-site'],
+        'skills': [['Python', 'SQL', 'Spark'], ['Python', 'Airflow'], ['SQL', 'Excel', 'Tableau'],
+                   ['Python', 'TensorFlow', 'SQL'], ['SQL', 'Power BI'], ['Java', 'Spring'],
+                   ['Spark', 'Scala', 'SQL'], []]
+    })
+
+
+QUERIES = [
+    (['Python', 'SQL'], 2, 'Any', 'Any', 'Current Level'),
+    (['SQL'], 6, 'Remote', 'Any', 'Senior'),
+    (['Python'], 4, 'Any', 'Pune', 'Current Level'),
+    (['Java'], 1, 'On-site', 'Delhi', 'Current Level'),  # Nothing left after the filters
+    (['Python', 'Cobol'], 3, 'Any', 'Any', 'Current Level'),  # Cobol is not in any posting
+    ([], 2, 'Any', 'Any', 'Current Level')
+]
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_vectorized_matches_loop(jobs, query):
+    assert calculate_career_recommendations(jobs, *query) == calculate_career_recommendations_loop(jobs, *query)
+
+
+@pytest.mark.parametrize('top_k', [1, 2, 10])
+def test_top_k_is_a_prefix_of_the_full_ranking(jobs, top_k):
+    query = (['Python', 'SQL'], 2, 'Any', 'Any', 'Current Level')
+    expected = calculate_career_recommendations_loop(jobs, *query)
+    expected['top_roles'] = expected['top_roles'][:top_k]
+    assert calculate_career_recommendations(jobs, *query, top_k=top_k) == expected
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_persisted_bitsets_match_loop(jobs, query, tmp_path):
+    path = tmp_path / 'skill_bitsets.npz'
+    SkillBitsets.from_lists(jobs['skills'], job_ids=jobs['job_ID']).save(path)
+    # The file is written in a different row order than the jobs table it is aligned to
+    shuffled = jobs.iloc[::-1].reset_index(drop=True)
+    bitsets = SkillBitsets.load(path).align(shuffled['job_ID'])
+
+    result = calculate_career_recommendations(shuffled, *query, bitsets=bitsets)
+    assert result == calculate_career_recommendations_loop(shuffled, *query)
+
+
+def test_raw_titles_without_canonical_roles(jobs):
+    raw = jobs.drop(columns=['canonical_role'])
+    query = (['SQL'], 3, 'Any', 'Any', 'Current Level')
+    assert calculate_career_recommendations(raw, *query) == calculate_career_recommendations_loop(raw, *query)
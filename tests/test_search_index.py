@@ -0,0 +1,71 @@
+"""
+Search Index Tests
+Run with: python -m pytest tests
+"""
+
+import sys
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+import search_index
+
+TITLES = ['Data Engineer', 'Python Developer', 'Data Analyst', 'Software Engineer', 'Python Data Engineer']
+
+
+@pytest.fixture
+def conn(tmp_path):
+    n = 200
+    df = pd.DataFrame({
+        'job_ID': range(1, n + 1),
+        'job': [TITLES[i % len(TITLES)] for i in range(n)],
+        'job_details': ["Python and SQL" if i % 3 else "Experience with data pipelines" for i in range(n)],
+        'company_name': ['Acme', 'Globex'] * (n // 2),
+        'city': ['Pune', 'Delhi', 'Mumbai', 'Pune'] * (n // 4),
+        'work_type': ['Remote', 'On-site'] * (n // 2),
+        'job_category': None,
+        'experience_level': None,
+        'company_size_bucket': '51-200'
+    })
+    db_path = tmp_path / 'search_index.db'
+    search_index.build_index(db_path, df)
+    with closing(search_index.connect(db_path)) as conn:
+        yield conn
+
+
+@pytest.mark.parametrize('text, filters, title_only', [
+    ('python', None, False),
+    ('data eng', None, False),
+    ('engineer', {'city': 'Pune'}, False),
+    ('pyth', {'work_type': 'Remote'}, True),
+    ('', {'city': 'Delhi'}, False)
+])
+def test_bounded_ranking_is_exact_below_the_bound(conn, text, filters, title_only):
+    ranked = search_index.search(conn, text, filters, limit=50, title_only=title_only)
+    exact = search_index.search(conn, text, filters, limit=50, title_only=title_only, candidates=None)
+    pd.testing.assert_frame_equal(ranked, exact)
+
+
+def test_broad_query_ranks_the_first_candidates(conn):
+    assert search_index.count(conn, 'python') > 40
+    every_match = search_index.search(conn, 'python', limit=1000, candidates=None)
+    first_matches = set(every_match['job_ID'].nsmallest(40))
+
+    ranked = search_index.search(conn, 'python', limit=5, candidates=40)
+    assert len(ranked) == 5
+    assert set(ranked['job_ID']) <= first_matches
+    assert ranked['score'].is_monotonic_decreasing
+
+
+def test_candidates_cover_the_requested_page(conn):
+    page = search_index.search(conn, 'python', limit=10, offset=30, candidates=5)
+    assert len(page) == 10
+
+
+def test_count_with_and_without_filters(conn):
+    assert search_index.count(conn, 'engineer') == 120
+    assert search_index.count(conn, 'engineer', {'city': 'Pune'}) == 60
+    assert search_index.count(conn, '', {'city': 'Delhi'}) == 50
@@ -0,0 +1,75 @@
+"""
+Similarity Index Tests
+Run with: python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from similarity_index import SimilarityIndex
+from skill_bitset import SkillBitsets
+
+TEXTS = [
+    "Data engineer building Spark pipelines on AWS with Python",
+    "Data engineer building Spark pipelines on AWS with Python and Airflow",
+    "Java developer for Spring microservices and Kafka",
+    "Senior Java developer, Spring Boot microservices",
+    "Data analyst reporting in Excel and Tableau dashboards",
+    "Analyst for Tableau dashboards and Excel reporting",
+    "Nurse for hospital night shifts",
+    "Sales executive for retail accounts"
+] * 5
+
+SKILLS = [['Python', 'Spark', 'AWS'], ['Python', 'Spark', 'AWS', 'Airflow'], ['Java', 'Spring', 'Kafka'],
+          ['Java', 'Spring'], ['Excel', 'Tableau'], ['Excel', 'Tableau'], [], []] * 5
+
+
+@pytest.fixture(scope='module')
+def index():
+    skills = SkillBitsets.from_lists(SKILLS, job_ids=np.arange(100, 100 + len(TEXTS)))
+    return SimilarityIndex.build(TEXTS, skills, min_df=1, max_df=1.0, lsh_bits=256)
+
+
+def test_candidates_share_a_band_bucket(index):
+    bands = index.signatures.view(np.uint8)
+    for row in range(len(index)):
+        expected = np.flatnonzero((bands == bands[row]).any(axis=1))
+        assert index.lsh_candidates(row, len(index)).tolist() == expected.tolist()
+
+
+def test_candidates_keep_the_nearest_signatures(index):
+    row = 3
+    candidates = index.lsh_candidates(row, 5)
+    assert len(candidates) == 5
+    assert row in candidates
+    distances = np.unpackbits((index.signatures ^ index.signatures[row]).view(np.uint8), axis=1).sum(axis=1)
+    shared = index.lsh_candidates(row, len(index))
+    assert distances[candidates].max() <= np.sort(distances[shared])[4]
+
+
+def test_approximate_finds_duplicates(index):
+    exact = index.similar(100, k=4)
+    approximate = index.similar(100, k=4, approximate=True, n_candidates=10)
+    assert set(approximate['job_ID']) == set(exact['job_ID'])
+    assert 100 not in set(approximate['job_ID'])
+
+
+def test_buckets_survive_save_and_load(index, tmp_path):
+    path = tmp_path / 'similarity_index.npz'
+    index.save(path)
+    loaded = SimilarityIndex.load(path)
+    for original, restored in zip(index.buckets, loaded.buckets):
+        assert np.array_equal(original, restored)
+    assert loaded.similar(102, k=3, approximate=True, n_candidates=10).equals(
+        index.similar(102, k=3, approximate=True, n_candidates=10))
+
+
+def test_no_signatures_means_exact_search():
+    skills = SkillBitsets.from_lists(SKILLS[:8])
+    index = SimilarityIndex.build(TEXTS[:8], skills, min_df=1, max_df=1.0)
+    assert index.buckets is None
+    assert index.similar(0, k=3, approximate=True).equals(index.similar(0, k=3))
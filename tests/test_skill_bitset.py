@@ -0,0 +1,128 @@
+"""
+Skill Bitset Tests
+Run with: python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from skill_bitset import SkillBitsets, cardinality, dense, n_words, pack_ids, popcount, transpose
+
+VOCAB = ['AWS', 'Java', 'Python', 'SQL', 'Spark']
+
+SKILLS = [['Python', 'SQL'], ['Java'], [], ['SQL', 'Spark', 'AWS', 'Python'], ['Python', 'Cobol']]
+
+
+@pytest.mark.parametrize('n_skills, words', [(0, 1), (1, 1), (64, 1), (65, 2), (128, 2), (129, 3)])
+def test_n_words(n_skills, words):
+    assert n_words(n_skills) == words
+
+
+WORDS = np.array([0, 1, 2 ** 63, 2 ** 64 - 1, 0x0F0F, 0xAAAAAAAAAAAAAAAA], dtype=np.uint64)
+
+
+def test_popcount():
+    expected = [bin(int(word)).count('1') for word in WORDS]
+    assert popcount(WORDS).tolist() == expected
+
+
+def test_popcount_without_bitwise_count(monkeypatch):
+    """The byte lookup table used on NumPy < 2.0 counts the same bits"""
+    expected = popcount(WORDS).tolist()
+    monkeypatch.delattr(np, 'bitwise_count', raising=False)
+    assert popcount(WORDS).tolist() == expected
+    assert popcount(WORDS.reshape(2, 3)).tolist() == [expected[:3], expected[3:]]
+
+
+@pytest.mark.parametrize('n_skills', [5, 64, 130])
+def test_pack_ids_round_trips_through_dense(n_skills):
+    id_lists = [[0, n_skills - 1], [], [n_skills // 2], list(range(n_skills))]
+    bits = pack_ids(id_lists, n_skills)
+    assert bits.shape == (4, n_words(n_skills))
+    assert cardinality(bits).tolist() == [len(set(ids)) for ids in id_lists]
+    unpacked = dense(bits, n_skills)
+    assert [np.flatnonzero(row).tolist() for row in unpacked] == [sorted(set(ids)) for ids in id_lists]
+
+
+def test_transpose_gives_the_jobs_of_each_skill():
+    n_jobs = 70  # More jobs than one word holds
+    id_lists = [[job % 3] for job in range(n_jobs)]
+    by_skill = transpose(pack_ids(id_lists, 3), [2, 0])
+    assert by_skill.shape == (2, n_words(n_jobs))
+    jobs = dense(by_skill, n_jobs)
+    assert np.flatnonzero(jobs[0]).tolist() == list(range(2, n_jobs, 3))
+    assert np.flatnonzero(jobs[1]).tolist() == list(range(0, n_jobs, 3))
+
+
+def test_from_lists_drops_skills_outside_the_vocabulary():
+    bitsets = SkillBitsets.from_lists(SKILLS, vocab=VOCAB)
+    assert bitsets.to_lists() == [sorted(skills) for skills in SKILLS[:4]] + [['Python']]
+    assert bitsets.sizes().tolist() == [2, 1, 0, 4, 1]
+    assert bitsets.skill_counts().tolist() == [1, 1, 3, 2, 1]
+
+
+def test_default_vocabulary_is_the_sorted_skills_seen():
+    assert list(SkillBitsets.from_lists(SKILLS).vocab) == ['AWS', 'Cobol', 'Java', 'Python', 'SQL', 'Spark']
+
+
+def test_set_sizes_against_a_mask():
+    bitsets = SkillBitsets.from_lists(SKILLS, vocab=VOCAB)
+    mask = bitsets.mask(['Python', 'SQL', 'Excel'])
+    assert bitsets.intersection_sizes(mask).tolist() == [len(set(s) & {'Python', 'SQL'}) for s in SKILLS]
+    assert bitsets.difference_sizes(mask).tolist() == [0, 1, 0, 2, 0]
+
+
+def test_align_reorders_rows_to_job_ids():
+    bitsets = SkillBitsets.from_lists(SKILLS, vocab=VOCAB, job_ids=[10, 11, 12, 13, 14])
+    aligned = bitsets.align([13, 10, 11])
+    assert aligned.job_ids.tolist() == [13, 10, 11]
+    assert aligned.to_lists() == [bitsets.to_lists()[3], bitsets.to_lists()[0], bitsets.to_lists()[1]]
+    assert bitsets.align([10, 11, 12, 13, 14]) is bitsets
+
+
+@pytest.mark.parametrize('stored_ids, job_ids', [
+    ([10, 11, 12, 13, 14], [10, 99]),  # Job missing from the stored file
+    ([10, 10, 12, 13, 14], [12, 10])  # Duplicate stored IDs cannot be aligned
+])
+def test_align_returns_none_when_rows_cannot_be_matched(stored_ids, job_ids):
+    bitsets = SkillBitsets.from_lists(SKILLS, vocab=VOCAB, job_ids=stored_ids)
+    assert bitsets.align(job_ids) is None
+
+
+def test_take_by_mask():
+    bitsets = SkillBitsets.from_lists(SKILLS, vocab=VOCAB, job_ids=[10, 11, 12, 13, 14])
+    subset = bitsets.take(bitsets.sizes() > 1)
+    assert subset.job_ids.tolist() == [10, 13]
+    assert len(subset) == 2
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / 'skill_bitsets.npz'
+    bitsets = SkillBitsets.from_lists(SKILLS, vocab=VOCAB, job_ids=['a', 'b', 'c', 'd', 'e'])
+    bitsets.save(path)
+    loaded = SkillBitsets.load(path)
+    assert np.array_equal(loaded.bits, bitsets.bits)
+    assert list(loaded.vocab) == VOCAB
+    assert loaded.job_ids.tolist() == ['a', 'b', 'c', 'd', 'e']
+
+
+def test_load_aligned(tmp_path):
+    path = tmp_path / 'skill_bitsets.npz'
+    jobs = pd.DataFrame({'job_ID': [10, 11, 12, 13, 14], 'skills': SKILLS})
+
+    # Missing file: packed from the skills column
+    assert SkillBitsets.load_aligned(path, jobs).to_lists() == [sorted(skills) for skills in SKILLS]
+
+    # Saved with a smaller vocabulary than the skills column has: the file wins, in df's row order
+    SkillBitsets.from_lists(SKILLS, vocab=VOCAB, job_ids=jobs['job_ID']).save(path)
+    shuffled = jobs.iloc[[4, 0, 2]]
+    assert SkillBitsets.load_aligned(path, shuffled).to_lists() == [['Python'], ['Python', 'SQL'], []]
+
+    # Stale file (a job it does not have): packed again
+    stale = pd.DataFrame({'job_ID': [10, 99], 'skills': [['SQL'], ['Cobol']]})
+    assert SkillBitsets.load_aligned(path, stale).to_lists() == [['SQL'], ['Cobol']]
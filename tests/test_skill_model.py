@@ -0,0 +1,67 @@
+"""
+Skill Model Tests
+Run with: python -m pytest tests
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from config import SKILL_CATEGORIES
+from skill_model import SkillModel
+
+CATEGORIES = {
+    'Languages': ['Python', 'Java', 'JavaScript', 'C++', 'Node.js'],
+    'Cloud': ['Oracle', 'Oracle Cloud', 'AWS'],
+    'BI': ['Power BI', 'Tableau'],
+    'Analytics': ['Tableau', 'Excel']
+}
+
+TEXTS = [
+    "Python and Java developer, some JavaScript",
+    "Experience with Oracle Cloud and AWS",
+    "Tableau or PowerBI dashboards in Excel",
+    "NodeJS / node.js services written in C++",
+    "No listed skills here",
+    "Pythonic code, javas, awsome"  # Substrings of longer words do not match
+]
+
+
+def naive_match(model, text):
+    """Every alias searched for separately, as the per-skill scan did"""
+    text = text.lower()
+    return sorted({skill_id for alias, skill_id in model.alias_to_id.items()
+                   if re.search(r'\b' + re.escape(alias) + r'\b', text)})
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_match_finds_the_same_skills_as_a_per_alias_scan(text):
+    model = SkillModel(CATEGORIES)
+    assert model.match(text)[0] == naive_match(model, text)
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_match_with_the_shipped_vocabulary(text):
+    model = SkillModel(SKILL_CATEGORIES)
+    assert model.match(text)[0] == naive_match(model, text)
+
+
+def test_longer_alias_implies_the_shorter_one():
+    model = SkillModel(CATEGORIES)
+    ids, _ = model.match("Oracle Cloud administrator")
+    assert model.names(ids) == ['Oracle', 'Oracle Cloud']
+
+
+def test_skill_in_two_categories_has_one_id_and_both_bits():
+    model = SkillModel(CATEGORIES)
+    ids, mask = model.match("Tableau reports")
+    assert model.names(ids) == ['Tableau']
+    assert model.categories_for_mask(mask) == ['BI', 'Analytics']
+    assert model.category_counts([mask, 0]) == {'Languages': 0, 'Cloud': 0, 'BI': 1, 'Analytics': 1}
+
+
+def test_missing_text():
+    assert SkillModel(CATEGORIES).match(float('nan')) == ([], 0)
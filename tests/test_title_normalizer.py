@@ -0,0 +1,86 @@
+"""
+Title Normalizer Tests
+Run with: python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from title_normalizer import TitleNormalizer, build_title_mapping, cluster_keys
+
+LOCATIONS = ['Pune', 'Bengaluru']
+
+
+@pytest.mark.parametrize('title, key', [
+    ("Sr. Data Engineer - WFH", 'data engineer'),
+    ("Data Engineer (Pune)", 'data engineer'),
+    ("Lead Java Developer", 'java developer'),
+    ("Java Developer 5+ years of experience", 'java developer'),
+    ("Urgent Hiring for Java Developer", 'java developer'),
+    ("Full-time Data Analyst", 'data analyst'),
+    ("Dot Net Developer", '.net developer'),
+    ("Manager - Finance", 'finance manager'),
+    # Seniority stays when no role word would be left
+    ("Team Lead", 'team lead'),
+    # Words that change the role are not noise
+    ("Chief Executive Officer", 'chief executive officer'),
+    ("Full Stack Developer", 'full stack developer'),
+    ("Site Reliability Engineer", 'site reliability engineer'),
+    ("Back Office Executive", 'back office executive'),
+    ("C++ Developer", 'c++ developer'),
+    ("Remote", ''),
+    (None, '')
+])
+def test_normalize(title, key):
+    assert TitleNormalizer(LOCATIONS).normalize(title) == key
+
+
+@pytest.mark.parametrize('title, display', [
+    ("Sr. Head of Engineering (Remote)", 'Head of Engineering'),
+    ("Senior Data Engineer - WFH", 'Data Engineer'),
+    ("Urgent Hiring for Java Developer", 'Java Developer'),
+    ("Data Engineer– PySpark", 'Data Engineer PySpark'),
+    (".NET Developer", '.NET Developer'),
+    ("Team Lead", 'Team Lead')
+])
+def test_display_title(title, display):
+    assert TitleNormalizer(LOCATIONS).display_title(title) == display
+
+
+@pytest.mark.parametrize('a, b', [
+    ('java developer', 'java develper'),  # Typo
+    ('java developer', 'developer java')  # Reordered words
+])
+def test_cluster_keys_merges(a, b):
+    clusters = cluster_keys({a: 5, b: 1})
+    assert clusters[a] == clusters[b] == a
+
+
+@pytest.mark.parametrize('a, b', [
+    ('data analyst', 'data analytics'),
+    ('c developer', 'c++ developer'),
+    ('technical lead', 'technician lead'),
+    ('java developer', 'javascript developer')
+])
+def test_cluster_keys_keeps_distinct_roles(a, b):
+    clusters = cluster_keys({a: 5, b: 3})
+    assert clusters[a] != clusters[b]
+
+
+def test_mapping_names_roles_after_posted_titles():
+    titles = pd.Series(
+        ["Head of Engineering"] * 3 + ["Sr. Head of Engineering (Remote)"]
+        + ["Data Engineer"] * 2 + ["Senior Data Engineer - WFH", "Data Enginer"]
+        + ["Manager - Finance"] * 2
+    )
+    mapping = build_title_mapping(titles, LOCATIONS).set_index('job')['canonical_role']
+
+    assert mapping["Sr. Head of Engineering (Remote)"] == 'Head of Engineering'
+    assert mapping["Senior Data Engineer - WFH"] == 'Data Engineer'
+    assert mapping["Data Enginer"] == 'Data Engineer'
+    # 'Manager' alone would not name the role the cluster counts: the key is shown instead
+    assert mapping["Manager - Finance"] == 'Finance Manager'